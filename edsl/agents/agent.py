@@ -78,6 +78,8 @@ from ..utilities import (
     sync_wrapper,
     create_restricted_function,
     dict_hash,
+    cached_content_hash,
+    content_token,
     remove_edsl_version,
 )
 
@@ -1229,8 +1231,24 @@ class Agent(Base):
 
         >>> hash(Agent.example())
         2067581884874391607
+
+        The hash is computed once and reused until anything serialized by
+        to_dict changes.
         """
-        return dict_hash(self.to_dict(add_edsl_version=False))
+        token = content_token(
+            (
+                self._traits,
+                self.name,
+                self.set_instructions,
+                self.instruction,
+                self.set_traits_presentation_template,
+                self.traits_presentation_template,
+                self.codebook,
+            )
+        )
+        return cached_content_hash(
+            self, token, lambda: dict_hash(self.to_dict(add_edsl_version=False))
+        )
 
     def to_dict(self, add_edsl_version=True, full_dict=False) -> dict[str, Union[dict, bool]]:
         """Serialize to a dictionary with EDSL info.
@@ -14,10 +14,11 @@ from collections import UserList
 from collections.abc import Iterable
 from typing import Any, List, Optional, Union, TYPE_CHECKING
 
-from simpleeval import EvalWithCompoundTypes, NameNotDefined
+from simpleeval import NameNotDefined
 
 from ..base import Base
 from ..utilities import is_notebook, remove_edsl_version, dict_hash
+from ..utilities.compiled_expression import CompiledExpression
 from ..dataset.dataset_operations_mixin import AgentListOperationsMixin
 
 from .agent import Agent
@@ -231,14 +232,10 @@ class AgentList(UserList, Base, AgentListOperationsMixin):
             AgentList([Agent(traits = {'a': 1, 'b': 2})])
         """
 
-        def create_evaluator(agent: "Agent"):
-            """Create an evaluator for the given agent."""
-            return EvalWithCompoundTypes(names=agent.traits)
-
         try:
-            new_data = [
-                agent for agent in self.data if create_evaluator(agent).eval(expression)
-            ]
+            # Parse the expression once, then evaluate it against each agent's traits
+            predicate = CompiledExpression(expression)
+            new_data = [agent for agent in self.data if predicate(agent.traits)]
         except NameNotDefined:
             e = AgentListError(f"'{expression}' is not a valid expression.")
             if is_notebook():
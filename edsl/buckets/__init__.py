@@ -12,6 +12,8 @@ Key components:
   separate buckets for requests and tokens
 - BucketCollection: Manages multiple ModelBuckets instances across different
   language model services
+- AdaptiveRateController: Adjusts a ModelBuckets' rates to the rate limit
+  feedback (429s and rate limit headers) of the provider
 
 The module also includes a FastAPI server implementation (token_bucket_api) and
 client (token_bucket_client) for distributed rate limiting scenarios where
@@ -31,12 +33,15 @@ from .token_bucket_client import TokenBucketClient  # Add explicit import for To
 
 # Import BucketCollection last to avoid circular import issues
 from .bucket_collection import BucketCollection
+from .adaptive_rate import AdaptiveRateController, RateLimitSignal
 
 __all__ = [
     "BucketCollection", 
     "ModelBuckets", 
     "TokenBucket",
     "TokenBucketClient",
+    "AdaptiveRateController",
+    "RateLimitSignal",
     "BucketError",
     "TokenLimitError",
     "TokenBucketClientError",
@@ -0,0 +1,241 @@
+"""
+Adaptive rate limiting driven by the rate limit feedback of inference providers.
+
+The buckets of a service start at the configured requests and tokens per
+minute. Responses then steer them, AIMD-style (additive increase,
+multiplicative decrease):
+
+- a throttled response (HTTP 429, or 503/529 for an overloaded service)
+  halves the refill rate of both buckets and pauses them for as long as the
+  provider's ``retry-after`` asks, so waiting calls stop piling on
+- a healthy response adds a small step back, up to the configured rate
+- ``x-ratelimit-limit-*`` headers lower that ceiling when the account's actual
+  limit is below the configured one, and a nearly exhausted
+  ``x-ratelimit-remaining-*`` budget holds the rate where it is
+
+Service implementations report what they see with :func:`report_rate_limit`
+or :func:`report_rate_limit_error`. Reports go to the buckets of the task
+making the call, which QuestionTaskCreator sets with :func:`reporting_to`.
+Outside such a task, reports are ignored.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Mapping, NamedTuple, Optional
+
+from .token_bucket import TokenBucket
+
+if TYPE_CHECKING:
+    from .model_buckets import ModelBuckets
+
+THROTTLED_STATUS_CODES = (429, 503, 529)
+
+
+def _header_number(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+class RateLimitSignal(NamedTuple):
+    """What one response said about the provider's rate limits."""
+
+    throttled: bool
+    retry_after: Optional[float] = None
+    remaining_requests: Optional[float] = None
+    remaining_tokens: Optional[float] = None
+    limit_requests: Optional[float] = None
+    limit_tokens: Optional[float] = None
+
+    @classmethod
+    def from_response(
+        cls, headers: Optional[Mapping[str, str]] = None, status_code: Optional[int] = None
+    ) -> "RateLimitSignal":
+        """Read a signal from a response's status code and headers.
+
+        Both the OpenAI (``x-ratelimit-*``) and the Anthropic
+        (``anthropic-ratelimit-*``) header names are understood.
+
+        >>> s = RateLimitSignal.from_response({"Retry-After": "2", "x-ratelimit-limit-requests": "500"}, 429)
+        >>> s.throttled, s.retry_after, s.limit_requests
+        (True, 2.0, 500.0)
+        >>> RateLimitSignal.from_response({"retry-after-ms": "250"}, 200).retry_after
+        0.25
+        """
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        retry_after = _header_number(headers, "retry-after")
+        if retry_after is None:
+            retry_after_ms = _header_number(headers, "retry-after-ms")
+            if retry_after_ms is not None:
+                retry_after = retry_after_ms / 1000
+        return cls(
+            throttled=status_code in THROTTLED_STATUS_CODES,
+            retry_after=retry_after,
+            remaining_requests=_header_number(
+                headers,
+                "x-ratelimit-remaining-requests",
+                "anthropic-ratelimit-requests-remaining",
+            ),
+            remaining_tokens=_header_number(
+                headers,
+                "x-ratelimit-remaining-tokens",
+                "anthropic-ratelimit-tokens-remaining",
+            ),
+            limit_requests=_header_number(
+                headers,
+                "x-ratelimit-limit-requests",
+                "anthropic-ratelimit-requests-limit",
+            ),
+            limit_tokens=_header_number(
+                headers,
+                "x-ratelimit-limit-tokens",
+                "anthropic-ratelimit-tokens-limit",
+            ),
+        )
+
+
+class AdaptiveRateController:
+    """Adapts the refill rates of a ModelBuckets to the provider's feedback.
+
+    Both buckets run at the same fraction of their ceiling, which is the
+    configured rate or, if lower, the limit the provider reports.
+
+    >>> from edsl.buckets import ModelBuckets
+    >>> buckets = ModelBuckets(
+    ...     TokenBucket(bucket_name="s", bucket_type="requests", capacity=10, refill_rate=10),
+    ...     TokenBucket(bucket_name="s", bucket_type="tokens", capacity=1000, refill_rate=1000),
+    ... )
+    >>> controller = AdaptiveRateController(buckets)
+    >>> controller.record(RateLimitSignal(throttled=True, retry_after=0))
+    >>> buckets.requests_bucket.refill_rate, buckets.tokens_bucket.refill_rate
+    (5.0, 500.0)
+    >>> controller.record(RateLimitSignal(throttled=False))
+    >>> buckets.requests_bucket.refill_rate
+    5.5
+    """
+
+    DECREASE_FACTOR = 0.5
+    INCREASE_STEP = 0.05  # fraction of the ceiling regained per healthy response
+    MIN_FRACTION = 0.05
+    LOW_REMAINING_FRACTION = 0.05
+    DEFAULT_RETRY_AFTER = 1.0
+
+    def __init__(self, model_buckets: "ModelBuckets"):
+        self.model_buckets = model_buckets
+        self.fraction = 1.0
+        # Per minute limits reported by the provider, if any
+        self.limit_requests: Optional[float] = None
+        self.limit_tokens: Optional[float] = None
+        # Throttles that arrive while an earlier one's pause is still running
+        # come from requests sent before that pause, so they don't cut again
+        self._paused_until = 0.0
+
+    def _adaptable(self, bucket) -> bool:
+        # Remote buckets are shared with other processes and keep their own rate
+        return isinstance(bucket, TokenBucket) and bucket.base_refill_rate != float("inf")
+
+    def _ceiling(self, bucket: TokenBucket, limit_per_minute: Optional[float]) -> float:
+        if limit_per_minute is None:
+            return bucket.base_refill_rate
+        return min(bucket.base_refill_rate, limit_per_minute / 60.0)
+
+    def _apply(self) -> None:
+        for bucket, limit in (
+            (self.model_buckets.requests_bucket, self.limit_requests),
+            (self.model_buckets.tokens_bucket, self.limit_tokens),
+        ):
+            if self._adaptable(bucket):
+                bucket.set_refill_rate(self._ceiling(bucket, limit) * self.fraction)
+
+    def _nearly_exhausted(self, signal: RateLimitSignal) -> bool:
+        for remaining, limit in (
+            (signal.remaining_requests, signal.limit_requests or self.limit_requests),
+            (signal.remaining_tokens, signal.limit_tokens or self.limit_tokens),
+        ):
+            if remaining is not None and limit and remaining / limit < self.LOW_REMAINING_FRACTION:
+                return True
+        return False
+
+    def record(self, signal: RateLimitSignal) -> None:
+        """Adjust the buckets to one response's rate limit signal."""
+        if signal.limit_requests:
+            self.limit_requests = signal.limit_requests
+        if signal.limit_tokens:
+            self.limit_tokens = signal.limit_tokens
+
+        now = time.monotonic()
+        if signal.throttled:
+            pause = (
+                self.DEFAULT_RETRY_AFTER
+                if signal.retry_after is None
+                else signal.retry_after
+            )
+            if now >= self._paused_until:
+                self.fraction = max(
+                    self.MIN_FRACTION, self.fraction * self.DECREASE_FACTOR
+                )
+            self._paused_until = max(self._paused_until, now + pause)
+            self._apply()
+            for bucket in (
+                self.model_buckets.requests_bucket,
+                self.model_buckets.tokens_bucket,
+            ):
+                if self._adaptable(bucket):
+                    bucket.pause(pause)
+        elif not self._nearly_exhausted(signal):
+            self.fraction = min(1.0, self.fraction + self.INCREASE_STEP)
+            self._apply()
+        else:
+            self._apply()
+
+
+_reporting_buckets: ContextVar[Optional["ModelBuckets"]] = ContextVar(
+    "edsl_rate_limit_buckets", default=None
+)
+
+
+@contextmanager
+def reporting_to(model_buckets: "ModelBuckets"):
+    """Send the rate limit reports of calls made within the block to model_buckets."""
+    token = _reporting_buckets.set(model_buckets)
+    try:
+        yield
+    finally:
+        _reporting_buckets.reset(token)
+
+
+def report_rate_limit(
+    headers: Optional[Mapping[str, str]] = None, status_code: Optional[int] = None
+) -> None:
+    """Report a provider response's status code and headers to the current buckets."""
+    model_buckets = _reporting_buckets.get()
+    if model_buckets is not None:
+        model_buckets.record_rate_limit(
+            RateLimitSignal.from_response(headers, status_code)
+        )
+
+
+def report_rate_limit_error(error: BaseException) -> None:
+    """Report a failed provider call, if the error carries an HTTP response.
+
+    Errors of the OpenAI and Anthropic SDKs carry the status code and the
+    response with its headers; other errors are ignored.
+    """
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        return
+    response = getattr(error, "response", None)
+    report_rate_limit(getattr(response, "headers", None), status_code)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -2,12 +2,13 @@
 BucketCollection module for managing rate limits across multiple language models.
 
 This module provides the BucketCollection class, which manages rate limits for
-multiple language models, organizing them by service provider. It ensures that
-API rate limits are respected while allowing models from the same service to
-share the same rate limit buckets.
+multiple language models, organizing them by service provider. Each model gets
+its own buckets, nested under buckets shared by all models of its service, so
+that the service's API rate limits are respected while the state of one model
+(e.g. a provider asking it to slow down) doesn't hold back the others.
 """
 
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from collections import UserDict
 from threading import RLock
 import functools
@@ -33,14 +34,17 @@ class BucketCollection(UserDict):
     models, organizing them by service provider to ensure that API rate limits are
     respected across all models using the same service.
     
-    The class maps models to services, and services to buckets, allowing models from
-    the same service to share rate limit buckets. This approach ensures accurate
-    rate limiting when multiple models use the same underlying service.
+    The class maps models to services, and services to buckets. Every model has
+    its own ModelBuckets whose buckets draw from their service's buckets too, so
+    calls to all models of a service add up to the service's rate limits while
+    each model keeps its own bucket state. With a remote token bucket server,
+    models share their service's buckets.
     
     Attributes:
         infinity_buckets (bool): If True, all buckets have infinite capacity and refill rate
         models_to_services (dict): Maps model names to their service provider names
         services_to_buckets (dict): Maps service names to their ModelBuckets instances
+        models_to_buckets (dict): Maps model names to their own ModelBuckets instances
         remote_url (str, optional): URL for remote token bucket server if using distributed mode
         
     Example:
@@ -73,6 +77,7 @@ class BucketCollection(UserDict):
         self.infinity_buckets = infinity_buckets
         self.models_to_services = {}  # Maps model names to service names
         self.services_to_buckets = {} # Maps service names to ModelBuckets
+        self.models_to_buckets = {}  # Maps model names to ModelBuckets under their service's
         self._lock = RLock()
 
         # Check for remote token bucket server URL in environment
@@ -153,13 +158,52 @@ class BucketCollection(UserDict):
         """
         return f"BucketCollection({self.data})"
 
+    def _make_buckets(
+        self, bucket_name: str, rps: float, tps: float, parent: Optional[ModelBuckets] = None
+    ) -> ModelBuckets:
+        """Create the requests and tokens buckets of a service or, given the service's buckets, of a model."""
+        if parent is None:
+            return ModelBuckets(
+                TokenBucket(
+                    bucket_name=bucket_name,
+                    bucket_type="requests",
+                    capacity=rps,
+                    refill_rate=rps,
+                    remote_url=self.remote_url,
+                ),
+                TokenBucket(
+                    bucket_name=bucket_name,
+                    bucket_type="tokens",
+                    capacity=tps,
+                    refill_rate=tps,
+                    remote_url=self.remote_url,
+                ),
+            )
+        return ModelBuckets(
+            TokenBucket(
+                bucket_name=bucket_name,
+                bucket_type="requests",
+                capacity=rps,
+                refill_rate=rps,
+                parent=parent.requests_bucket,
+            ),
+            TokenBucket(
+                bucket_name=bucket_name,
+                bucket_type="tokens",
+                capacity=tps,
+                refill_rate=tps,
+                parent=parent.tokens_bucket,
+            ),
+        )
+
     def add_model(self, model: "LanguageModel") -> None:
         """
         Add a language model to the bucket collection.
         
         This method adds a language model to the BucketCollection, creating the
-        necessary token buckets for its service provider if they don't already exist.
-        Models from the same service share the same buckets.
+        necessary token buckets for its service provider if they don't already exist,
+        and the model's own buckets under them. Every call to the model takes
+        tokens from both, so models of the same service share the service's limits.
         
         Args:
             model: The LanguageModel instance to add to the collection
@@ -169,6 +213,12 @@ class BucketCollection(UserDict):
             >>> model = Model('gpt-4')
             >>> bucket_collection = BucketCollection()
             >>> bucket_collection.add_model(model)
+            >>> bucket_collection.add_model(Model('gpt-4o'))
+            >>> buckets = bucket_collection[model]
+            >>> buckets is bucket_collection[Model('gpt-4o')]
+            False
+            >>> buckets.requests_bucket.parent is bucket_collection.services_to_buckets['openai'].requests_bucket
+            True
         """
         # Calculate tokens-per-second (TPS) and requests-per-second (RPS) rates
         if not self.infinity_buckets:
@@ -184,35 +234,23 @@ class BucketCollection(UserDict):
             
             # If this is a new service we haven't created buckets for yet
             if service not in self.services_to_buckets:
-                # Create request rate limiting bucket
-                requests_bucket = TokenBucket(
-                    bucket_name=service,
-                    bucket_type="requests",
-                    capacity=RPS,
-                    refill_rate=RPS,
-                    remote_url=self.remote_url,
-                )
-                
-                # Create token rate limiting bucket
-                tokens_bucket = TokenBucket(
-                    bucket_name=service,
-                    bucket_type="tokens",
-                    capacity=TPS,
-                    refill_rate=TPS,
-                    remote_url=self.remote_url,
-                )
-                
-                # Store the buckets for this service
-                self.services_to_buckets[service] = ModelBuckets(
-                    requests_bucket, tokens_bucket
+                self.services_to_buckets[service] = self._make_buckets(service, RPS, TPS)
+            service_buckets = self.services_to_buckets[service]
+
+            # Remote buckets are shared with other processes at the service level
+            if self.remote_url is None:
+                model_buckets = self._make_buckets(
+                    model.model, RPS, TPS, parent=service_buckets
                 )
-                
+            else:
+                model_buckets = service_buckets
+
             # Map this model to its service and buckets
             self.models_to_services[model.model] = service
-            self[model] = self.services_to_buckets[service]
-        else:
-            # Model already exists, just retrieve its existing buckets
-            self[model] = self.services_to_buckets[self.models_to_services[model.model]]
+            self.models_to_buckets[model.model] = model_buckets
+
+        # Models that differ only in their parameters share the same buckets
+        self[model] = self.models_to_buckets[model.model]
 
     def update_from_key_lookup(self, key_lookup: "KeyLookup") -> None:
         """
@@ -238,32 +276,62 @@ class BucketCollection(UserDict):
         if self.infinity_buckets:
             return
             
-        # Update each service with new rate limits
-        for model_name, service in self.models_to_services.items():
+        # Update each service, and the models under it, with new rate limits
+        for service in self.services_to_buckets:
             if service in key_lookup:
                 # Update request rate limits if available
                 if key_lookup[service].rpm is not None:
                     new_rps = key_lookup[service].rpm / 60.0  # Convert to per-second
-                    new_requests_bucket = TokenBucket(
-                        bucket_name=service,
-                        bucket_type="requests",
-                        capacity=new_rps,
-                        refill_rate=new_rps,
-                        remote_url=self.remote_url,
-                    )
-                    self.services_to_buckets[service].requests_bucket = new_requests_bucket
+                    self._replace_buckets(service, "requests", new_rps)
 
                 # Update token rate limits if available
                 if key_lookup[service].tpm is not None:
                     new_tps = key_lookup[service].tpm / 60.0  # Convert to per-second
-                    new_tokens_bucket = TokenBucket(
-                        bucket_name=service,
-                        bucket_type="tokens",
-                        capacity=new_tps,
-                        refill_rate=new_tps,
-                        remote_url=self.remote_url,
-                    )
-                    self.services_to_buckets[service].tokens_bucket = new_tokens_bucket
+                    self._replace_buckets(service, "tokens", new_tps)
+
+    def _replace_buckets(self, service: str, bucket_type: str, rate: float) -> None:
+        """Give a service, and each of its models, a new bucket of bucket_type with the given rate."""
+        bucket_attr = f"{bucket_type}_bucket"
+        service_bucket = TokenBucket(
+            bucket_name=service,
+            bucket_type=bucket_type,
+            capacity=rate,
+            refill_rate=rate,
+            remote_url=self.remote_url,
+        )
+        setattr(self.services_to_buckets[service], bucket_attr, service_bucket)
+        if self.remote_url is not None:
+            return
+        for model_name, model_service in self.models_to_services.items():
+            if model_service == service:
+                model_bucket = TokenBucket(
+                    bucket_name=model_name,
+                    bucket_type=bucket_type,
+                    capacity=rate,
+                    refill_rate=rate,
+                    parent=service_bucket,
+                )
+                setattr(self.models_to_buckets[model_name], bucket_attr, model_bucket)
+
+    async def aclose(self) -> None:
+        """
+        Release the resources held by remote token buckets.
+        
+        Clients of a remote token bucket server keep an HTTP session per event
+        loop and may hold tokens leased from the server. This returns those
+        tokens, so other processes sharing the server can use them, and closes
+        the session of the running event loop. Local buckets hold neither.
+        
+        Example:
+            >>> import asyncio
+            >>> bucket_collection = BucketCollection()
+            >>> asyncio.run(bucket_collection.aclose())  # nothing to release locally
+        """
+        for service_buckets in self.services_to_buckets.values():
+            for bucket in (service_buckets.requests_bucket, service_buckets.tokens_bucket):
+                close = getattr(bucket, "close", None)
+                if close is not None:
+                    await close()
 
     def visualize(self) -> Dict["LanguageModel", Tuple["Figure", "Figure"]]:
         """
@@ -314,10 +382,11 @@ if __name__ == "__main__":
         >>> collection.add_model(gpt35)
         >>> collection.add_model(claude)
         >>> 
-        >>> # Models from the same service share rate limits
-        >>> print(collection[gpt4] is collection[gpt35])  # Both OpenAI
+        >>> # Models from the same service share the service's rate limits
+        >>> service = collection[gpt4].requests_bucket.parent
+        >>> print(collection[gpt35].requests_bucket.parent is service)  # Both OpenAI
         True
-        >>> print(collection[gpt4] is collection[claude])  # Different services
+        >>> print(collection[claude].requests_bucket.parent is service)  # Different services
         False
         >>> 
         >>> # Visualize rate limits
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Tuple
 
 if TYPE_CHECKING:
     from .token_bucket import TokenBucket
+    from .adaptive_rate import AdaptiveRateController, RateLimitSignal
 
 class ModelBuckets:
     """
@@ -52,6 +53,37 @@ class ModelBuckets:
         """
         self.requests_bucket = requests_bucket
         self.tokens_bucket = tokens_bucket
+        self._rate_controller = None
+
+    @property
+    def rate_controller(self) -> "AdaptiveRateController":
+        """The controller adapting both buckets to the provider's rate limit feedback."""
+        if self._rate_controller is None:
+            from .adaptive_rate import AdaptiveRateController
+
+            self._rate_controller = AdaptiveRateController(self)
+        return self._rate_controller
+
+    def record_rate_limit(self, signal: "RateLimitSignal") -> None:
+        """
+        Adapt the refill rates to the rate limit feedback of one API response.
+
+        Throttled responses slow both buckets down and pause them for the
+        provider's retry-after; healthy ones speed them back up to the
+        configured rates.
+
+        Example:
+            >>> from edsl.buckets.token_bucket import TokenBucket
+            >>> from edsl.buckets.adaptive_rate import RateLimitSignal
+            >>> buckets = ModelBuckets(
+            ...     TokenBucket(bucket_name="gpt-4", bucket_type="requests", capacity=10, refill_rate=10),
+            ...     TokenBucket(bucket_name="gpt-4", bucket_type="tokens", capacity=1000, refill_rate=1000),
+            ... )
+            >>> buckets.record_rate_limit(RateLimitSignal(throttled=True, retry_after=0))
+            >>> buckets.requests_bucket.refill_rate
+            5.0
+        """
+        self.rate_controller.record(signal)
 
     def __add__(self, other: "ModelBuckets") -> "ModelBuckets":
         """
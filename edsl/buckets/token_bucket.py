@@ -22,6 +22,7 @@ class TokenBucket:
     - Ability to track usage patterns
     - Visualization of token usage over time
     - Turbo mode for temporarily bypassing rate limits
+    - Nesting under a parent bucket, e.g. a model's bucket under its service's
     
     Typical use cases:
     - Respecting API rate limits (e.g., OpenAI, AWS, etc.)
@@ -50,6 +51,7 @@ class TokenBucket:
         capacity: Union[int, float],
         refill_rate: Union[int, float],
         remote_url: Optional[str] = None,
+        parent: Optional["TokenBucket"] = None,
     ):
         """Factory method to create either a local or remote token bucket.
 
@@ -62,6 +64,7 @@ class TokenBucket:
             capacity: Maximum number of tokens the bucket can hold
             refill_rate: Rate at which tokens are refilled (tokens per second)
             remote_url: If provided, creates a remote token bucket client
+            parent: Local buckets only; see __init__
 
         Returns:
             Either a TokenBucket instance (local) or a TokenBucketClient instance (remote)
@@ -103,6 +106,7 @@ class TokenBucket:
         capacity: Union[int, float],
         refill_rate: Union[int, float],
         remote_url: Optional[str] = None,
+        parent: Optional["TokenBucket"] = None,
     ):
         """Initialize a new token bucket instance.
         
@@ -114,6 +118,8 @@ class TokenBucket:
             capacity: Maximum number of tokens the bucket can hold
             refill_rate: Rate at which tokens are refilled (tokens per second)
             remote_url: If provided, initialization is skipped (handled by __new__)
+            parent: A bucket that must also grant every request of this one,
+                    e.g. the service-wide bucket above a model's bucket
             
         Note:
             - The bucket starts full (tokens = capacity)
@@ -133,6 +139,7 @@ class TokenBucket:
 
         self.bucket_name = bucket_name
         self.bucket_type = bucket_type
+        self.parent = parent
         self.capacity = capacity
         self.added_tokens = 0
         self._lock = RLock()
@@ -145,7 +152,9 @@ class TokenBucket:
         self.tokens = capacity  # Current number of available tokens
         self.refill_rate = refill_rate  # Rate at which tokens are refilled
         self._old_refill_rate = refill_rate
+        self.base_refill_rate = refill_rate  # The configured rate, kept when the rate adapts
         self.last_refill = time.monotonic()  # Last refill time
+        self._paused_until = 0.0  # No tokens are handed out before this time
         self.log: List[Any] = []
         self.turbo_mode = False
 
@@ -201,6 +210,51 @@ class TokenBucket:
         self.capacity = self._old_capacity
         self.refill_rate = self._old_refill_rate
 
+    def set_refill_rate(self, refill_rate: Union[int, float]) -> None:
+        """Change the rate at which tokens are refilled.
+
+        Tokens accrued at the old rate are credited first. In turbo mode the new
+        rate takes effect when turbo mode is turned off. The configured rate
+        stays available as base_refill_rate.
+
+        Example:
+            >>> bucket = TokenBucket(bucket_name="api", bucket_type="test", capacity=10, refill_rate=2)
+            >>> bucket.set_refill_rate(1)
+            >>> bucket.refill_rate, bucket.base_refill_rate
+            (1, 2)
+            >>> bucket.turbo_mode_on()
+            >>> bucket.turbo_mode_off()
+            >>> bucket.refill_rate
+            1
+        """
+        self.refill()
+        self._old_refill_rate = refill_rate
+        if not self.turbo_mode:
+            self.refill_rate = refill_rate
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the given number of seconds.
+
+        Tokens already in the bucket are dropped, tokens returned during the
+        pause are not credited, and refilling resumes once the pause is over,
+        e.g. after a provider asked to retry later.
+
+        Example:
+            >>> bucket = TokenBucket(bucket_name="api", bucket_type="test", capacity=10, refill_rate=10)
+            >>> bucket.pause(2)
+            >>> bucket.tokens
+            0
+            >>> 2.9 < bucket.wait_time(10) < 3.1  # 2s of pause, then 1s to refill
+            True
+            >>> bucket.add_tokens(10)
+            >>> bucket.tokens
+            0
+        """
+        self.refill()
+        self.tokens = min(self.tokens, 0)
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self.last_refill = max(self.last_refill, self._paused_until)
+
     def __add__(self, other) -> "TokenBucket":
         """Combine two token buckets to create a more restrictive bucket.
 
@@ -255,6 +309,8 @@ class TokenBucket:
             - The tokens will be capped at the bucket's capacity
             - This operation is logged for visualization purposes
             - The tokens_returned counter is incremented
+            - The tokens are returned to the parent bucket as well
+            - A paused bucket does not credit them to its own balance
             
         Example:
             >>> bucket = TokenBucket(bucket_name="test", bucket_type="test", capacity=10, refill_rate=1)
@@ -267,8 +323,11 @@ class TokenBucket:
             10
         """
         self.tokens_returned += tokens
-        self.tokens = min(self.capacity, self.tokens + tokens)
+        if time.monotonic() >= self._paused_until:
+            self.tokens = min(self.capacity, self.tokens + tokens)
         self.log.append((time.monotonic(), self.tokens))
+        if self.parent is not None:
+            self.parent.add_tokens(tokens)
 
     def refill(self) -> None:
         """Refill the bucket with new tokens based on elapsed time.
@@ -291,13 +350,11 @@ class TokenBucket:
             True
         """
         now = time.monotonic()
-        elapsed = now - self.last_refill
-        refill_amount = elapsed * self.refill_rate
-        self.tokens = min(self.capacity, self.tokens + refill_amount)
-        self.last_refill = now
-
-        if self.tokens < self.capacity:
-            pass
+        # last_refill lies in the future while the bucket is paused
+        if now > self.last_refill:
+            refill_amount = (now - self.last_refill) * self.refill_rate
+            self.tokens = min(self.capacity, self.tokens + refill_amount)
+            self.last_refill = now
 
         self.log.append((now, self.tokens))
 
@@ -311,7 +368,9 @@ class TokenBucket:
             The time in seconds to wait before the requested tokens will be available
             
         Note:
-            Returns 0 if the requested tokens are already available
+            Returns 0 if the requested tokens are already available and the
+            bucket is not paused; a pause adds the time left until it ends. With a parent bucket, this is
+            the longer of the two waits.
             
         Example:
             >>> bucket = TokenBucket(bucket_name="test", bucket_type="test", capacity=10, refill_rate=2)
@@ -323,9 +382,15 @@ class TokenBucket:
             >>> bucket.wait_time(5)  # No wait needed when we have enough tokens
             0
         """
-        if self.tokens >= requested_tokens:
-            return 0
-        return (requested_tokens - self.tokens) / self.refill_rate
+        wait = 0
+        paused = self._paused_until - time.monotonic()
+        if paused > 0:
+            wait = paused
+        if self.tokens < requested_tokens:
+            wait += (requested_tokens - self.tokens) / self.refill_rate
+        if self.parent is not None:
+            wait = max(wait, self.parent.wait_time(requested_tokens))
+        return wait
 
     async def get_tokens(
         self, amount: Union[int, float] = 1, cheat_bucket_capacity=True
@@ -349,6 +414,7 @@ class TokenBucket:
             - This method blocks asynchronously using asyncio.sleep() if tokens are not available
             - The bucket is refilled based on elapsed time before checking token availability
             - Usage statistics and token levels are logged for tracking purposes
+            - With a parent bucket, the tokens are taken from the parent too
             
         Example:
             >>> from edsl.buckets.token_bucket import TokenBucket
@@ -366,6 +432,13 @@ class TokenBucket:
             >>> bucket.capacity > 15  # Capacity should have been increased
             True
             
+            >>> # A model's bucket nested under its service's bucket
+            >>> service = TokenBucket(bucket_name="openai", bucket_type="test", capacity=10, refill_rate=1)
+            >>> model = TokenBucket(bucket_name="gpt-4o", bucket_type="test", capacity=5, refill_rate=1, parent=service)
+            >>> asyncio.run(model.get_tokens(2))
+            >>> model.tokens, service.tokens
+            (3, 8)
+
             >>> # Example raising TokenLimitError
             >>> from edsl.buckets.token_bucket import TokenBucket
             >>> from edsl.buckets.exceptions import TokenLimitError
@@ -388,7 +461,7 @@ class TokenBucket:
         # Loop until we have enough tokens
         while True:
             self.refill()  # Refill based on elapsed time
-            if self.tokens >= amount:
+            if self.tokens >= amount and time.monotonic() >= self._paused_until:
                 self.tokens -= amount
                 break
 
@@ -396,6 +469,15 @@ class TokenBucket:
             if wait_time > 0:
                 await asyncio.sleep(wait_time)
 
+        if self.parent is not None:
+            try:
+                await self.parent.get_tokens(amount, cheat_bucket_capacity)
+            except BaseException:
+                # Not handed out after all, e.g. the task was cancelled while
+                # waiting on the parent, so this bucket gets its tokens back
+                self.tokens = min(self.capacity, self.tokens + amount)
+                raise
+
         self.num_released += amount
         now = time.monotonic()
         self.log.append((now, self.tokens))
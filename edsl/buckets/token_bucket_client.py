@@ -5,11 +5,16 @@ This module provides a client implementation for interacting with a remote token
 bucket server. It implements the same interface as TokenBucket, but delegates
 operations to a remote server, enabling distributed rate limiting across
 multiple processes or machines.
+
+Requests to the server go through one long-lived HTTP session per event loop,
+so they reuse warm connections, and tokens can be leased from the server in
+blocks so that most calls to get_tokens need no round trip at all.
 """
 
-from typing import Union, Optional, Dict, Any
+from typing import Union, Optional, Dict, Any, Tuple
 import asyncio
 import time
+import weakref
 import aiohttp
 
 from .exceptions import BucketError, TokenBucketClientError
@@ -37,6 +42,8 @@ class TokenBucketClient:
         bucket_id (str): Unique identifier for this bucket on the server
         creation_time (float): Local timestamp when this client was created
         turbo_mode (bool): Flag indicating if turbo mode is active
+        lease_size (float): Number of tokens fetched from the server at once
+            and handed out locally (about one second of refill by default)
         
     Example:
         >>> # Create a client connected to a running token bucket server
@@ -58,6 +65,7 @@ class TokenBucketClient:
         capacity: Union[int, float],
         refill_rate: Union[int, float],
         api_base_url: str = "http://localhost:8000",
+        lease_size: Optional[Union[int, float]] = None,
     ):
         """
         Initialize a new TokenBucketClient connected to a remote token bucket server.
@@ -73,6 +81,10 @@ class TokenBucketClient:
             refill_rate: Rate at which tokens are added (tokens per second)
             api_base_url: Base URL for the token bucket server API
                          (default: "http://localhost:8000")
+            lease_size: Tokens to take from the server per round trip; the
+                         surplus serves later get_tokens calls locally. Defaults
+                         to one second of refill, capped at the capacity. Use 0
+                         to request exactly what each call asks for.
                          
         Raises:
             ValueError: If bucket creation on the server fails
@@ -92,14 +104,51 @@ class TokenBucketClient:
         self.api_base_url = api_base_url
         self.bucket_id = f"{bucket_name}_{bucket_type}"
 
+        # Tokens taken from the server but not yet handed out
+        self._leased = 0.0
+        # id(loop) -> (weak reference to the loop, session, lease lock); sessions
+        # and locks are bound to the event loop they were created in
+        self._loop_states: Dict[
+            int, Tuple[weakref.ref, aiohttp.ClientSession, asyncio.Lock]
+        ] = {}
+
         # Initialize the bucket on the server
-        asyncio.run(self._create_bucket())
+        asyncio.run(self._with_session(self._create_bucket))
+
+        if lease_size is None:
+            lease_size = min(self.capacity, self.refill_rate)
+        self.lease_size = lease_size
 
         # Cache some values locally
         self.creation_time = time.monotonic()
         self.turbo_mode = False
 
-    async def _create_bucket(self) -> None:
+    async def _with_session(self, method, *args):
+        """Run a request method with a session that is closed afterwards.
+
+        Used by the synchronous methods, which run in an event loop of their own.
+        """
+        async with aiohttp.ClientSession() as session:
+            return await method(*args, session=session)
+
+    def _loop_state(self) -> Tuple[weakref.ref, aiohttp.ClientSession, asyncio.Lock]:
+        """Return the long-lived session and lease lock of the running event loop."""
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.get(id(loop))
+        if state is None or state[0]() is not loop or state[1].closed:
+            for loop_id, (ref, _, _) in list(self._loop_states.items()):
+                if ref() is None or ref().is_closed():
+                    del self._loop_states[loop_id]
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=60)
+            )
+            state = self._loop_states[id(loop)] = (weakref.ref(loop), session, asyncio.Lock())
+        return state
+
+    def _session(self) -> aiohttp.ClientSession:
+        return self._loop_state()[1]
+
+    async def _create_bucket(self, session: aiohttp.ClientSession) -> None:
         """
         Create or retrieve the bucket on the remote server.
         
@@ -110,29 +159,28 @@ class TokenBucketClient:
         Raises:
             ValueError: If the server returns an error
         """
-        async with aiohttp.ClientSession() as session:
-            # Prepare payload with bucket parameters
-            payload = {
-                "bucket_name": self.bucket_name,
-                "bucket_type": self.bucket_type,
-                "capacity": self.capacity,
-                "refill_rate": self.refill_rate,
-            }
-            
-            # Send request to create/retrieve bucket
-            async with session.post(
-                f"{self.api_base_url}/bucket",
-                json=payload,
-            ) as response:
-                if response.status != 200:
-                    raise TokenBucketClientError(f"Unexpected error: {await response.text()}")
-
-                # Process server response
-                result = await response.json()
-                if result["status"] == "existing":
-                    # Update our local values to match the existing bucket
-                    self.capacity = float(result["bucket"]["capacity"])
-                    self.refill_rate = float(result["bucket"]["refill_rate"])
+        # Prepare payload with bucket parameters
+        payload = {
+            "bucket_name": self.bucket_name,
+            "bucket_type": self.bucket_type,
+            "capacity": self.capacity,
+            "refill_rate": self.refill_rate,
+        }
+
+        # Send request to create/retrieve bucket
+        async with session.post(
+            f"{self.api_base_url}/bucket",
+            json=payload,
+        ) as response:
+            if response.status != 200:
+                raise TokenBucketClientError(f"Unexpected error: {await response.text()}")
+
+            # Process server response
+            result = await response.json()
+            if result["status"] == "existing":
+                # Update our local values to match the existing bucket
+                self.capacity = float(result["bucket"]["capacity"])
+                self.refill_rate = float(result["bucket"]["refill_rate"])
 
     def turbo_mode_on(self) -> None:
         """
@@ -150,7 +198,7 @@ class TokenBucketClient:
             ...                           capacity=100, refill_rate=10)
             >>> client.turbo_mode_on()  # Now rate limits are bypassed
         """
-        asyncio.run(self._set_turbo_mode(True))
+        asyncio.run(self._with_session(self._set_turbo_mode, True))
         self.turbo_mode = True
 
     def turbo_mode_off(self) -> None:
@@ -170,7 +218,7 @@ class TokenBucketClient:
             >>> # Do some work without rate limiting
             >>> client.turbo_mode_off()  # Restore rate limits
         """
-        asyncio.run(self._set_turbo_mode(False))
+        asyncio.run(self._with_session(self._set_turbo_mode, False))
         self.turbo_mode = False
 
     async def add_tokens(self, amount: Union[int, float]) -> None:
@@ -194,15 +242,14 @@ class TokenBucketClient:
             >>> # Add 50 tokens to the bucket
             >>> asyncio.run(client.add_tokens(50))
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.api_base_url}/bucket/{self.bucket_id}/add_tokens",
-                params={"amount": amount},
-            ) as response:
-                if response.status != 200:
-                    raise TokenBucketClientError(f"Failed to add tokens: {await response.text()}")
+        async with self._session().post(
+            f"{self.api_base_url}/bucket/{self.bucket_id}/add_tokens",
+            params={"amount": amount},
+        ) as response:
+            if response.status != 200:
+                raise TokenBucketClientError(f"Failed to add tokens: {await response.text()}")
 
-    async def _set_turbo_mode(self, state: bool) -> None:
+    async def _set_turbo_mode(self, state: bool, session: aiohttp.ClientSession) -> None:
         """
         Set the turbo mode state on the server.
         
@@ -215,14 +262,13 @@ class TokenBucketClient:
         Raises:
             ValueError: If the server returns an error
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.api_base_url}/bucket/{self.bucket_id}/turbo_mode/{str(state).lower()}"
-            ) as response:
-                if response.status != 200:
-                    raise TokenBucketClientError(
-                        f"Failed to set turbo mode: {await response.text()}"
-                    )
+        async with session.post(
+            f"{self.api_base_url}/bucket/{self.bucket_id}/turbo_mode/{str(state).lower()}"
+        ) as response:
+            if response.status != 200:
+                raise TokenBucketClientError(
+                    f"Failed to set turbo mode: {await response.text()}"
+                )
 
     async def get_tokens(
         self, amount: Union[int, float] = 1, cheat_bucket_capacity: bool = True
@@ -231,8 +277,9 @@ class TokenBucketClient:
         Request tokens from the token bucket on the server.
         
         This async method requests tokens from the token bucket on the server.
-        It will either return immediately if tokens are available or raise an
-        exception if tokens are not available.
+        The server answers once the tokens are available. Requests no larger
+        than ``lease_size`` are served from tokens leased earlier; when those
+        run out, a full lease is taken from the server in a single round trip.
         
         Args:
             amount: Number of tokens to request (default: 1)
@@ -250,16 +297,51 @@ class TokenBucketClient:
             >>> # Request 20 tokens
             >>> asyncio.run(client.get_tokens(20))
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.api_base_url}/bucket/{self.bucket_id}/get_tokens",
-                params={
-                    "amount": amount,
-                    "cheat_bucket_capacity": int(cheat_bucket_capacity),
-                },
-            ) as response:
-                if response.status != 200:
-                    raise TokenBucketClientError(f"Failed to get tokens: {await response.text()}")
+        if amount > self.lease_size:
+            await self._request_tokens(amount, cheat_bucket_capacity)
+            return
+
+        # One lease at a time; callers waiting here are then served locally
+        async with self._loop_state()[2]:
+            if self._leased < amount:
+                lease = max(self.lease_size, amount - self._leased)
+                await self._request_tokens(lease, cheat_bucket_capacity)
+                self._leased += lease
+            self._leased -= amount
+
+    async def _request_tokens(
+        self, amount: Union[int, float], cheat_bucket_capacity: bool
+    ) -> None:
+        async with self._session().post(
+            f"{self.api_base_url}/bucket/{self.bucket_id}/get_tokens",
+            params={
+                "amount": amount,
+                "cheat_bucket_capacity": int(cheat_bucket_capacity),
+            },
+        ) as response:
+            if response.status != 200:
+                raise TokenBucketClientError(f"Failed to get tokens: {await response.text()}")
+
+    async def release_leased_tokens(self) -> None:
+        """
+        Return tokens leased from the server but not handed out.
+
+        Call this when the client will not ask for tokens for a while, so other
+        workers sharing the bucket can use them.
+        """
+        leased, self._leased = self._leased, 0.0
+        if leased > 0:
+            await self.add_tokens(leased)
+
+    async def close(self) -> None:
+        """
+        Return unused leased tokens and close the session of the running event loop.
+        """
+        await self.release_leased_tokens()
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.pop(id(loop), None)
+        if state is not None:
+            await state[1].close()
 
     def get_throughput(self, time_window: Optional[float] = None) -> float:
         """
@@ -284,7 +366,7 @@ class TokenBucketClient:
             >>> print(f"Average throughput: {throughput:.1f} tokens/minute")
         """
         # Get current bucket status from server
-        status = asyncio.run(self._get_status())
+        status = asyncio.run(self._with_session(self._get_status))
         now = time.monotonic()
 
         # Determine start time based on time_window parameter
@@ -305,7 +387,7 @@ class TokenBucketClient:
         # Convert to tokens per minute
         return (status["num_released"] / elapsed_time) * 60
 
-    async def _get_status(self) -> Dict[str, Any]:
+    async def _get_status(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
         """
         Get the current status of the bucket from the server.
         
@@ -319,15 +401,14 @@ class TokenBucketClient:
         Raises:
             ValueError: If the server returns an error
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_base_url}/bucket/{self.bucket_id}/status"
-            ) as response:
-                if response.status != 200:
-                    raise TokenBucketClientError(
-                        f"Failed to get bucket status: {await response.text()}"
-                    )
-                return await response.json()
+        async with session.get(
+            f"{self.api_base_url}/bucket/{self.bucket_id}/status"
+        ) as response:
+            if response.status != 200:
+                raise TokenBucketClientError(
+                    f"Failed to get bucket status: {await response.text()}"
+                )
+            return await response.json()
 
     def __add__(self, other: "TokenBucketClient") -> "TokenBucketClient":
         """
@@ -356,6 +437,7 @@ class TokenBucketClient:
             capacity=min(self.capacity, other.capacity),
             refill_rate=min(self.refill_rate, other.refill_rate),
             api_base_url=self.api_base_url,
+            lease_size=min(self.lease_size, other.lease_size),
         )
 
     @property
@@ -363,7 +445,8 @@ class TokenBucketClient:
         """
         Get the current number of tokens available in the bucket.
         
-        This property retrieves the current token count from the server.
+        This property retrieves the current token count from the server and
+        adds the tokens this client has leased but not yet handed out.
         
         Returns:
             Current number of tokens available in the bucket
@@ -374,8 +457,8 @@ class TokenBucketClient:
             >>> available = client.tokens
             >>> print(f"Available tokens: {available}")
         """
-        status = asyncio.run(self._get_status())
-        return float(status["tokens"])
+        status = asyncio.run(self._with_session(self._get_status))
+        return float(status["tokens"]) + self._leased
 
     def wait_time(self, requested_tokens: Union[float, int]) -> float:
         """
@@ -433,7 +516,7 @@ class TokenBucketClient:
             >>> # Now you can display or save the plot
         """
         # Get the bucket history from the server
-        status = asyncio.run(self._get_status())
+        status = asyncio.run(self._with_session(self._get_status))
         times, tokens = zip(*status["log"])
         
         # Normalize times to start at 0
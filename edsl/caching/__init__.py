@@ -11,6 +11,8 @@ Key components:
 - CacheEntry: Represents individual cached responses with metadata
 - CacheHandler: Manages cache initialization and migration
 - SQLiteDict: Dictionary-like interface to SQLite database
+- BatchedSQLiteDict: Faster SQLite store with batched, write-behind writes
+- LRUFrontCache: Memory-bounded tier of hot entries in front of a SQLite store
 """
 
 from .cache import Cache
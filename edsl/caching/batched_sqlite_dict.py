@@ -0,0 +1,469 @@
+"""
+High-throughput SQLite-backed dictionary for persistent storage of cache entries.
+
+This module provides BatchedSQLiteDict, an alternative to SQLiteDict for large jobs.
+It exposes the same dictionary-like interface (so Cache.fetch and Cache.store use it
+transparently) and reads and writes the same ``data`` table, so existing cache
+databases can be opened with either class. The differences are in how it talks
+to SQLite:
+
+- It uses a single raw ``sqlite3`` connection in WAL mode instead of SQLAlchemy
+  sessions, and a fixed set of SQL statements that sqlite3 keeps prepared.
+- Writes go to an in-memory write-behind buffer that is flushed in batched
+  ``executemany`` transactions.
+- ``get_many`` and ``contains_many`` look up many keys in a single query.
+"""
+
+from __future__ import annotations
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Generator, Iterable, Optional, Set, Union
+
+from ..config import CONFIG
+from .cache_entry import CacheEntry
+
+
+class BatchedSQLiteDict:
+    """
+    Dictionary-like SQLite storage of cache entries with batched, write-behind writes.
+
+    New entries are buffered in memory and written to the database once
+    ``batch_size`` entries have accumulated, when ``flush()`` is called, or when
+    the dictionary is closed. Buffered entries are visible to all reads, so the
+    buffering is invisible to callers; it only means that entries written since
+    the last flush are lost if the process dies without closing the dictionary.
+
+    Attributes:
+        db_path (str): Path to the SQLite database file
+        batch_size (int): Number of buffered entries that triggers a flush
+
+    Example:
+        >>> temp_db_path = BatchedSQLiteDict._get_temp_path()
+        >>> cache = BatchedSQLiteDict(temp_db_path)
+        >>> entry = CacheEntry.example()
+        >>> cache[entry.key] = entry
+        >>> cache[entry.key] == entry
+        True
+        >>> cache.close()
+        >>> BatchedSQLiteDict(temp_db_path)[entry.key] == entry
+        True
+        >>> import os; os.unlink(temp_db_path)  # Clean up temp file
+    """
+
+    # SQLite limits the number of bound parameters per statement
+    MAX_VARIABLES = 900
+
+    _CREATE_TABLE = (
+        "CREATE TABLE IF NOT EXISTS data (key VARCHAR NOT NULL PRIMARY KEY, value VARCHAR)"
+    )
+    _SELECT_ONE = "SELECT value FROM data WHERE key = ?"
+    _CONTAINS_ONE = "SELECT 1 FROM data WHERE key = ?"
+    _UPSERT = (
+        "INSERT INTO data (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+    )
+    _INSERT_IF_MISSING = "INSERT OR IGNORE INTO data (key, value) VALUES (?, ?)"
+    _DELETE_ONE = "DELETE FROM data WHERE key = ?"
+
+    def __init__(self, db_path: Optional[str] = None, batch_size: int = 500):
+        """
+        Initializes a BatchedSQLiteDict with the specified database path.
+
+        Args:
+            db_path: Path to the SQLite database file, with or without the
+                     ``sqlite:///`` prefix. If None, uses the path from
+                     CONFIG.get("EDSL_DATABASE_PATH")
+            batch_size: Number of buffered writes that triggers a flush
+
+        Raises:
+            CacheError: If the database cannot be opened
+
+        Example:
+            >>> BatchedSQLiteDict.example().batch_size
+            500
+        """
+        db_path = db_path or CONFIG.get("EDSL_DATABASE_PATH")
+        self.db_path = db_path.replace("sqlite:///", "", 1)
+        self.batch_size = batch_size
+        self._pending: Dict[str, CacheEntry] = {}
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the open connection, opening it (in WAL mode) if needed."""
+        if self._conn is None:
+            try:
+                conn = sqlite3.connect(
+                    self.db_path, check_same_thread=False, isolation_level=None
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(self._CREATE_TABLE)
+            except sqlite3.Error as e:
+                from .exceptions import CacheError
+
+                raise CacheError(
+                    f"Database initialization error: {e}. The attempted DB path was {self.db_path}"
+                ) from e
+            self._conn = conn
+        return self._conn
+
+    @classmethod
+    def _get_temp_path(cls) -> str:
+        """Creates a temporary file path for a SQLite database."""
+        import tempfile
+
+        _, temp_db_path = tempfile.mkstemp(suffix=".db")
+        return temp_db_path
+
+    @staticmethod
+    def _serialize(value: CacheEntry) -> str:
+        return json.dumps(value.to_dict())
+
+    @staticmethod
+    def _deserialize(value: str) -> CacheEntry:
+        return CacheEntry.from_dict(json.loads(value))
+
+    @staticmethod
+    def _check_value(value: Any) -> None:
+        if not isinstance(value, CacheEntry):
+            from .exceptions import CacheValueError
+
+            raise CacheValueError(
+                f"Value must be a CacheEntry object (got {type(value)})."
+            )
+
+    def _write_many(self, rows: Iterable[tuple[str, str]], overwrite: bool = True) -> None:
+        """Write (key, serialized value) rows in a single transaction."""
+        statement = self._UPSERT if overwrite else self._INSERT_IF_MISSING
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(statement, rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def flush(self) -> None:
+        """
+        Writes all buffered entries to the database in one transaction.
+
+        Example:
+            >>> d = BatchedSQLiteDict.example()
+            >>> d["foo"] = CacheEntry.example()
+            >>> len(d._pending)
+            1
+            >>> d.flush()
+            >>> len(d._pending)
+            0
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            pending = self._pending
+            self._write_many(
+                (key, self._serialize(value)) for key, value in pending.items()
+            )
+            self._pending = {}
+
+    def __setitem__(self, key: str, value: CacheEntry) -> None:
+        """
+        Buffers a CacheEntry for writing, flushing once the buffer is full.
+
+        Example:
+            >>> d = BatchedSQLiteDict.example()
+            >>> d["foo"] = CacheEntry.example()
+            >>> d["foo"] == CacheEntry.example()
+            True
+        """
+        self._check_value(value)
+        with self._lock:
+            self._pending[key] = value
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def __getitem__(self, key: str) -> CacheEntry:
+        """
+        Retrieves the CacheEntry stored at key.
+
+        Raises:
+            CacheKeyError: If the key is not found
+
+        Example:
+            >>> d = BatchedSQLiteDict.example()
+            >>> d.update({"foo": CacheEntry.example()})
+            >>> d["foo"] == CacheEntry.example()
+            True
+        """
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            row = self._connect().execute(self._SELECT_ONE, (key,)).fetchone()
+        if row is None:
+            from .exceptions import CacheKeyError
+
+            raise CacheKeyError(f"Key '{key}' not found.")
+        return self._deserialize(row[0])
+
+    def get(self, key: str, default: Optional[Any] = None) -> Union[CacheEntry, Any]:
+        """
+        Retrieves the value for key, or default if it is not present.
+
+        Example:
+            >>> BatchedSQLiteDict.example().get("foo", "bar")
+            'bar'
+        """
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            row = self._connect().execute(self._SELECT_ONE, (key,)).fetchone()
+        return default if row is None else self._deserialize(row[0])
+
+    def _chunks(self, keys: list[str]) -> Generator[list[str], None, None]:
+        for start in range(0, len(keys), self.MAX_VARIABLES):
+            yield keys[start : start + self.MAX_VARIABLES]
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """
+        Retrieves the entries for many keys at once; missing keys are omitted.
+
+        Example:
+            >>> d = BatchedSQLiteDict.example()
+            >>> d.update({"a": CacheEntry.example(), "b": CacheEntry.example()})
+            >>> sorted(d.get_many(["a", "b", "c"]))
+            ['a', 'b']
+        """
+        found: Dict[str, CacheEntry] = {}
+        to_query = []
+        with self._lock:
+            for key in keys:
+                if key in self._pending:
+                    found[key] = self._pending[key]
+                else:
+                    to_query.append(key)
+            conn = self._connect()
+            rows = []
+            for chunk in self._chunks(to_query):
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(
+                        f"SELECT key, value FROM data WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        for key, value in rows:
+            found[key] = self._deserialize(value)
+        return found
+
+    def contains_many(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Returns the subset of keys that are present, without deserializing values.
+
+        Example:
+            >>> d = BatchedSQLiteDict.example()
+            >>> d["a"] = CacheEntry.example()
+            >>> d.flush()
+            >>> d["b"] = CacheEntry.example()
+            >>> sorted(d.contains_many(["a", "b", "c"]))
+            ['a', 'b']
+        """
+        present: Set[str] = set()
+        to_query = []
+        with self._lock:
+            for key in keys:
+                if key in self._pending:
+                    present.add(key)
+                else:
+                    to_query.append(key)
+            conn = self._connect()
+            for chunk in self._chunks(to_query):
+                placeholders = ",".join("?" * len(chunk))
+                present.update(
+                    row[0]
+                    for row in conn.execute(
+                        f"SELECT key FROM data WHERE key IN ({placeholders})", chunk
+                    )
+                )
+        return present
+
+    def __bool__(self) -> bool:
+        """Always True, so patterns like `cache = cache or BatchedSQLiteDict()` work."""
+        return True
+
+    def update(
+        self,
+        new_d: Union[Dict[str, CacheEntry], "BatchedSQLiteDict"],
+        overwrite: bool = False,
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Adds entries from another mapping in batched transactions.
+
+        Args:
+            new_d: Mapping of keys to CacheEntry objects
+            overwrite: If True, overwrites existing entries; if False, keeps
+                       existing entries unchanged (default: False)
+            max_batch_size: Entries per transaction (default: batch_size)
+
+        Example:
+            >>> d = BatchedSQLiteDict.example()
+            >>> d.update({"foo": CacheEntry.example()})
+            >>> d["foo"] == CacheEntry.example()
+            True
+        """
+        from .sql_dict import SQLiteDict
+
+        if not isinstance(new_d, (dict, SQLiteDict, BatchedSQLiteDict)):
+            from .exceptions import CacheValueError
+
+            raise CacheValueError(
+                f"new_d must be a dict, SQLiteDict or BatchedSQLiteDict object (got {type(new_d)})"
+            )
+        max_batch_size = max_batch_size or self.batch_size
+        with self._lock:
+            # Make sure buffered entries are on disk so the conflict handling applies to them
+            self.flush()
+            batch = []
+            for key, value in new_d.items():
+                self._check_value(value)
+                batch.append((key, self._serialize(value)))
+                if len(batch) >= max_batch_size:
+                    self._write_many(batch, overwrite=overwrite)
+                    batch = []
+            if batch:
+                self._write_many(batch, overwrite=overwrite)
+
+    def _scan(self, columns: str) -> list[tuple]:
+        with self._lock:
+            self.flush()
+            return self._connect().execute(
+                f"SELECT {columns} FROM data ORDER BY rowid"
+            ).fetchall()
+
+    def values(self) -> Generator[CacheEntry, None, None]:
+        """
+        Returns a generator that yields the values in the cache.
+
+        >>> d = BatchedSQLiteDict.example()
+        >>> d["foo"] = CacheEntry.example()
+        >>> list(d.values()) == [CacheEntry.example()]
+        True
+        """
+        for (value,) in self._scan("value"):
+            yield self._deserialize(value)
+
+    def items(self) -> Generator[tuple[str, CacheEntry], None, None]:
+        """
+        Returns a generator that yields the items in the cache.
+
+        >>> d = BatchedSQLiteDict.example()
+        >>> d["foo"] = CacheEntry.example()
+        >>> list(d.items()) == [("foo", CacheEntry.example())]
+        True
+        """
+        for key, value in self._scan("key, value"):
+            yield key, self._deserialize(value)
+
+    def to_dict(self) -> Dict[str, CacheEntry]:
+        """Returns the cache as a dictionary."""
+        return dict(self.items())
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes the value for a given key.
+
+        >>> d = BatchedSQLiteDict.example()
+        >>> d["foo"] = CacheEntry.example()
+        >>> del d["foo"]
+        >>> d.get("foo", "missing")
+        'missing'
+        """
+        with self._lock:
+            buffered = self._pending.pop(key, None) is not None
+            deleted = self._connect().execute(self._DELETE_ONE, (key,)).rowcount
+        if not buffered and not deleted:
+            from .exceptions import CacheKeyError
+
+            raise CacheKeyError(f"Key '{key}' not found.")
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks if the dict contains the given key.
+
+        >>> d = BatchedSQLiteDict.example()
+        >>> d["foo"] = CacheEntry.example()
+        >>> "foo" in d, "bar" in d
+        (True, False)
+        """
+        with self._lock:
+            if key in self._pending:
+                return True
+            return self._connect().execute(self._CONTAINS_ONE, (key,)).fetchone() is not None
+
+    def __iter__(self) -> Generator[str, None, None]:
+        """Returns a generator that yields the keys in the dict."""
+        for (key,) in self._scan("key"):
+            yield key
+
+    def keys(self) -> Generator[str, None, None]:
+        """Returns a generator that yields the keys in the cache."""
+        return self.__iter__()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the cache.
+
+        >>> d = BatchedSQLiteDict.example()
+        >>> d["foo"] = CacheEntry.example()
+        >>> len(d)
+        1
+        """
+        with self._lock:
+            self.flush()
+            return self._connect().execute("SELECT COUNT(*) FROM data").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(db_path={self.db_path!r})"
+
+    def close(self) -> None:
+        """Flushes buffered entries and closes the connection.
+
+        The connection is reopened transparently if the dictionary is used again.
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            self.flush()
+            if self.db_path == ":memory:":
+                # Closing would discard the database
+                return
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self):
+        """Flush and close when garbage collected."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @classmethod
+    def example(cls) -> BatchedSQLiteDict:
+        """
+        Creates an in-memory BatchedSQLiteDict for examples and testing.
+
+        Example:
+            >>> BatchedSQLiteDict.example()
+            BatchedSQLiteDict(db_path=':memory:')
+        """
+        return cls(db_path=":memory:")
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
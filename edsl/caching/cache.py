@@ -85,6 +85,8 @@ class Cache(Base):
         immediate_write: bool = True,
         method=None,
         verbose=False,
+        lru_max_entries: Optional[int] = None,
+        lru_max_bytes: Optional[int] = None,
     ):
         """Initialize a new Cache instance.
 
@@ -101,6 +103,11 @@ class Cache(Base):
                             If False, they're kept separate until explicitly written.
             method: Deprecated. Legacy parameter for backward compatibility.
             verbose: If True, prints diagnostic information about cache hits and misses.
+            lru_max_entries: If set and the data is a persistent store (e.g. SQLiteDict),
+                            keep up to this many recently used entries in memory in front
+                            of it (see LRUFrontCache).
+            lru_max_bytes: Like lru_max_entries, but bounds the approximate size in bytes
+                          of the in-memory tier. Both bounds can be combined.
 
         Raises:
             CacheError: If both filename and data are provided, or if the filename has an
@@ -146,8 +153,34 @@ class Cache(Base):
             else:
                 raise CacheError("Invalid file extension. Must be .jsonl or .db")
 
+        if (lru_max_entries is not None or lru_max_bytes is not None) and not isinstance(
+            self.data, dict
+        ):
+            from .lru_front_cache import LRUFrontCache
+
+            self.data = LRUFrontCache(
+                self.data, max_entries=lru_max_entries, max_bytes=lru_max_bytes
+            )
+
         self._perform_checks()
 
+    @property
+    def lru_stats(self) -> Optional[dict]:
+        """Hit, miss and eviction counters of the in-memory LRU tier, if there is one.
+
+        >>> from edsl.caching.sql_dict import SQLiteDict
+        >>> c = Cache(data=SQLiteDict.example(), lru_max_entries=100)
+        >>> c.lru_stats
+        {'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 0, 'bytes': 0}
+        >>> Cache().lru_stats is None
+        True
+        """
+        from .lru_front_cache import LRUFrontCache
+
+        if isinstance(self.data, LRUFrontCache):
+            return self.data.stats()
+        return None
+
     def code(sefl):
         pass
         # raise NotImplementedError("This method is not implemented yet.")
@@ -204,7 +237,11 @@ class Cache(Base):
         """Perform checks on the cache."""
         from .cache_entry import CacheEntry
 
-        if any(not isinstance(value, CacheEntry) for value in self.data.values()):
+        # SQLite-backed stores only ever hold CacheEntry objects, and scanning them
+        # would deserialize the whole database
+        if isinstance(self.data, dict) and any(
+            not isinstance(value, CacheEntry) for value in self.data.values()
+        ):
             raise CacheError("Not all values are CacheEntry instances")
         if self.method is not None:
             warnings.warn("Argument `method` is deprecated", DeprecationWarning)
@@ -271,6 +308,41 @@ class Cache(Base):
                 print(f"Cache miss for key: {key}")
         return None if entry is None else entry.output, key
 
+    def contains(
+        self,
+        *,
+        model: str,
+        parameters: dict,
+        system_prompt: str,
+        user_prompt: str,
+        iteration: int,
+    ) -> bool:
+        """Check whether a response for this request is cached, without fetching it.
+
+        The key is the one fetch() would use. Unlike fetch(), a hit is not
+        recorded in fetched_data, so the check can be made ahead of the fetch.
+
+        Examples:
+            >>> c = Cache()
+            >>> request = dict(model="gpt-3", parameters={"temperature": 0.5}, system_prompt="Hello",
+            ...                user_prompt="Hi", iteration=1)
+            >>> c.contains(**request)
+            False
+            >>> _ = c.store(**request, response={"text": "Hey"}, service="openai")
+            >>> c.contains(**request)
+            True
+        """
+        from .cache_entry import CacheEntry
+
+        key = CacheEntry.gen_key(
+            model=model,
+            parameters=parameters,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            iteration=iteration,
+        )
+        return key in self.data
+
     def store(
         self,
         model: str,
@@ -401,11 +473,31 @@ class Cache(Base):
         self.add_from_dict(new_data=new_data, write_now=write_now)
 
     @classmethod
-    def from_sqlite_db(cls, db_path: str) -> Cache:
-        """Construct a Cache from a SQLite database."""
-        from .sql_dict import SQLiteDict
+    def from_sqlite_db(
+        cls,
+        db_path: str,
+        batched: bool = False,
+        lru_max_entries: Optional[int] = None,
+        lru_max_bytes: Optional[int] = None,
+    ) -> Cache:
+        """Construct a Cache from a SQLite database.
+
+        :param batched: Use BatchedSQLiteDict (WAL mode, write-behind batched
+            writes) instead of SQLiteDict. Recommended for large jobs.
+        :param lru_max_entries: Keep up to this many hot entries in memory.
+        :param lru_max_bytes: Bound the in-memory tier by approximate size instead.
+        """
+        if batched:
+            from .batched_sqlite_dict import BatchedSQLiteDict
+
+            data = BatchedSQLiteDict(db_path)
+        else:
+            from .sql_dict import SQLiteDict
 
-        return cls(data=SQLiteDict(db_path))
+            data = SQLiteDict(db_path)
+        return cls(
+            data=data, lru_max_entries=lru_max_entries, lru_max_bytes=lru_max_bytes
+        )
 
     @classmethod
     def from_local_cache(cls) -> Cache:
@@ -757,6 +849,9 @@ class Cache(Base):
             # Handle SQLiteDict or other database-backed storage
             if hasattr(self.data, "engine") and self.data.engine:
                 self.data.engine.dispose()
+            # Write out anything a write-behind store (BatchedSQLiteDict) is holding
+            if hasattr(self.data, "flush"):
+                self.data.flush()
 
     def __del__(self):
         """Destructor for proper resource cleanup.
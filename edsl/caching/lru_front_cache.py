@@ -0,0 +1,227 @@
+"""
+Memory-bounded LRU tier for persistent cache stores.
+
+This module provides LRUFrontCache, which wraps a persistent store such as
+SQLiteDict or BatchedSQLiteDict and keeps the most recently used CacheEntry
+objects in memory. Hits in the front tier skip the database query and JSON
+deserialization entirely, while the store remains the source of truth: every
+write goes through to it, so the front tier can be dropped at any time.
+
+The tier is bounded by a number of entries, an approximate number of bytes,
+or both; the least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Dict, Generator, Iterable, Optional, Union
+
+from .cache_entry import CacheEntry
+
+
+class LRUFrontCache:
+    """
+    Dictionary-like LRU tier of hot CacheEntry objects in front of a durable store.
+
+    Attributes:
+        store: The wrapped persistent store
+        max_entries (int, optional): Maximum number of entries held in memory
+        max_bytes (int, optional): Approximate maximum size of the entries held in memory
+        hits (int): Lookups served from memory
+        misses (int): Lookups that had to go to the store
+        evictions (int): Entries evicted to respect the bounds
+
+    Example:
+        >>> from edsl.caching.sql_dict import SQLiteDict
+        >>> d = LRUFrontCache(SQLiteDict.example(), max_entries=1)
+        >>> d["a"] = CacheEntry.example(randomize=True)
+        >>> d["b"] = CacheEntry.example(randomize=True)
+        >>> _ = d["a"], d["a"]
+        >>> d.stats()  # doctest: +ELLIPSIS
+        {'hits': 1, 'misses': 1, 'evictions': 2, 'entries': 1, 'bytes': ...}
+    """
+
+    def __init__(
+        self,
+        store: Any,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initializes an LRUFrontCache over a persistent store.
+
+        Args:
+            store: A dictionary-like store of CacheEntry objects (e.g. SQLiteDict)
+            max_entries: Maximum number of entries to keep in memory
+            max_bytes: Approximate maximum size in bytes of the entries kept in memory
+
+        Raises:
+            CacheValueError: If neither bound is given
+        """
+        if max_entries is None and max_bytes is None:
+            from .exceptions import CacheValueError
+
+            raise CacheValueError("Provide max_entries, max_bytes or both.")
+        self.store = store
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose store-specific attributes (engine, flush, close, ...) unchanged
+        if name == "store":
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+    @staticmethod
+    def _entry_size(entry: CacheEntry) -> int:
+        """Approximate in-memory size of an entry, dominated by its text fields."""
+        return (
+            len(entry.output)
+            + len(entry.user_prompt)
+            + len(entry.system_prompt)
+            + 200
+        )
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Put an entry at the most recently used end and evict to respect the bounds."""
+        self._forget(key)
+        size = self._entry_size(entry)
+        self._entries[key] = entry
+        self._sizes[key] = size
+        self._bytes += size
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._forget(oldest)
+            self.evictions += 1
+
+    def _forget(self, key: str) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self._bytes -= self._sizes.pop(key)
+
+    def get(self, key: str, default: Optional[Any] = None) -> Union[CacheEntry, Any]:
+        """
+        Retrieves the value for key from memory, falling back to the store.
+
+        Example:
+            >>> from edsl.caching.sql_dict import SQLiteDict
+            >>> LRUFrontCache(SQLiteDict.example(), max_entries=10).get("foo", "bar")
+            'bar'
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = self.store.get(key, None)
+        if entry is None:
+            return default
+        self._remember(key, entry)
+        return entry
+
+    def __getitem__(self, key: str) -> CacheEntry:
+        entry = self.get(key)
+        if entry is None:
+            from .exceptions import CacheKeyError
+
+            raise CacheKeyError(f"Key '{key}' not found.")
+        return entry
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Retrieves many entries, using a bulk store lookup for the misses if available."""
+        found: Dict[str, CacheEntry] = {}
+        missing = []
+        for key in keys:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found[key] = self._entries[key]
+            else:
+                self.misses += 1
+                missing.append(key)
+        if hasattr(self.store, "get_many"):
+            fetched = self.store.get_many(missing)
+        else:
+            fetched = {k: v for k in missing if (v := self.store.get(k)) is not None}
+        for key, entry in fetched.items():
+            self._remember(key, entry)
+        found.update(fetched)
+        return found
+
+    def __setitem__(self, key: str, value: CacheEntry) -> None:
+        """Writes through to the store and keeps the entry in memory."""
+        self.store[key] = value
+        self._remember(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._forget(key)
+        del self.store[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or key in self.store
+
+    def update(self, new_d: Union[Dict[str, CacheEntry], Any], *args, **kwargs) -> None:
+        """Updates the store; touched keys are dropped from memory to avoid stale copies."""
+        if isinstance(new_d, LRUFrontCache):
+            new_d = new_d.store
+        self.store.update(new_d, *args, **kwargs)
+        for key in list(new_d.keys()):
+            self._forget(key)
+
+    def keys(self) -> Generator[str, None, None]:
+        return iter(self.store.keys())
+
+    def values(self) -> Generator[CacheEntry, None, None]:
+        return iter(self.store.values())
+
+    def items(self) -> Generator[tuple[str, CacheEntry], None, None]:
+        return iter(self.store.items())
+
+    def __iter__(self) -> Generator[str, None, None]:
+        return iter(self.store)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def to_dict(self) -> Dict[str, CacheEntry]:
+        return dict(self.items())
+
+    def clear_memory(self) -> None:
+        """Drops all entries held in memory; the store is untouched."""
+        self._entries.clear()
+        self._sizes.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit, miss and eviction counters and the current memory footprint."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(store={self.store!r}, "
+            f"max_entries={self.max_entries!r}, max_bytes={self.max_bytes!r})"
+        )
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
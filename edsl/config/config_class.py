@@ -86,6 +86,10 @@ CONFIG_MAP = {
         "default": "500",
         "info": "This config var determines the maximum number of concurrent tasks that can be run by the async job-runner",
     },
+    "EDSL_TASK_HISTORY_MAX_RECORDS": {
+        "default": "1000",
+        "info": "This config var determines how many interviews of a job keep their full task status logs in the task history; further interviews are only counted, or kept without logs if they raised exceptions.",
+    },
     "EDSL_OPEN_EXCEPTION_REPORT_URL": {
         "default": "False",
         "info": "This config var determines whether to open the exception report URL in the browser",
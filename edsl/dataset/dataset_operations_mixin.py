@@ -12,7 +12,6 @@ ScenarioList, AgentList) to share the same data manipulation interface, enabling
 fluid operations across different parts of the EDSL ecosystem.
 """
 
-import io
 import warnings
 import textwrap
 from typing import Optional, Tuple, Union, List, TYPE_CHECKING  # Callable not used
@@ -461,24 +460,52 @@ class DataOperationsBase:
 
         return Dataset.from_pandas_dataframe(df)
 
+    def _columns(
+        self, remove_prefix: bool = False, lists_as_strings: bool = False
+    ) -> Tuple[List[str], List[list]]:
+        """Return the column names and the column value lists, without building rows.
+
+        Duplicate column names (e.g. after removing prefixes) get ``.1``, ``.2``
+        suffixes, as pandas does when reading a CSV file.
+
+        >>> from edsl.dataset import Dataset
+        >>> Dataset([{'a.x': [1, 2]}, {'b.x': [[1], None]}])._columns(remove_prefix=True, lists_as_strings=True)
+        (['x', 'x.1'], [[1, 2], ['[1]', None]])
+        """
+        header = []
+        columns = []
+        seen: dict = {}
+        for entry in self.data:
+            key, values = list(entry.items())[0]
+            if remove_prefix:
+                key = key.split(".")[-1]
+            if key in seen:
+                seen[key] += 1
+                key = f"{key}.{seen[key]}"
+            else:
+                seen[key] = 0
+            if lists_as_strings:
+                # anything that is not a plain scalar is written as its string form
+                values = [
+                    v if v is None or isinstance(v, (str, int, float, bool)) else str(v)
+                    for v in values
+                ]
+            header.append(key)
+            columns.append(values)
+        return header, columns
+
     def to_pandas(self, remove_prefix: bool = False, lists_as_strings=False):
         """Convert the results to a pandas DataFrame, ensuring that lists remain as lists.
 
+        The DataFrame is built directly from the column lists, so numbers, booleans
+        and nested values keep their types instead of going through a CSV round trip.
+
         Args:
             remove_prefix: Whether to remove the prefix from the column names.
             lists_as_strings: Whether to convert lists to strings.
 
         Returns:
             A pandas DataFrame.
-        """
-        # pandas is imported in _to_pandas_strings
-        return self._to_pandas_strings(remove_prefix)
-
-    def _to_pandas_strings(self, remove_prefix: bool = False):
-        """Convert the results to a pandas DataFrame.
-
-        Args:
-            remove_prefix: Whether to remove the prefix from the column names.
 
         Examples:
             >>> from edsl.results import Results
@@ -489,42 +516,44 @@ class DataOperationsBase:
             1              Great
             2           Terrible
             3                 OK
+            >>> from edsl.dataset import Dataset
+            >>> Dataset([{'a': [1, 2]}, {'b': [[1, 2], [3]]}]).to_pandas().dtypes.to_dict()
+            {'a': dtype('int64'), 'b': dtype('O')}
         """
         import pandas as pd
 
-        csv_string = self.to_csv(remove_prefix=remove_prefix).text
-        csv_buffer = io.StringIO(csv_string)
-        df = pd.read_csv(csv_buffer)
-        # df_sorted = df.sort_index(axis=1)  # Sort columns alphabetically
+        header, columns = self._columns(remove_prefix, lists_as_strings)
+        df = pd.DataFrame(
+            {i: pd.Series(values) for i, values in enumerate(columns)}
+        )
+        df.columns = header
         return df
 
     def to_polars(self, remove_prefix: bool = False, lists_as_strings=False):
         """Convert the results to a Polars DataFrame.
 
-        Args:
-            remove_prefix: Whether to remove the prefix from the column names.
-            lists_as_strings: Whether to convert lists to strings.
-
-        Returns:
-            A Polars DataFrame.
-        """
-        # polars is imported in _to_polars_strings
-        return self._to_polars_strings(remove_prefix)
-
-    def _to_polars_strings(self, remove_prefix: bool = False):
-        """Convert the results to a Polars DataFrame.
+        The DataFrame is built directly from the column lists. Columns whose
+        values polars cannot store in a single dtype are converted to strings.
 
         Args:
             remove_prefix: Whether to remove the prefix from the column names.
+            lists_as_strings: Whether to convert lists to strings.
 
         Returns:
             A Polars DataFrame.
         """
         import polars as pl
 
-        csv_string = self.to_csv(remove_prefix=remove_prefix).text
-        df = pl.read_csv(io.StringIO(csv_string))
-        return df
+        header, columns = self._columns(remove_prefix, lists_as_strings)
+        series = []
+        for name, values in zip(header, columns):
+            try:
+                series.append(pl.Series(name, values))
+            except (TypeError, ValueError, OverflowError, pl.exceptions.PolarsError):
+                series.append(
+                    pl.Series(name, [None if v is None else str(v) for v in values])
+                )
+        return pl.DataFrame(series)
 
     def tree(self, node_order: Optional[List[str]] = None):
         """Convert the results to a Tree.
@@ -12,9 +12,18 @@ class SQLiteList(MutableSequence, ABC):
     An abstract base class for a MutableSequence that stores its data in a temporary SQLite file.
     The file is removed when close() is called.
     Subclasses must implement serialize and deserialize methods.
+
+    Each row stores a sort position in the ``idx`` column. While the list is only
+    appended to, positions are exactly 0..n-1 and lookups by index go straight to
+    the index. Inserting or deleting in the middle does not renumber the following
+    rows: an insert takes a position between its neighbours and a delete leaves a
+    gap. The positions are renumbered lazily, in one batch, the next time an item
+    is accessed by index. The length is cached rather than counted on each call.
     """
 
     _TABLE_NAME = "list_data"  # Class constant instead of instance parameter
+    # SQLite limits the number of bound parameters per statement
+    _MAX_VARIABLES = 900
 
     @abstractmethod
     def serialize(self, value: Any) -> str:
@@ -36,12 +45,17 @@ class SQLiteList(MutableSequence, ABC):
         self.conn = sqlite3.connect(self.db_path)
         self._create_table_if_not_exists()
 
+        self._length = 0
+        self._max_pos = -1.0
+        # True while positions are exactly 0..n-1
+        self._dense = True
+
         # Initialize with data if provided
         if data is not None:
             self._batch_insert(data)
 
     def _create_table_if_not_exists(self):
-        query = f"CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} (idx INTEGER UNIQUE, value BLOB)"
+        query = f"CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} (idx REAL, value BLOB)"
         with self.conn:
             self.conn.execute(query)
             # Create an index for faster lookups
@@ -49,48 +63,81 @@ class SQLiteList(MutableSequence, ABC):
 
     def _batch_insert(self, data: Iterable) -> None:
         """
-        Insert items one at a time to minimize memory usage.
-        
+        Insert items in a single executemany transaction.
+
+        Items are serialized lazily, so only one serialized item is held at a time.
+
         Args:
             data: Iterable containing items to insert
         """
+        start = self._max_pos + 1
+        counter = {"n": 0}
+
+        def rows():
+            for i, item in enumerate(data):
+                counter["n"] = i + 1
+                yield (start + i, self.serialize(item))
+
         with self.conn:
-            # Use a single transaction for better performance
-            for idx, item in enumerate(data):
-                # Serialize and insert one item at a time to minimize memory usage
-                serialized = self.serialize(item)
-                self.conn.execute(
-                    f"INSERT INTO {self._TABLE_NAME} (idx, value) VALUES (?, ?)",
-                    (idx, serialized)
-                )
-                # Clear reference to allow garbage collection
-                del serialized
+            self.conn.executemany(
+                f"INSERT INTO {self._TABLE_NAME} (idx, value) VALUES (?, ?)", rows()
+            )
+        self._length += counter["n"]
+        self._max_pos = start + counter["n"] - 1
+
+    def _normalize_index(self, index: int, message: str) -> int:
+        if index < 0:
+            index = self._length + index
+        if not 0 <= index < self._length:
+            raise IndexError(message)
+        return index
+
+    def compact(self) -> None:
+        """Renumber positions to 0..n-1 in one batch, closing gaps left by inserts and deletes."""
+        if self._dense:
+            return
+        rowids = self.conn.execute(
+            f"SELECT rowid FROM {self._TABLE_NAME} ORDER BY idx, rowid"
+        ).fetchall()
+        with self.conn:
+            self.conn.executemany(
+                f"UPDATE {self._TABLE_NAME} SET idx = ? WHERE rowid = ?",
+                ((i, rowid) for i, (rowid,) in enumerate(rowids)),
+            )
+        self._length = len(rowids)
+        self._max_pos = float(len(rowids) - 1)
+        self._dense = True
+
+    def _position_of(self, index: int) -> float:
+        """Return the stored position of the item at a (valid) index."""
+        if self._dense:
+            return float(index)
+        (pos,) = self.conn.execute(
+            f"SELECT idx FROM {self._TABLE_NAME} ORDER BY idx, rowid LIMIT 1 OFFSET ?",
+            (index,),
+        ).fetchone()
+        return pos
 
     def __len__(self):
-        cursor = self.conn.execute(f"SELECT COUNT(*) FROM {self._TABLE_NAME}")
-        (count,) = cursor.fetchone()
-        return count
+        return self._length
 
     def __getitem__(self, index):
         if isinstance(index, slice):
             # Handle slice object
-            start, stop, step = index.indices(len(self))
+            start, stop, step = index.indices(self._length)
             if step == 1:  # Simple range
+                self.compact()
                 cursor = self.conn.execute(
                     f"SELECT value FROM {self._TABLE_NAME} WHERE idx >= ? AND idx < ? ORDER BY idx",
                     (start, stop)
                 )
                 return [self.deserialize(row[0]) for row in cursor]
             else:  # Need to handle step
-                indices = range(start, stop, step)
-                return [self[i] for i in indices]
-            
-        # Handle integer index
-        if index < 0:
-            index = len(self) + index
-        if not 0 <= index < len(self):
-            raise IndexError("list index out of range")
+                return self.get_many(range(start, stop, step))
 
+        # Handle integer index
+        index = self._normalize_index(index, "list index out of range")
+        self.compact()
         cursor = self.conn.execute(
             f"SELECT value FROM {self._TABLE_NAME} WHERE idx=?", (index,)
         )
@@ -99,11 +146,37 @@ class SQLiteList(MutableSequence, ABC):
             raise IndexError("list index out of range")
         return self.deserialize(row[0])
 
+    def get_many(self, indices: Iterable[int]) -> List[Any]:
+        """
+        Return the items at the given indices, in the order requested.
+
+        Looks rows up in batches instead of issuing one query per index.
+
+        Args:
+            indices: Indices to fetch; negative indices and repeats are allowed
+
+        Raises:
+            IndexError: If any index is out of range
+        """
+        indices = [
+            self._normalize_index(i, "list index out of range") for i in indices
+        ]
+        self.compact()
+        wanted = sorted(set(indices))
+        values = {}
+        for start in range(0, len(wanted), self._MAX_VARIABLES):
+            chunk = wanted[start : start + self._MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            for pos, value in self.conn.execute(
+                f"SELECT idx, value FROM {self._TABLE_NAME} WHERE idx IN ({placeholders})",
+                chunk,
+            ):
+                values[int(pos)] = self.deserialize(value)
+        return [values[i] for i in indices]
+
     def __setitem__(self, index, value):
-        if index < 0:
-            index = len(self) + index
-        if not 0 <= index < len(self):
-            raise IndexError("list assignment index out of range")
+        index = self._normalize_index(index, "list assignment index out of range")
+        self.compact()
 
         serialized = self.serialize(value)
         with self.conn:
@@ -113,74 +186,81 @@ class SQLiteList(MutableSequence, ABC):
             )
 
     def __delitem__(self, index):
-        if index < 0:
-            index = len(self) + index
-        if not 0 <= index < len(self):
-            raise IndexError("list assignment index out of range")
+        index = self._normalize_index(index, "list assignment index out of range")
+        is_last = index == self._length - 1
+        pos = self._position_of(index)
 
         with self.conn:
-            self.conn.execute(f"DELETE FROM {self._TABLE_NAME} WHERE idx=?", (index,))
             self.conn.execute(
-                f"UPDATE {self._TABLE_NAME} SET idx = idx - 1 WHERE idx > ?", (index,)
+                f"DELETE FROM {self._TABLE_NAME} WHERE rowid = "
+                f"(SELECT rowid FROM {self._TABLE_NAME} WHERE idx = ? ORDER BY rowid LIMIT 1)",
+                (pos,),
             )
+        self._length -= 1
+        if is_last:
+            if self._dense:
+                self._max_pos = float(self._length - 1)
+        else:
+            # Leave a gap instead of renumbering the tail
+            self._dense = False
+        if self._length == 0:
+            self._max_pos = -1.0
+            self._dense = True
 
     def insert(self, index, value):
         """
-        Inserts a value at the given index by shifting everything
-        at or after `index` up by one in descending order.
+        Inserts a value at the given index.
+
+        The new row gets a position between its neighbours, so no other row
+        is renumbered.
         """
-        length = len(self)
         if index < 0:
-            index = 0
-        if index > length:
-            index = length
+            index = max(self._length + index, 0)
+        if index >= self._length:
+            self.append(value)
+            return
+
+        after = self._position_of(index)
+        before = self._position_of(index - 1) if index > 0 else after - 1
+        pos = (before + after) / 2
+        if not before < pos < after:
+            # Out of floating point room between the neighbours
+            self.compact()
+            after = float(index)
+            pos = after - 0.5
 
         serialized = self.serialize(value)
         with self.conn:
-            # Shift every idx >= `index` up by 1, in descending order
-            for i in reversed(range(index, length)):
-                self.conn.execute(
-                    f"UPDATE {self._TABLE_NAME} SET idx = ? WHERE idx = ?",
-                    (i + 1, i),
-                )
-
-            # Now insert the new item
             self.conn.execute(
                 f"INSERT INTO {self._TABLE_NAME} (idx, value) VALUES (?, ?)",
-                (index, serialized),
+                (pos, serialized),
             )
+        self._length += 1
+        self._dense = False
 
     def append(self, value):
         """Append a value to the end of the list."""
-        index = len(self)
+        pos = self._max_pos + 1
         serialized = self.serialize(value)
         with self.conn:
             self.conn.execute(
                 f"INSERT INTO {self._TABLE_NAME} (idx, value) VALUES (?, ?)",
-                (index, serialized),
+                (pos, serialized),
             )
+        self._length += 1
+        self._max_pos = pos
 
     def extend(self, values: Iterable) -> None:
         """
         Extend the list by appending all items in the given iterable.
-        
-        Processes one item at a time to minimize memory usage.
-        
+
+        Uses a single executemany transaction and serializes one item at a time
+        to minimize memory usage.
+
         Args:
             values: Iterable of values to append
         """
-        start_idx = len(self)
-        with self.conn:
-            # Use a single transaction for efficiency
-            for i, item in enumerate(values):
-                # Serialize and insert one at a time to minimize memory usage
-                serialized = self.serialize(item)
-                self.conn.execute(
-                    f"INSERT INTO {self._TABLE_NAME} (idx, value) VALUES (?, ?)",
-                    (start_idx + i, serialized)
-                )
-                # Clear reference to allow garbage collection
-                del serialized
+        self._batch_insert(values)
 
     def close(self):
         """
@@ -328,6 +408,11 @@ class SQLiteList(MutableSequence, ABC):
                         f"INSERT INTO {self._TABLE_NAME} (idx, value) VALUES (?, ?)",
                         rows
                     )
+
+                # The source may have gaps in its positions; renumber once
+                self._length = len(rows)
+                self._dense = False
+                self.compact()
             finally:
                 source_cursor.close()
                 source_conn.close()
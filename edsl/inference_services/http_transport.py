@@ -0,0 +1,157 @@
+"""
+Shared HTTP connection pools for inference service clients.
+
+Provider SDKs (openai, anthropic, groq, ...) each open their own ``httpx``
+client unless one is passed in. A client built per request, or per SDK object,
+pays for a fresh TCP connection and TLS handshake on every call, and at high
+concurrency the churn alone adds seconds of latency.
+
+This module hands out one pooled ``httpx.AsyncClient`` per
+(service, base URL, API key), so every model of a service that talks to the
+same endpoint with the same key reuses the same warm connections. Pools are:
+
+- bounded: at most ``EDSL_MAX_CONCURRENT_TASKS`` connections, and no more than
+  a model's requests-per-minute limit can keep busy
+- kept alive between requests, for as long as a job typically pauses between calls
+- HTTP/2 when the optional ``h2`` package is installed
+- timed out with the same ``EDSL_API_TIMEOUT`` the model call itself uses
+
+Connections belong to the event loop that opened them, so pools are kept per
+running loop; a new ``asyncio.run`` gets fresh pools and those of closed
+loops are dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import weakref
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from ..config import CONFIG
+
+# Seconds a request is assumed to hold its connection, to turn an RPM limit
+# into the number of connections that limit can keep busy at once
+_SECONDS_PER_REQUEST = 30
+_MIN_CONNECTIONS = 10
+_KEEPALIVE_EXPIRY = 60.0
+_CONNECT_TIMEOUT = 10.0
+
+PoolKey = Tuple[str, Optional[str], Optional[str]]
+
+# id(loop) -> (weak reference to the loop, its pools); a dead reference marks
+# pools left over from a loop whose id has been reused
+_async_pools: Dict[int, Tuple[weakref.ref, Dict[PoolKey, httpx.AsyncClient]]] = {}
+_sync_pools: Dict[PoolKey, httpx.Client] = {}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def pool_limits(rpm: Optional[float] = None) -> httpx.Limits:
+    """Return connection limits for a pool serving at most ``rpm`` requests per minute.
+
+    >>> pool_limits(rpm=60).max_connections
+    30
+    >>> pool_limits(rpm=60).max_keepalive_connections
+    30
+    >>> pool_limits().max_connections == int(CONFIG.get("EDSL_MAX_CONCURRENT_TASKS"))
+    True
+    """
+    max_connections = int(CONFIG.get("EDSL_MAX_CONCURRENT_TASKS"))
+    if rpm is not None and rpm > 0:
+        busy = math.ceil(rpm / 60 * _SECONDS_PER_REQUEST)
+        max_connections = min(max_connections, max(_MIN_CONNECTIONS, busy))
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=_KEEPALIVE_EXPIRY,
+    )
+
+
+def request_timeout() -> httpx.Timeout:
+    """Return the timeout policy shared by every service client.
+
+    Reading a response may take as long as a model call is allowed to take
+    (``EDSL_API_TIMEOUT``); connecting must be quick.
+    """
+    timeout = float(CONFIG.get("EDSL_API_TIMEOUT"))
+    return httpx.Timeout(timeout, connect=min(_CONNECT_TIMEOUT, timeout))
+
+
+def _client_options(rpm: Optional[float]) -> dict:
+    return {
+        "limits": pool_limits(rpm),
+        "timeout": request_timeout(),
+        "http2": _http2_available(),
+        "follow_redirects": True,
+    }
+
+
+def async_http_client(
+    service: str,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    rpm: Optional[float] = None,
+) -> httpx.AsyncClient:
+    """Return the pooled async HTTP client for a service endpoint and key.
+
+    The pool is sized from ``rpm`` when it is first created for the running
+    event loop. Called outside a running loop, a client that is not shared is
+    returned.
+
+    >>> async def same_pool():
+    ...     a = async_http_client("openai", api_key="k")
+    ...     return a is async_http_client("openai", api_key="k"), a is async_http_client("openai", api_key="other")
+    >>> asyncio.run(same_pool())
+    (True, False)
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return httpx.AsyncClient(**_client_options(rpm))
+
+    entry = _async_pools.get(id(loop))
+    if entry is None or entry[0]() is not loop:
+        _drop_closed_loops()
+        entry = _async_pools[id(loop)] = (weakref.ref(loop), {})
+    pools = entry[1]
+    key = (service, base_url, api_key)
+    client = pools.get(key)
+    if client is None or client.is_closed:
+        client = pools[key] = httpx.AsyncClient(**_client_options(rpm))
+    return client
+
+
+def _drop_closed_loops() -> None:
+    for loop_id, (ref, _) in list(_async_pools.items()):
+        loop = ref()
+        if loop is None or loop.is_closed():
+            del _async_pools[loop_id]
+
+
+def sync_http_client(
+    service: str,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    rpm: Optional[float] = None,
+) -> httpx.Client:
+    """Return the pooled blocking HTTP client for a service endpoint and key."""
+    key = (service, base_url, api_key)
+    client = _sync_pools.get(key)
+    if client is None or client.is_closed:
+        client = _sync_pools[key] = httpx.Client(**_client_options(rpm))
+    return client
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
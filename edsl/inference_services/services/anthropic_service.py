@@ -2,6 +2,8 @@ import os
 from typing import Any, Optional, List, TYPE_CHECKING
 from anthropic import AsyncAnthropic
 
+from ...buckets.adaptive_rate import report_rate_limit, report_rate_limit_error
+from ..http_transport import async_http_client
 from ..inference_service_abc import InferenceServiceABC
 
 # Use TYPE_CHECKING to avoid circular imports at runtime
@@ -97,10 +99,15 @@ class AnthropicService(InferenceServiceABC):
                             }
                         )
                 # breakpoint()
-                client = AsyncAnthropic(api_key=self.api_token)
+                client = AsyncAnthropic(
+                    api_key=self.api_token,
+                    http_client=async_http_client(
+                        cls._inference_service_, None, self.api_token, rpm=self.rpm
+                    ),
+                )
 
                 try:
-                    response = await client.messages.create(
+                    raw_response = await client.messages.with_raw_response.create(
                         model=model_name,
                         max_tokens=self.max_tokens,
                         temperature=self.temperature,
@@ -108,8 +115,10 @@ class AnthropicService(InferenceServiceABC):
                         messages=messages,
                     )
                 except Exception as e:
+                    report_rate_limit_error(e)
                     return {"message": str(e)}
-                return response.model_dump()
+                report_rate_limit(raw_response.headers, raw_response.status_code)
+                return raw_response.parse().model_dump()
 
         LLM.__name__ = model_class_name
 
@@ -1,6 +1,7 @@
 import os
 from typing import Any, Optional, List, TYPE_CHECKING
 from openai import AsyncAzureOpenAI
+from ..http_transport import async_http_client
 from ..inference_service_abc import InferenceServiceABC
 # Use TYPE_CHECKING to avoid circular imports at runtime
 if TYPE_CHECKING:
@@ -184,6 +185,9 @@ class AzureAIService(InferenceServiceABC):
                         azure_endpoint=endpoint,
                         api_version=api_version,
                         api_key=api_key,
+                        http_client=async_http_client(
+                            cls._inference_service_, endpoint, api_key, rpm=self.rpm
+                        ),
                     )
                     try:
                         response = await client.chat.completions.create(
@@ -3,6 +3,7 @@ from typing import Any, List, Optional, TYPE_CHECKING
 from mistralai import Mistral
 
 
+from ..http_transport import async_http_client
 from ..inference_service_abc import InferenceServiceABC
 # Use TYPE_CHECKING to avoid circular imports at runtime
 if TYPE_CHECKING:
@@ -48,11 +49,19 @@ class MistralAIService(InferenceServiceABC):
 
     @classmethod
     def async_client(cls):
-        if cls._async_client_instance is None:
-            cls._async_client_instance = cls._async_client(
-                api_key=os.getenv(cls._env_key_name_)
+        api_key = os.getenv(cls._env_key_name_)
+        # Connections are pooled per event loop, so the client is rebuilt
+        # whenever the shared pool changes
+        http_client = async_http_client(cls._inference_service_, None, api_key)
+        if (
+            cls._async_client_instance is None
+            or cls._async_client_instance[0] is not http_client
+        ):
+            cls._async_client_instance = (
+                http_client,
+                cls._async_client(api_key=api_key, async_client=http_client),
             )
-        return cls._async_client_instance
+        return cls._async_client_instance[1]
 
     @classmethod
     def available(cls) -> list[str]:
@@ -1,9 +1,12 @@
 from __future__ import annotations
-from typing import Any, List, Optional, Dict, NewType, TYPE_CHECKING
+from typing import Any, List, Optional, Dict, NewType, Tuple, TYPE_CHECKING
 import os
 
+import httpx
 import openai
 
+from ...buckets.adaptive_rate import report_rate_limit, report_rate_limit_error
+from ..http_transport import async_http_client, sync_http_client
 from ..inference_service_abc import InferenceServiceABC
 # Use TYPE_CHECKING to avoid circular imports at runtime
 if TYPE_CHECKING:
@@ -29,7 +32,9 @@ class OpenAIService(InferenceServiceABC):
     _async_client_ = openai.AsyncOpenAI
 
     _sync_client_instances: Dict[APIToken, openai.OpenAI] = {}
-    _async_client_instances: Dict[APIToken, openai.AsyncOpenAI] = {}
+    _async_client_instances: Dict[
+        APIToken, Tuple[httpx.AsyncClient, openai.AsyncOpenAI]
+    ] = {}
 
     key_sequence = ["choices", 0, "message", "content"]
     usage_sequence = ["usage"]
@@ -50,21 +55,30 @@ class OpenAIService(InferenceServiceABC):
             client = cls._sync_client_(
                 api_key=api_key,
                 base_url=cls._base_url_,
+                http_client=sync_http_client(
+                    cls._inference_service_, cls._base_url_, api_key
+                ),
             )
             cls._sync_client_instances[api_key] = client
         client = cls._sync_client_instances[api_key]
         return client
 
     @classmethod
-    def async_client(cls, api_key):
-        if api_key not in cls._async_client_instances:
+    def async_client(cls, api_key, rpm=None):
+        # Connections are pooled per event loop, so the client is rebuilt
+        # whenever the shared pool for this endpoint and key changes
+        http_client = async_http_client(
+            cls._inference_service_, cls._base_url_, api_key, rpm=rpm
+        )
+        cached = cls._async_client_instances.get(api_key)
+        if cached is None or cached[0] is not http_client:
             client = cls._async_client_(
                 api_key=api_key,
                 base_url=cls._base_url_,
+                http_client=http_client,
             )
-            cls._async_client_instances[api_key] = client
-        client = cls._async_client_instances[api_key]
-        return client
+            cls._async_client_instances[api_key] = (http_client, client)
+        return cls._async_client_instances[api_key][1]
 
     model_exclude_list = [
         "whisper-1",
@@ -144,7 +158,7 @@ class OpenAIService(InferenceServiceABC):
                 return cls.sync_client(api_key=self.api_token)
 
             def async_client(self):
-                return cls.async_client(api_key=self.api_token)
+                return cls.async_client(api_key=self.api_token, rpm=self.rpm)
 
             @classmethod
             def available(cls) -> list[str]:
@@ -234,13 +248,14 @@ class OpenAIService(InferenceServiceABC):
                     params["max_completion_tokens"] = self.max_tokens
                     params["temperature"] = 1
                 try:
-                    response = await client.chat.completions.create(**params)
+                    raw_response = await client.chat.completions.with_raw_response.create(
+                        **params
+                    )
                 except Exception as e:
-                    #breakpoint()
-                    #print(e)
-                    #raise e
+                    report_rate_limit_error(e)
                     return {'message': str(e)}
-                return response.model_dump()
+                report_rate_limit(raw_response.headers, raw_response.status_code)
+                return raw_response.parse().model_dump()
 
         LLM.__name__ = "LanguageModel"
 
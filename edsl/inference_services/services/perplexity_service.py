@@ -75,7 +75,7 @@ class PerplexityService(OpenAIService):
                 return cls.sync_client(api_key=self.api_token)
 
             def async_client(self):
-                return cls.async_client(api_key=self.api_token)
+                return cls.async_client(api_key=self.api_token, rpm=self.rpm)
 
             @classmethod
             def available(cls) -> list[str]:
@@ -1,5 +1,6 @@
 import asyncio
 import copy
+import logging
 import weakref
 from typing import TYPE_CHECKING, Any, Callable, Union
 
@@ -17,6 +18,8 @@ from ..surveys.base import EndOfSurvey
 from ..tasks import TaskStatus
 from .exception_tracking import InterviewExceptionEntry
 
+logger = logging.getLogger(__name__)
+
 
 class RetryConfig:
     from ..config import CONFIG
@@ -34,7 +37,7 @@ class SkipHandler:
         # Cache only the skip function which doesn't maintain a reference to the interview
         try:
             self.skip_function: Callable = (
-                interview.survey.rule_collection.skip_question_before_running
+                interview.compiled_survey.skip_question_before_running
             )
         except (AttributeError, KeyError):
             # Fallback for test environments
@@ -132,7 +135,7 @@ class SkipHandler:
         # Get the index of the next question, which could also be the end of the survey
         next_question: Union[
             int, EndOfSurvey
-        ] = self._survey.rule_collection.next_question(
+        ] = self.interview.compiled_survey.next_question(
             q_now=current_question_index,
             answers=answers,
         )
@@ -178,6 +181,9 @@ class AnswerQuestionFunctionConstructor:
         self.invigilator_fetcher = FetchInvigilator(
             interview, key_lookup=self.key_lookup
         )
+        # Invigilators built before a question is answered, by question name;
+        # the first attempt at answering takes over the one built for its question
+        self._prepared_invigilators: dict[str, "InvigilatorBase"] = {}
 
         # In our test environment, we might not be able to create the SkipHandler
         # because example Interview might not have all required attributes
@@ -251,6 +257,42 @@ class AnswerQuestionFunctionConstructor:
     def __call__(self):
         return self.answer_question_and_record_task
 
+    def prepared_invigilator(self, question: "QuestionBase") -> "InvigilatorBase":
+        """Return the invigilator that will answer the question.
+
+        It is built once per question, so its prompts are rendered once and
+        shared by token estimation, the cache check and the answer itself.
+        """
+        invigilator = self._prepared_invigilators.get(question.question_name)
+        if invigilator is None:
+            invigilator = self.invigilator_fetcher(question)
+            self._prepared_invigilators[question.question_name] = invigilator
+        return invigilator
+
+    def clear_prepared_invigilators(self) -> None:
+        """Drop the invigilators prepared for questions that were never answered.
+
+        Questions that are skipped, cancelled or whose dependencies failed
+        don't take their prepared invigilator, with its rendered prompts.
+        """
+        self._prepared_invigilators.clear()
+
+    def is_answer_cached(self, question: "QuestionBase") -> bool:
+        """Return True if the model's answer to the question is already cached.
+
+        A failed check counts as a miss, so any error resurfaces, and is
+        recorded, when the question is answered.
+        """
+        try:
+            return self.prepared_invigilator(question).is_answer_cached()
+        except Exception:
+            logger.warning(
+                "Cache check failed for question '%s'; treating it as a miss",
+                question.question_name,
+                exc_info=True,
+            )
+            return False
+
     async def answer_question_and_record_task(
         self,
         *,
@@ -278,8 +320,10 @@ class AnswerQuestionFunctionConstructor:
             # Get a reference to the interview (may be None if it's been garbage collected)
             interview = self._interview_ref()
 
-            # Get the invigilator for this question
-            invigilator = self.invigilator_fetcher(question)
+            # Get the invigilator for this question; retries start from a fresh one
+            invigilator = self._prepared_invigilators.pop(
+                question.question_name, None
+            ) or self.invigilator_fetcher(question)
 
             # Check if interview still exists
             if interview is None:
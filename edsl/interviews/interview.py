@@ -16,7 +16,6 @@ the individual API calls to language models, with support for caching and distri
 from __future__ import annotations
 
 import asyncio
-import copy
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Generator, List, Optional, Type
 
@@ -38,6 +37,7 @@ def get_model_buckets():
 
 
 from ..surveys import Survey
+from ..surveys.compiled_survey import CompiledSurvey
 from ..utilities.utilities import dict_hash
 
 # from interviews module
@@ -112,6 +112,7 @@ class Interview:
         cache: Optional["Cache"] = None,
         skip_retry: bool = False,
         raise_validation_errors: bool = True,
+        compiled_survey: Optional["CompiledSurvey"] = None,
     ):
         """Initialize a new Interview instance.
 
@@ -125,6 +126,8 @@ class Interview:
             cache: Optional cache for storing and retrieving model responses
             skip_retry: Whether to skip retrying failed questions
             raise_validation_errors: Whether to raise exceptions for validation errors
+            compiled_survey: Optional precomputed survey structure shared with other
+                interviews of the same job; computed from the survey if not given
 
         The initialization process sets up the interview state including:
         1. Creating the task manager for handling question execution
@@ -144,20 +147,29 @@ class Interview:
             >>> i.task_status_logs['q0']
             [{'log_time': ..., 'value': <TaskStatus.NOT_STARTED: 1>}, {'log_time': ..., 'value': <TaskStatus.WAITING_FOR_DEPENDENCIES: 2>}, {'log_time': ..., 'value': <TaskStatus.API_CALL_IN_PROGRESS: 7>}, {'log_time': ..., 'value': <TaskStatus.SUCCESS: 8>}]
 
-            >>> i.to_index
+            >>> dict(i.to_index)
             {'q0': 0, 'q1': 1, 'q2': 2}
         """
         self.agent = agent
-        self.survey = copy.deepcopy(survey)  # why do we need to deepcopy the survey?
+        # each interview gets its own question objects, since invigilators may rewrite
+        # dynamic question options on them; a structural clone is enough for that
+        self.survey = survey.clone(
+            questions={q.question_name: q.clone() for q in survey.questions}
+        )
         self.scenario = scenario
         self.model = model
         self.iteration = iteration
 
         self.answers = Answers()  # will get filled in as interview progresses
 
+        if compiled_survey is None:
+            compiled_survey = CompiledSurvey(self.survey)
+        self.compiled_survey = compiled_survey
+
         self.task_manager = InterviewTaskManager(
             survey=self.survey,
             iteration=iteration,
+            compiled_survey=compiled_survey,
         )
 
         self.exceptions = InterviewExceptionCollection()
@@ -168,11 +180,8 @@ class Interview:
             raise_validation_errors=raise_validation_errors,
         )
 
-        # dictionary mapping question names to their index in the survey.
-        self.to_index = {
-            question_name: index
-            for index, question_name in enumerate(self.survey.question_names)
-        }
+        # read-only mapping of question names to their index in the survey.
+        self.to_index = compiled_survey.question_name_to_index
 
         self.failed_questions = []
 
@@ -277,7 +286,7 @@ class Interview:
         Examples:
             >>> i = Interview.example()
             >>> hash(i)
-            1670837906923478736
+            103298702534594331
         """
         # Create the base dictionary with core components
         d = {
@@ -356,10 +365,23 @@ class Interview:
         (agent, survey, scenario, model, and iteration) but excludes mutable
         state like exceptions to ensure consistent hashing.
 
+        The components are combined through their own hashes, so the cached
+        hashes of agents, scenarios and models are reused rather than
+        serializing each of them again for every interview.
+
         Returns:
             int: A hash value that uniquely identifies this interview configuration
         """
-        return dict_hash(self.to_dict(include_exceptions=False, add_edsl_version=False))
+        d = {
+            "agent": hash(self.agent),
+            "survey": hash(self.survey),
+            "scenario": hash(self.scenario),
+            "model": hash(self.model),
+            "iteration": self.iteration,
+        }
+        if hasattr(self, "indices"):
+            d["indices"] = self.indices
+        return dict_hash(d)
 
     def __eq__(self, other: "Interview") -> bool:
         """Check if two interviews are equivalent.
@@ -450,12 +472,16 @@ class Interview:
 
         self.skip_flags = {q.question_name: False for q in self.survey.questions}
 
+        answer_function_constructor = AnswerQuestionFunctionConstructor(
+            self, key_lookup=run_config.environment.key_lookup
+        )
         self.tasks = self.task_manager.build_question_tasks(
-            answer_func=AnswerQuestionFunctionConstructor(
-                self, key_lookup=run_config.environment.key_lookup
-            )(),
-            token_estimator=RequestTokenEstimator(self),
+            answer_func=answer_function_constructor(),
+            token_estimator=RequestTokenEstimator(
+                self, answer_function_constructor.prepared_invigilator
+            ),
             model_buckets=model_buckets,
+            cache_probe=answer_function_constructor.is_answer_cached,
         )
 
         ## This is the key part---it creates a task for each question,
@@ -468,9 +494,12 @@ class Interview:
             key_lookup=run_config.environment.key_lookup,
         )
         self.invigilators = [fetcher(question) for question in self.survey.questions]
-        await asyncio.gather(
-            *self.tasks, return_exceptions=not run_config.parameters.stop_on_exception
-        )
+        try:
+            await asyncio.gather(
+                *self.tasks, return_exceptions=not run_config.parameters.stop_on_exception
+            )
+        finally:
+            answer_function_constructor.clear_prepared_invigilators()
         self.answers.replace_missing_answers_with_none(self.survey)
         valid_results = list(
             self._extract_valid_results(self.tasks, self.invigilators, self.exceptions)
@@ -629,6 +658,7 @@ class Interview:
             cache=self.running_config.cache,
             skip_retry=self.running_config.skip_retry,
             indices=self.indices,
+            compiled_survey=self.compiled_survey,
         )
 
     @classmethod
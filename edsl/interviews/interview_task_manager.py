@@ -7,27 +7,29 @@ if TYPE_CHECKING:
     from ..questions import QuestionBase
     from ..tokens import InterviewTokenUsage
     from . import InterviewStatusDictionary, InterviewStatusLog
+    from ..surveys.compiled_survey import CompiledSurvey
 
 
 class InterviewTaskManager:
     """Handles creation and management of interview tasks."""
 
-    def __init__(self, survey, iteration=0):
+    def __init__(self, survey, iteration=0, compiled_survey: "CompiledSurvey" = None):
         from ..tasks import TaskCreators
         from . import InterviewStatusLog
 
         self.survey = survey
         self.iteration = iteration
         self.task_creators = TaskCreators()
-        self.to_index = {
-            question_name: index
-            for index, question_name in enumerate(self.survey.question_names)
-        }
+        if compiled_survey is None:
+            from ..surveys.compiled_survey import CompiledSurvey
+
+            compiled_survey = CompiledSurvey(survey)
+        self.compiled_survey = compiled_survey
+        self.to_index = compiled_survey.question_name_to_index
         self._task_status_log_dict = InterviewStatusLog()
-        self.survey_dag = None
 
     def build_question_tasks(
-        self, answer_func, token_estimator, model_buckets
+        self, answer_func, token_estimator, model_buckets, cache_probe=None
     ) -> list[asyncio.Task]:
         """Create tasks for all questions with proper dependencies."""
         tasks: list[asyncio.Task] = []
@@ -39,6 +41,7 @@ class InterviewTaskManager:
                 answer_func=answer_func,
                 token_estimator=token_estimator,
                 model_buckets=model_buckets,
+                cache_probe=cache_probe,
             )
             tasks.append(task)
         return tasks
@@ -47,9 +50,7 @@ class InterviewTaskManager:
         self, existing_tasks: list[asyncio.Task], question: "QuestionBase"
     ) -> list[asyncio.Task]:
         """Get tasks that must be completed before the given question."""
-        if self.survey_dag is None:
-            self.survey_dag = self.survey.dag(textify=True)
-        parents = self.survey_dag.get(question.question_name, [])
+        parents = self.compiled_survey.parents.get(question.question_name, ())
         return [existing_tasks[self.to_index[parent_name]] for parent_name in parents]
 
     def _create_single_task(
@@ -59,6 +60,7 @@ class InterviewTaskManager:
         answer_func,
         token_estimator,
         model_buckets,
+        cache_probe=None,
     ) -> asyncio.Task:
         """Create a single question task with its dependencies."""
         from ..tasks import QuestionTaskCreator
@@ -68,6 +70,7 @@ class InterviewTaskManager:
             answer_question_func=answer_func,
             token_estimator=token_estimator,
             model_buckets=model_buckets,
+            cache_probe=cache_probe,
             iteration=self.iteration,
         )
 
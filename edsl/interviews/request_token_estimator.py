@@ -1,5 +1,6 @@
 from ..jobs.fetch_invigilator import FetchInvigilator
 from ..scenarios import FileStore
+from ..tokens import count_tokens
 
 import math
 
@@ -100,15 +101,17 @@ def estimate_tokens(model_name, width, height):
 class RequestTokenEstimator:
     """Estimate the number of tokens that will be required to run the focal task."""
 
-    def __init__(self, interview):
+    def __init__(self, interview, fetch_invigilator=None):
         self.interview = interview
+        # Interviews pass the invigilator that will answer the question, so
+        # its prompts are rendered only once
+        self.fetch_invigilator = fetch_invigilator or FetchInvigilator(interview)
 
     def __call__(self, question) -> float:
         """Estimate the number of tokens that will be required to run the focal task."""
 
-        invigilator = FetchInvigilator(self.interview)(question=question)
+        invigilator = self.fetch_invigilator(question)
 
-        # TODO: There should be a way to get a more accurate estimate.
         combined_text = ""
         file_tokens = 0
         for prompt in invigilator.get_prompts().values():
@@ -138,7 +141,13 @@ class RequestTokenEstimator:
                 from .exceptions import InterviewTokenError
 
                 raise InterviewTokenError(f"Prompt is of type {type(prompt)}")
-        result: float = len(combined_text) / 4.0 + file_tokens
+        model = self.interview.model
+        text_tokens = count_tokens(
+            combined_text,
+            inference_service=getattr(model, "_inference_service_", None),
+            model=model.model,
+        )
+        result: float = text_tokens + file_tokens
         return result
 
 
@@ -79,6 +79,8 @@ class InvigilatorBase(ABC):
 
         # placeholder to store the raw model response
         self.raw_model_response = None
+        # prompts, once rendered
+        self._prompts = None
 
     @property
     def prompt_constructor(self) -> PromptConstructor:
@@ -187,6 +189,13 @@ class InvigilatorBase(ABC):
             "system_prompt": Prompt("NA"),
         }
 
+    def is_answer_cached(self) -> bool:
+        """Return True if answering will not need a call to the language model.
+
+        Only invigilators that call a model can be served from the cache.
+        """
+        return False
+
     @abstractmethod
     async def async_answer_question(self):
         """Asnwer a question."""
@@ -267,13 +276,42 @@ class InvigilatorAI(InvigilatorBase):
     """An invigilator that uses an AI model to answer questions."""
 
     def get_prompts(self) -> Dict[PromptType, "Prompt"]:
-        """Return the prompts used."""
-        return self.prompt_constructor.get_prompts()
+        """Return the prompts used.
+
+        They are rendered on first use and then reused, so estimating tokens,
+        checking the cache and answering all work from one rendering.
+        """
+        if self._prompts is None:
+            self._prompts = self.prompt_constructor.get_prompts()
+        return self._prompts
 
     def get_captured_variables(self) -> dict:
         """Get the captured variables."""
         return self.prompt_constructor.get_captured_variables()
 
+    def is_answer_cached(self) -> bool:
+        """Return True if the model's response to this question is already cached.
+
+        >>> from edsl import Cache
+        >>> i = InvigilatorAI.example()
+        >>> i.cache = Cache()
+        >>> i.is_answer_cached()
+        False
+        >>> _ = i.answer_question()
+        >>> i.is_answer_cached()
+        True
+        """
+        if self.cache is None:
+            return False
+        prompts = self.get_prompts()
+        return self.model.is_cached(
+            user_prompt=prompts["user_prompt"].text,
+            system_prompt=prompts["system_prompt"].text,
+            cache=self.cache,
+            iteration=self.iteration,
+            files_list=prompts.get("files_list"),
+        )
+
     async def async_get_agent_response(self) -> AgentResponseDict:
         prompts = self.get_prompts()
         params = {
@@ -371,18 +409,26 @@ class InvigilatorAI(InvigilatorBase):
         jinja2 template might be referencing these values with a dot notation.
 
         """
-        question_dict = survey.duplicate().question_names_to_questions()
+        question_dict = survey.question_names_to_questions()
+        cloned = set()
+
+        def own_copy(question_name: str) -> "QuestionBase":
+            # the survey's questions are shared, so only the ones we annotate are copied
+            if question_name not in cloned:
+                question_dict[question_name] = question_dict[question_name].clone()
+                cloned.add(question_name)
+            return question_dict[question_name]
 
         # iterates through the current answers and updates the question_dict (which is all questions)
         for other_question, answer in current_answers.items():
             if other_question in question_dict:
-                question_dict[other_question].answer = answer
+                own_copy(other_question).answer = answer
             else:
                 # it might be a comment
                 if (
                     new_question := other_question.split("_comment")[0]
                 ) in question_dict:
-                    question_dict[new_question].comment = answer
+                    own_copy(new_question).comment = answer
 
         return {**question_dict, **scenario}
 
@@ -7,8 +7,7 @@ with controlled concurrency, supporting both error handling and result collectio
 
 from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
-from typing import List, Generator, Tuple, TYPE_CHECKING, AsyncIterator
-from dataclasses import dataclass
+from typing import Collection, Dict, Iterable, Generator, Optional, Tuple, TYPE_CHECKING, AsyncIterator
 import asyncio
 from ..data_transfer_models import EDSLResultObjectInput
 
@@ -21,17 +20,7 @@ config = Config()
 
 if TYPE_CHECKING:
     from ..jobs import Jobs
-
-@dataclass
-class InterviewBatch:
-    """Container for a batch of interviews being processed."""
-    chunks: List[Tuple[int, Interview]]
-    results: List[Tuple[Result, Interview, int]]
-    failed: List[Tuple[int, Interview, Exception]]
-
-    @classmethod
-    def create(cls, chunks: List[Tuple[int, Interview]]) -> 'InterviewBatch':
-        return cls(chunks=chunks, results=[], failed=[])
+    from .jobs_interview_constructor import InterviewDescriptor
 
 class AsyncInterviewRunner:
     """
@@ -53,60 +42,81 @@ class AsyncInterviewRunner:
 
     MAX_CONCURRENT = int(config.EDSL_MAX_CONCURRENT_TASKS)
 
-    def __init__(self, jobs: "Jobs", run_config: RunConfig):
+    def __init__(
+        self,
+        jobs: "Jobs",
+        run_config: RunConfig,
+        completed_interview_hashes: Optional[Collection[int]] = None,
+    ):
         """
         Initialize the AsyncInterviewRunner.
 
         Args:
             jobs: The Jobs object that generates interviews
             run_config: Configuration for running the interviews
+            completed_interview_hashes: Interview.initial_hash values of interviews
+                finished by an earlier run; these are skipped but keep their position index
         """
         self.jobs = jobs
         self.run_config = run_config
+        self.completed_interview_hashes = completed_interview_hashes or frozenset()
         self._initialized = asyncio.Event()
 
     @asynccontextmanager
-    async def _manage_tasks(self, tasks: List[asyncio.Task]) -> AsyncIterator[None]:
+    async def _manage_tasks(self, tasks: Iterable[asyncio.Task]) -> AsyncIterator[None]:
         """Context manager for handling task lifecycle and cleanup."""
         try:
             yield
         finally:
-            for task in tasks:
+            for task in list(tasks):
                 if not task.done():
                     task.cancel()
 
     @asynccontextmanager
     async def _interview_batch_processor(self) -> AsyncIterator[AsyncGenerator[tuple[Result, Interview, int], None]]:
-        """Context manager for processing batches of interviews.
-        
+        """Context manager for processing interviews through a sliding window.
+
         Handles initialization, cleanup, and error management for the entire
-        interview processing lifecycle.
+        interview processing lifecycle. At most ``MAX_CONCURRENT`` interviews
+        are in flight at once; as soon as one finishes, the next interview is
+        pulled from the generator, so a single slow interview never leaves the
+        other slots idle. Results are yielded in completion order.
         """
         self._initialized.set()
         self._current_idx = 0
         interview_generator = self._expand_interviews()
-        
+
         try:
-            async def process_batches() -> AsyncGenerator[tuple[Result, Interview, int], None]:
-                while True:
-                    chunk = self._get_next_chunk(interview_generator)
-                    if not chunk:
-                        break
-                    
-                    async with self._process_chunk(chunk) as results:
-                        for result_tuple in results:
-                            # Yield the full tuple (result, interview, idx)
-                            yield result_tuple
-                    
-                    # Clean up chunk to help with garbage collection
-                    for idx, interview in chunk:
-                        # Explicitly clear any interview references when done with the chunk
-                        if hasattr(interview, 'clear_references'):
-                            interview.clear_references()
-                    del chunk
-            
-            yield process_batches()
-            
+            async def process_window() -> AsyncGenerator[tuple[Result, Interview, int], None]:
+                in_flight: Dict[asyncio.Task, Tuple[int, Interview]] = {}
+                exhausted = False
+
+                async with self._manage_tasks(in_flight):
+                    while True:
+                        # Top up the window with new interviews
+                        while not exhausted and len(in_flight) < self.MAX_CONCURRENT:
+                            exhausted = not self._start_next_interview(
+                                interview_generator, in_flight
+                            )
+                        if not in_flight:
+                            break
+
+                        done, _ = await asyncio.wait(
+                            in_flight, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            idx, interview = in_flight.pop(task)
+                            # Re-raises the interview's exception if stop_on_exception is set
+                            result_tuple = task.result()
+                            if result_tuple is not None:
+                                yield result_tuple
+                            # Explicitly clear any interview references once it has been consumed
+                            if hasattr(interview, "clear_references"):
+                                interview.clear_references()
+                            del interview
+
+            yield process_window()
+
         finally:
             # Cleanup code to help garbage collection
             self._current_idx = 0
@@ -135,87 +145,65 @@ class AsyncInterviewRunner:
             # Could log the error here if needed
             return None
 
-    @asynccontextmanager
-    async def _process_chunk(
-        self, chunk: List[Tuple[int, Interview]]
-    ) -> AsyncIterator[List[Tuple[Result, Interview, int]]]:
-        """Process a chunk of interviews concurrently."""
-        tasks = [
-            asyncio.create_task(self._run_single_interview(interview, idx))
-            for idx, interview in chunk
-        ]
-                
-        async with self._manage_tasks(tasks):
-            results = await asyncio.gather(
-                *tasks,
-                return_exceptions=not self.run_config.parameters.stop_on_exception
-            )
-            # Filter out None results and yield a new list to avoid keeping the original tuple references
-            valid_results = []
-            for r in results:
-                if r is not None:
-                    result, interview, idx = r
-                    # Create a new tuple to break reference to the original
-                    new_tuple = (result, interview, idx)
-                    valid_results.append(new_tuple)
-                    
-                    # Clear original tuple to help GC
-                    del r
-            
-            yield valid_results
-            
-            # Manually clean up the valid_results list and its contents to help garbage collection
-            for tup in valid_results:
-                del tup
-            del valid_results
-
-    def _expand_interviews(self) -> Generator["Interview", None, None]:
+    def _expand_interviews(self) -> Generator["InterviewDescriptor", None, None]:
         """
-        Create multiple copies of each interview based on the run configuration.
+        Create a descriptor for each repetition of each interview based on the run configuration.
 
-        This method expands interviews for repeated runs and ensures each has
-        the proper cache configuration.
+        Only descriptors are produced here; the Interview for each one is built
+        when it is started, so interviews waiting for a slot hold no state.
 
         Yields:
-            Interview objects ready to be conducted
+            InterviewDescriptor objects, one per interview and iteration
 
         Examples:
             >>> from unittest.mock import MagicMock
             >>> mock_jobs = MagicMock()
-            >>> mock_interview = MagicMock()
-            >>> mock_jobs.generate_interviews.return_value = [mock_interview]
+            >>> mock_descriptor = MagicMock()
+            >>> mock_jobs.generate_interview_descriptors.return_value = [mock_descriptor]
             >>> mock_run_config = MagicMock()
             >>> mock_run_config.parameters.n = 2
             >>> mock_run_config.environment.cache = "mock_cache"
             >>> runner = AsyncInterviewRunner(mock_jobs, mock_run_config)
-            >>> interviews = list(runner._expand_interviews())
-            >>> len(interviews)
+            >>> descriptors = list(runner._expand_interviews())
+            >>> len(descriptors)
             2
         """
-        for interview in self.jobs.generate_interviews():
+        for descriptor in self.jobs.generate_interview_descriptors():
             for iteration in range(self.run_config.parameters.n):
                 if iteration > 0:
-                    yield interview.duplicate(
-                        iteration=iteration, cache=self.run_config.environment.cache
-                    )
+                    yield descriptor.with_iteration(iteration)
                 else:
-                    interview.cache = self.run_config.environment.cache
-                    yield interview
+                    yield descriptor
 
-    def _get_next_chunk(
+    def _start_next_interview(
         self,
-        gen: Generator[Interview, None, None]
-    ) -> List[Tuple[int, Interview]]:
-        """Take interviews from the generator up to MAX_CONCURRENT."""
-        chunk = []
-        while len(chunk) < self.MAX_CONCURRENT:
+        gen: Generator["InterviewDescriptor", None, None],
+        in_flight: Dict[asyncio.Task, Tuple[int, Interview]],
+    ) -> bool:
+        """Build the next interview from the generator and start it as a task.
+
+        Interviews that were already completed are skipped before they are
+        conducted, keeping the position indices of the remaining interviews.
+
+        Returns False when the generator is exhausted.
+        """
+        while True:
             try:
-                interview = next(gen)
-                chunk.append((self._current_idx, interview))
-                self._current_idx += 1
+                descriptor = next(gen)
             except StopIteration:
+                return False
+            interview = descriptor.to_interview()
+            interview.cache = self.run_config.environment.cache
+            idx = self._current_idx
+            self._current_idx += 1
+            if (
+                not self.completed_interview_hashes
+                or interview.initial_hash not in self.completed_interview_hashes
+            ):
                 break
-        return chunk
+        task = asyncio.create_task(self._run_single_interview(interview, idx))
+        in_flight[task] = (idx, interview)
+        return True
 
     async def run(self) -> AsyncGenerator[tuple[Result, Interview, int], None]:
         """
@@ -66,6 +66,12 @@ class RunParameters(Base):
         disable_remote_inference (bool): Whether to disable remote inference, default is False
         job_uuid (str, optional): UUID for the job, used for tracking
         fresh (bool): If True, ignore cache and generate new results, default is False
+        results_sink (str, optional): Path of a .jsonl or SQLite file that each Result is
+            appended to as it completes, instead of keeping all Results in memory; the job
+            then runs locally
+        resume_from (str, optional): Results sink file of an earlier run; interviews whose
+            results it holds are skipped and their stored results are returned instead; the
+            job then runs locally
     """
     n: int = 1
     progress_bar: bool = False
@@ -84,6 +90,8 @@ class RunParameters(Base):
     job_uuid: Optional[str] = None
     fresh: bool = False  # if True, will not use cache and will save new results to cache
     memory_threshold: Optional[int] = None  # Threshold in bytes for Results SQLList memory management
+    results_sink: Optional[str] = None  # Stream each Result to this file as it completes
+    resume_from: Optional[str] = None  # Skip interviews already in this results sink file
 
     def to_dict(self, add_edsl_version=False) -> dict:
         d = asdict(self)
@@ -76,7 +76,7 @@ class FetchInvigilator:
             scenario=self._scenario,
             model=self._model,
             survey=self._survey,
-            memory_plan=self._survey.memory_plan,
+            memory_plan=self.interview.compiled_survey.memory_plan,
             current_answers=self.current_answers,
             iteration=self._iteration,
             cache=self._cache,
@@ -429,6 +429,21 @@ class Jobs(Base):
             self, cache=self.run_config.environment.cache
         ).create_interviews()
 
+    def generate_interview_descriptors(self) -> Generator:
+        """
+        Generate compact descriptors of the job's interviews.
+
+        Each InterviewDescriptor builds its Interview only when to_interview is
+        called, so a job's interviews can be enumerated without holding them.
+        Like generate_interviews, this fills in missing agents, models and scenarios.
+        """
+        from .jobs_interview_constructor import InterviewsConstructor
+
+        self.replace_missing_objects()
+        yield from InterviewsConstructor(
+            self, cache=self.run_config.environment.cache
+        ).create_descriptors()
+
     def show_flow(self, filename: Optional[str] = None) -> None:
         """Show the flow of the survey.
 
@@ -580,6 +595,11 @@ class Jobs(Base):
 
         background = config.parameters.background
 
+        # Results sinks and checkpoints are local files, so such jobs run locally
+        parameters = self.run_config.parameters
+        if parameters.results_sink is not None or parameters.resume_from is not None:
+            return None, None
+
         jh = self._create_remote_inference_handler()
         if jh.use_remote_inference(self.run_config.parameters.disable_remote_inference):
             job_info: RemoteJobInfo = self._start_remote_inference_job(jh)
@@ -614,10 +634,18 @@ class Jobs(Base):
         import os
         import time
         import gc
+        import heapq
         import weakref
         import asyncio
         from ..caching import Cache
+        from ..config import CONFIG
         from ..results import Results, Result
+        from ..results.results import ResultsSQLList, _result_sort_key
+        from ..results.results_sink import (
+            open_results_sink,
+            read_interview_hashes,
+            read_results_sink,
+        )
         from ..tasks import TaskHistory
         from ..utilities.decorators import jupyter_nb_handler
         from ..utilities.memory_debugger import MemoryDebugger
@@ -640,30 +668,60 @@ class Jobs(Base):
                 self, n=self.run_config.parameters.n
             )
 
+        # Stream results to a file as they complete rather than holding them all
+        results_sink = self.run_config.parameters.results_sink
+        # Interviews whose rows are in this checkpoint are not run again
+        resume_from = self.run_config.parameters.resume_from
+        completed_interview_hashes = (
+            read_interview_hashes(resume_from) if resume_from is not None else None
+        )
+        sink = open_results_sink(results_sink) if results_sink is not None else None
+
+        def completed_results():
+            """Rows of this run read back from the sink, with any resumed rows, in order."""
+            if resume_from is None:
+                return iter(sink)
+            if os.path.realpath(resume_from) == os.path.realpath(results_sink):
+                return read_results_sink(resume_from)
+            return heapq.merge(
+                read_results_sink(resume_from), sink, key=_result_sort_key
+            )
+
         # Create a shared function to process interview results
         async def process_interviews(interview_runner, results_obj):
             prev_interview_ref = None
-            async for result, interview, idx in interview_runner.run():
-                # Set the order attribute on the result for correct ordering
-                result.order = idx
-
-                # Collect results
-                # results_obj.append(result)
-                # key = results_obj.shelve_result(result)
-                results_obj.add_task_history_entry(interview)
-                results_obj.insert_sorted(result)
-
-                # Memory management: Set up reference for next iteration and clear old references
-                prev_interview_ref = weakref.ref(interview)
-                if hasattr(interview, "clear_references"):
-                    interview.clear_references()
-
-                # Force garbage collection
-                del result
-                del interview
-
-            # Finalize results object with cache and bucket collection
+            try:
+                async for result, interview, idx in interview_runner.run():
+                    # Set the order attribute on the result for correct ordering
+                    result.order = idx
+
+                    # Collect results
+                    results_obj.add_task_history_entry(interview)
+                    if sink is not None:
+                        # On disk now; read back in order when the job ends
+                        sink.write(result)
+                    else:
+                        # Sorted once at the end rather than on every insert
+                        results_obj.insert_sorted(result, defer_sort=True)
+
+                    # Memory management: Set up reference for next iteration and clear old references
+                    prev_interview_ref = weakref.ref(interview)
+                    if hasattr(interview, "clear_references"):
+                        interview.clear_references()
+
+                    # Force garbage collection
+                    del result
+                    del interview
+            finally:
+                if sink is not None:
+                    # Also reached when the job is interrupted, so finished rows are kept
+                    sink.close()
+            if sink is not None:
+                results_obj.extend(completed_results())
+
+            # Finalize results object with ordering, cache and bucket collection
             # results_obj.insert_from_shelf()
+            results_obj.finalize_sort()
             results_obj.cache = results_obj.relevant_cache(
                 self.run_config.environment.cache
             )
@@ -673,38 +731,52 @@ class Jobs(Base):
             return results_obj
 
         # Core execution logic
-        interview_runner = AsyncInterviewRunner(self, run_config)
+        interview_runner = AsyncInterviewRunner(
+            self, run_config, completed_interview_hashes=completed_interview_hashes
+        )
 
         # Create an initial Results object with appropriate traceback settings
         results = Results(
             survey=self.survey,
             data=[],
             task_history=TaskHistory(
-                include_traceback=not self.run_config.parameters.progress_bar
+                include_traceback=not self.run_config.parameters.progress_bar,
+                max_records=int(CONFIG.get("EDSL_TASK_HISTORY_MAX_RECORDS")),
             ),
+            # Rows read back from a sink are kept on disk, not in memory
+            data_class=list if sink is None else ResultsSQLList,
         )
+        if resume_from is not None and sink is None:
+            for result in read_results_sink(resume_from):
+                results.insert_sorted(result, defer_sort=True)
 
-        if run_job_async:
-            # For async execution mode (simplified path without progress bar)
-            await process_interviews(interview_runner, results)
-        else:
-            # For synchronous execution mode (with progress bar)
-            with ProgressBarManager(
-                self, run_config, self.run_config.parameters
-            ) as stop_event:
-                try:
-                    await process_interviews(interview_runner, results)
-                except KeyboardInterrupt:
-                    print("Keyboard interrupt received. Stopping gracefully...")
-                    results = Results(
-                        survey=self.survey, data=[], task_history=TaskHistory()
-                    )
-                except Exception as e:
-                    if self.run_config.parameters.stop_on_exception:
-                        raise
-                    results = Results(
-                        survey=self.survey, data=[], task_history=TaskHistory()
-                    )
+        try:
+            if run_job_async:
+                # For async execution mode (simplified path without progress bar)
+                await process_interviews(interview_runner, results)
+            else:
+                # For synchronous execution mode (with progress bar)
+                with ProgressBarManager(
+                    self, run_config, self.run_config.parameters
+                ) as stop_event:
+                    try:
+                        await process_interviews(interview_runner, results)
+                    except KeyboardInterrupt:
+                        print("Keyboard interrupt received. Stopping gracefully...")
+                        results = Results(
+                            survey=self.survey, data=[], task_history=TaskHistory()
+                        )
+                    except Exception as e:
+                        if self.run_config.parameters.stop_on_exception:
+                            raise
+                        results = Results(
+                            survey=self.survey, data=[], task_history=TaskHistory()
+                        )
+        finally:
+            # Give leased tokens back to a remote bucket server and close its sessions
+            bucket_collection = self.run_config.environment.bucket_collection
+            if bucket_collection is not None:
+                await bucket_collection.aclose()
 
         # Process any exceptions in the results
         if results:
@@ -829,6 +901,12 @@ class Jobs(Base):
             key_lookup (KeyLookup, optional): Object to manage API keys
             memory_threshold (int, optional): Memory threshold in bytes for the Results object's SQLList,
                 controlling when data is offloaded to SQLite storage
+            results_sink (str, optional): Path of a .jsonl or SQLite (.db) file that each Result is
+                appended to as it completes; the returned Results are read back from it. The job
+                then runs locally, even if remote inference is enabled
+            resume_from (str, optional): Results sink file of an earlier run of this job; interviews
+                whose rows it holds are skipped and those rows are included in the returned Results.
+                The job then runs locally, even if remote inference is enabled
 
         Returns:
             Results: A Results object containing all responses and metadata
@@ -889,6 +967,12 @@ class Jobs(Base):
             key_lookup (KeyLookup, optional): Object to manage API keys
             memory_threshold (int, optional): Memory threshold in bytes for the Results object's SQLList,
                 controlling when data is offloaded to SQLite storage
+            results_sink (str, optional): Path of a .jsonl or SQLite (.db) file that each Result is
+                appended to as it completes; the returned Results are read back from it. The job
+                then runs locally, even if remote inference is enabled
+            resume_from (str, optional): Results sink file of an earlier run of this job; interviews
+                whose rows it holds are skipped and those rows are included in the returned Results.
+                The job then runs locally, even if remote inference is enabled
 
         Returns:
             Results: A Results object containing all responses and metadata
@@ -1,16 +1,163 @@
-from typing import Generator, TYPE_CHECKING
+from typing import Generator, Iterator, TYPE_CHECKING
 from itertools import product
 
 if TYPE_CHECKING:
     from ..interviews import Interview
     from .jobs import Jobs
     from ..caching import Cache
+    from ..surveys import Survey
+    from ..surveys.compiled_survey import CompiledSurvey
+
+
+class _InterviewContext:
+    """State shared by every interview of a job: the job's objects, their indices and the compiled survey."""
+
+    def __init__(self, jobs: "Jobs", cache: "Cache", compiled_survey: "CompiledSurvey"):
+        self.survey = jobs.survey
+        # Materialized once (as product() did before), so a disk-backed list hands
+        # out the same objects each time and their cached hashes are reused.
+        self.agents = list(jobs.agents)
+        self.scenarios = list(jobs.scenarios)
+        self.models = list(jobs.models)
+        self.cache = cache
+        self.skip_retry = jobs.run_config.parameters.skip_retry
+        self.raise_validation_errors = jobs.run_config.parameters.raise_validation_errors
+        self.compiled_survey = compiled_survey
+
+        # Each object is hashed once; equal objects share the index of the last one.
+        self.agent_indices = self._last_index_of_equal(self.agents)
+        self.scenario_indices = self._last_index_of_equal(self.scenarios)
+        self.model_indices = self._last_index_of_equal(self.models)
+
+    @staticmethod
+    def _last_index_of_equal(objects: list) -> list:
+        hashes = [hash(obj) for obj in objects]
+        index = {h: i for i, h in enumerate(hashes)}
+        return [index[h] for h in hashes]
+
+
+class InterviewDescriptor:
+    """A compact stand-in for an Interview that has not been started yet.
+
+    It holds only the positions of its agent, scenario and model in the job,
+    the iteration number and a reference to the state shared by the whole job.
+    The Interview itself, with its survey copy, task manager and status logs,
+    is built by :meth:`to_interview` when the interview is about to run.
+    """
+
+    __slots__ = (
+        "context",
+        "agent_index",
+        "scenario_index",
+        "model_index",
+        "iteration",
+        "origin",
+        "drawn_survey",
+    )
+
+    def __init__(
+        self,
+        context: _InterviewContext,
+        agent_index: int,
+        scenario_index: int,
+        model_index: int,
+        iteration: int = 0,
+    ):
+        self.context = context
+        self.agent_index = agent_index
+        self.scenario_index = scenario_index
+        self.model_index = model_index
+        self.iteration = iteration
+        # The descriptor this one repeats (see with_iteration) and the survey drawn for it
+        self.origin = None
+        self.drawn_survey = None
+
+    def with_iteration(self, iteration: int) -> "InterviewDescriptor":
+        """Return a descriptor for the same interview with another iteration number.
+
+        Its survey is drawn from this descriptor's drawn survey, as for an
+        Interview.duplicate(), so shuffled options come out in the same order.
+        """
+        descriptor = InterviewDescriptor(
+            self.context,
+            self.agent_index,
+            self.scenario_index,
+            self.model_index,
+            iteration,
+        )
+        descriptor.origin = self
+        return descriptor
+
+    def _draw_survey(self) -> "Survey":
+        if self.origin is not None:
+            return self.origin._draw_survey().draw()
+        if self.drawn_survey is None:
+            # this draw is to support shuffling of question options
+            self.drawn_survey = self.context.survey.draw()
+        return self.drawn_survey
+
+    def to_interview(self) -> "Interview":
+        """Build the Interview this descriptor stands for."""
+        from ..interviews import Interview
+
+        context = self.context
+        return Interview(
+            survey=self._draw_survey(),
+            agent=context.agents[self.agent_index],
+            scenario=context.scenarios[self.scenario_index],
+            model=context.models[self.model_index],
+            iteration=self.iteration,
+            cache=context.cache,
+            skip_retry=context.skip_retry,
+            raise_validation_errors=context.raise_validation_errors,
+            indices={
+                "agent": context.agent_indices[self.agent_index],
+                "model": context.model_indices[self.model_index],
+                "scenario": context.scenario_indices[self.scenario_index],
+            },
+            compiled_survey=context.compiled_survey,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"InterviewDescriptor(agent_index={self.agent_index}, "
+            f"scenario_index={self.scenario_index}, model_index={self.model_index}, "
+            f"iteration={self.iteration})"
+        )
+
 
 class InterviewsConstructor:
     def __init__(self, jobs: "Jobs", cache: "Cache"):
         self.jobs = jobs
         self.cache = cache
 
+    def create_descriptors(self) -> Generator[InterviewDescriptor, None, None]:
+        """
+        Generates one InterviewDescriptor per agent, scenario and model combination.
+
+        Descriptors share the job's objects and compiled survey, so holding
+        them costs a few integers each; nothing is copied per interview.
+
+        >>> from edsl.jobs import Jobs
+        >>> descriptors = list(Jobs.example().generate_interview_descriptors())
+        >>> descriptors[1]
+        InterviewDescriptor(agent_index=0, scenario_index=1, model_index=0, iteration=0)
+        >>> descriptors[1].to_interview().indices
+        {'agent': 0, 'model': 0, 'scenario': 1}
+        """
+        from ..surveys.compiled_survey import CompiledSurvey
+
+        # Rules, DAG and memory plan are the same for every interview, so they are built once
+        compiled_survey = CompiledSurvey(self.jobs.survey)
+        context = _InterviewContext(self.jobs, self.cache, compiled_survey)
+
+        for a, s, m in product(
+            range(len(context.agents)),
+            range(len(context.scenarios)),
+            range(len(context.models)),
+        ):
+            yield InterviewDescriptor(context, a, s, m)
+
     def create_interviews(self) -> Generator["Interview", None, None]:
         """
         Generates interviews.
@@ -20,35 +167,12 @@ class InterviewsConstructor:
         with us filling in defaults.
 
         """
-        from ..interviews import Interview
+        for descriptor in self.create_descriptors():
+            yield descriptor.to_interview()
 
-        agent_index = {
-            hash(agent): index for index, agent in enumerate(self.jobs.agents)
-        }
-        model_index = {
-            hash(model): index for index, model in enumerate(self.jobs.models)
-        }
-        scenario_index = {
-            hash(scenario): index for index, scenario in enumerate(self.jobs.scenarios)
-        }
-
-        for agent, scenario, model in product(
-            self.jobs.agents, self.jobs.scenarios, self.jobs.models
-        ):
-            yield Interview(
-                survey=self.jobs.survey.draw(), # this draw is to support shuffling of question options
-                agent=agent,
-                scenario=scenario,
-                model=model,
-                cache=self.cache,
-                skip_retry=self.jobs.run_config.parameters.skip_retry,
-                raise_validation_errors=self.jobs.run_config.parameters.raise_validation_errors,
-                indices={
-                    "agent": agent_index[hash(agent)],
-                    "model": model_index[hash(model)],
-                    "scenario": scenario_index[hash(scenario)],
-                },
-            )
+    def __iter__(self) -> Iterator["Interview"]:
+        """Iterate over the job's interviews, building each one as it is reached."""
+        return self.create_interviews()
 
 
 if __name__ == "__main__":
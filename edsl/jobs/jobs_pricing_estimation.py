@@ -1,7 +1,8 @@
 import logging
 import math
+import re
 
-from typing import List, TYPE_CHECKING, Union, Literal, Dict
+from typing import Iterable, TYPE_CHECKING, Union, Literal, Dict
 from collections import namedtuple
 
 if TYPE_CHECKING:
@@ -17,12 +18,17 @@ from ..coop.utils import CostConverter
 from ..caching import CacheEntry
 from ..dataset import Dataset
 from ..language_models.price_manager import PriceRetriever
+from ..tokens import count_tokens
 
 logger = logging.getLogger(__name__)
 
 
+# A Jinja expression such as {{ q0.answer }}; literal double braces in code or
+# JSON do not count as piping
+_PIPING_PATTERN = re.compile(r"\{\{[^{}]*[A-Za-z_][^{}]*\}\}")
+
+
 class PromptCostEstimator:
-    CHARS_PER_TOKEN = 4
     OUTPUT_TOKENS_PER_INPUT_TOKEN = 0.75
     PIPING_MULTIPLIER = 2
 
@@ -42,21 +48,29 @@ class PromptCostEstimator:
 
     @staticmethod
     def get_piping_multiplier(prompt: str):
-        """Returns 2 if a prompt includes Jinja braces, and 1 otherwise."""
+        """Returns 2 if a prompt includes a Jinja expression, and 1 otherwise.
 
-        if "{{" in prompt and "}}" in prompt:
+        >>> PromptCostEstimator.get_piping_multiplier("Why {{ q0.answer }}?")
+        2
+        >>> PromptCostEstimator.get_piping_multiplier('Parse {"a": {"b": 1}}')
+        1
+        """
+
+        if _PIPING_PATTERN.search(prompt):
             return PromptCostEstimator.PIPING_MULTIPLIER
         return 1
 
+    def _prompt_tokens(self, prompt: str) -> float:
+        return count_tokens(
+            prompt, inference_service=self.inference_service, model=self.model
+        ) * self.get_piping_multiplier(prompt)
+
     def __call__(self):
-        user_prompt_chars = len(str(self.user_prompt)) * self.get_piping_multiplier(
-            str(self.user_prompt)
+        # Counted with the service's tokenizer when one is installed, else 1 token per 4 characters
+        input_tokens = math.floor(
+            self._prompt_tokens(str(self.user_prompt))
+            + self._prompt_tokens(str(self.system_prompt))
         )
-        system_prompt_chars = len(str(self.system_prompt)) * self.get_piping_multiplier(
-            str(self.system_prompt)
-        )
-        # Convert into tokens (1 token approx. equals 4 characters)
-        input_tokens = (user_prompt_chars + system_prompt_chars) // self.CHARS_PER_TOKEN
         output_tokens = math.ceil(self.OUTPUT_TOKENS_PER_INPUT_TOKEN * input_tokens)
 
         relevant_prices = self.price_retriever.get_price(
@@ -110,7 +124,11 @@ class JobsPrompts:
     @classmethod
     def from_jobs(cls, jobs: "Jobs"):
         """Construct a JobsPrompts object from a Jobs object."""
-        interviews = jobs.interviews()
+        from .jobs_interview_constructor import InterviewsConstructor
+
+        # Interviews are built one at a time as the estimates iterate over them
+        jobs.replace_missing_objects()
+        interviews = InterviewsConstructor(jobs, cache=jobs.run_config.environment.cache)
         agents = jobs.agents
         scenarios = jobs.scenarios
         survey = jobs.survey
@@ -120,12 +138,16 @@ class JobsPrompts:
 
     def __init__(
         self,
-        interviews: List["Interview"],
+        interviews: Iterable["Interview"],
         agents: "AgentList",
         scenarios: "ScenarioList",
         survey: "Survey",
     ):
-        """Initialize with extracted components rather than a Jobs object."""
+        """Initialize with extracted components rather than a Jobs object.
+
+        interviews may be a lazy iterable such as an InterviewsConstructor;
+        it is iterated afresh by each estimate.
+        """
         self.interviews = interviews
         self.agents = agents
         self.scenarios = scenarios
@@ -292,7 +314,7 @@ class JobsPrompts:
         :param iterations: The number of times to iterate over the job.
 
         Key assumptions:
-        - 1 token = 4 characters.
+        - Tokens are counted with the service's tokenizer if installed, else 1 token = 4 characters.
         - For each prompt, output tokens = input tokens * 0.75, rounded up to the nearest integer.
         """
         # Collect all prompt data
@@ -377,7 +399,7 @@ class JobsPrompts:
         """
         Estimates the cost of a job according to the following assumptions:
 
-        - 1 token = 4 characters.
+        - Tokens are counted with the service's tokenizer if installed, else 1 token = 4 characters.
         - For each prompt, output tokens = input tokens * 0.75, rounded up to the nearest integer.
 
         Fetches prices from Coop.
@@ -56,7 +56,14 @@ if TYPE_CHECKING:
     from ..key_management import KeyLookup
 
 
-from ..utilities import sync_wrapper, jupyter_nb_handler, remove_edsl_version, dict_hash
+from ..utilities import (
+    sync_wrapper,
+    jupyter_nb_handler,
+    remove_edsl_version,
+    dict_hash,
+    cached_content_hash,
+    content_token,
+)
 from ..base import PersistenceMixin, RepresentationMixin, HashingMixin
 from ..key_management import KeyLookupCollection
 
@@ -161,6 +168,10 @@ class LanguageModel(
     DEFAULT_RPM = 100
     DEFAULT_TPM = 1000
 
+    # Futures for model calls currently in flight, keyed on (id(cache), cache_key).
+    # Shared by all models so identical concurrent requests are only sent once.
+    _in_flight_calls: dict = {}
+
     @classproperty
     def response_handler(cls):
         """Get a handler for processing raw model responses.
@@ -487,8 +498,21 @@ class LanguageModel(
             >>> m = LanguageModel.example()
             >>> hash(m)  # Actual value may vary
             325654563661254408
+
+        The hash is computed once and reused until the model or its
+        parameters change.
         """
-        return dict_hash(self.to_dict(add_edsl_version=False))
+        token = content_token(
+            (
+                self.model,
+                self.parameters,
+                self._inference_service_,
+                getattr(self, "canned_response", None),
+            )
+        )
+        return cached_content_hash(
+            self, token, lambda: dict_hash(self.to_dict(add_edsl_version=False))
+        )
 
     def __eq__(self, other) -> bool:
         """Check if two language model instances are functionally equivalent.
@@ -688,6 +712,59 @@ class LanguageModel(
         """
         return cls.response_handler.parse_response(raw_response)
 
+    def _cache_call_params(
+        self,
+        user_prompt: str,
+        system_prompt: str,
+        iteration: int = 0,
+        files_list: Optional[List["FileStore"]] = None,
+    ) -> dict:
+        """Return the arguments that identify a model call in the cache."""
+        # Add file hashes to the prompt if files are provided
+        if files_list:
+            files_hash = "+".join([str(hash(file)) for file in files_list])
+            user_prompt_with_hashes = user_prompt + f" {files_hash}"
+        else:
+            user_prompt_with_hashes = user_prompt
+
+        cache_parameters = self.parameters.copy()
+        if self.model == "test":
+            cache_parameters.pop("canned_response", None)
+        return {
+            "model": str(self.model),
+            "parameters": cache_parameters,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt_with_hashes,
+            "iteration": iteration,
+        }
+
+    def is_cached(
+        self,
+        user_prompt: str,
+        system_prompt: str,
+        cache: "Cache",
+        iteration: int = 0,
+        files_list: Optional[List["FileStore"]] = None,
+    ) -> bool:
+        """Check whether the response to a model call is already in the cache.
+
+        The lookup uses the same key as the call itself, so a True answer means
+        the call will be served from the cache without reaching the API.
+
+        Examples:
+            >>> from edsl import Cache
+            >>> m = LanguageModel.example(test_model=True)
+            >>> c = Cache()
+            >>> m.is_cached(user_prompt="Hello", system_prompt="hello", cache=c)
+            False
+            >>> _ = m._get_intended_model_call_outcome(user_prompt="Hello", system_prompt="hello", cache=c)
+            >>> m.is_cached(user_prompt="Hello", system_prompt="hello", cache=c)
+            True
+        """
+        return cache.contains(
+            **self._cache_call_params(user_prompt, system_prompt, iteration, files_list)
+        )
+
     async def _async_get_intended_model_call_outcome(
         self,
         user_prompt: str,
@@ -704,9 +781,14 @@ class LanguageModel(
         the complete workflow of:
         1. Creating a cache key from the prompts and parameters
         2. Checking if the response is already in the cache
-        3. Making the API call if needed
-        4. Storing new responses in the cache
-        5. Adding metadata like cost and cache status
+        3. Waiting on an identical in-flight call, if there is one
+        4. Making the API call if needed
+        5. Storing new responses in the cache
+        6. Adding metadata like cost and cache status
+
+        Concurrent callers that miss the cache with the same cache key share a
+        single API call: the first one makes the request and the others await
+        its result, receiving it as a cache hit.
 
         Args:
             user_prompt: The user's message or input prompt
@@ -725,27 +807,33 @@ class LanguageModel(
             >>> m._get_intended_model_call_outcome(user_prompt="Hello", system_prompt="hello", cache=Cache())
             ModelResponse(...)
         """
-        # Add file hashes to the prompt if files are provided
-        if files_list:
-            files_hash = "+".join([str(hash(file)) for file in files_list])
-            user_prompt_with_hashes = user_prompt + f" {files_hash}"
-        else:
-            user_prompt_with_hashes = user_prompt
-
         # Prepare parameters for cache lookup
-        cache_parameters = self.parameters.copy()
-        if self.model == "test":
-            cache_parameters.pop("canned_response", None)
-        cache_call_params = {
-            "model": str(self.model),
-            "parameters": cache_parameters,
-            "system_prompt": system_prompt,
-            "user_prompt": user_prompt_with_hashes,
-            "iteration": iteration,
-        }
+        cache_call_params = self._cache_call_params(
+            user_prompt, system_prompt, iteration, files_list
+        )
 
         # Try to fetch from cache
         cached_response, cache_key = cache.fetch(**cache_call_params)
+        in_flight_key = (id(cache), cache_key)
+        while cached_response is None and in_flight_key in self._in_flight_calls:
+            # An identical request is already in flight - wait for its response
+            pending = self._in_flight_calls[in_flight_key]
+            if pending.get_loop() is not asyncio.get_running_loop():
+                # Left behind by an event loop that stopped before the call finished
+                del self._in_flight_calls[in_flight_key]
+                break
+            try:
+                await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The original caller was cancelled, so try again ourselves
+                continue
+            cached_response, _ = cache.fetch(**cache_call_params)
+            if cached_response is None:
+                # Not written to cache.data yet (e.g. immediate_write=False)
+                cached_response = json.dumps(pending.result())
+
         if cache_used := cached_response is not None:
             # Cache hit - use the cached response
             response = json.loads(cached_response)
@@ -772,13 +860,32 @@ class LanguageModel(
 
             TIMEOUT = float(CONFIG.get("EDSL_API_TIMEOUT"))
 
-            # Execute the model call with timeout
-            response = await asyncio.wait_for(f(**params), timeout=TIMEOUT)
-            # Store the response in the cache
-            new_cache_key = cache.store(
-                **cache_call_params, response=response, service=self._inference_service_
-            )
-            assert new_cache_key == cache_key  # Verify cache key integrity
+            # Register this call so identical concurrent requests can await it
+            pending = asyncio.get_running_loop().create_future()
+            self._in_flight_calls[in_flight_key] = pending
+            try:
+                # Execute the model call with timeout
+                response = await asyncio.wait_for(f(**params), timeout=TIMEOUT)
+                # Store the response in the cache
+                new_cache_key = cache.store(
+                    **cache_call_params,
+                    response=response,
+                    service=self._inference_service_,
+                )
+                assert new_cache_key == cache_key  # Verify cache key integrity
+                pending.set_result(response)
+            except asyncio.CancelledError:
+                pending.cancel()
+                raise
+            except Exception as e:
+                pending.set_exception(e)
+                # Mark the exception as retrieved in case nobody else is waiting
+                pending.exception()
+                raise
+            finally:
+                # A newer call may have taken over the key if this one outlived its loop
+                if self._in_flight_calls.get(in_flight_key) is pending:
+                    del self._in_flight_calls[in_flight_key]
 
         # Calculate cost for the response
         cost = self.cost(response)
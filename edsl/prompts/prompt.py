@@ -44,10 +44,26 @@ def make_env() -> Environment:
     """
     return Environment(undefined=PreserveUndefined)
 
+# Shared environment used to compile templates. Captured variables are passed
+# to each render in its context rather than stored on the environment, so
+# compiled templates can be reused safely across renders and threads.
+_SHARED_ENV = make_env()
+
+_TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+def _is_plain_text(text: str) -> bool:
+    """True if Jinja would only normalize the text's newlines, not render anything.
+
+    >>> _is_plain_text("Hello, {person}")
+    True
+    >>> _is_plain_text("Hello, {{ person }}")
+    False
+    """
+    return "\r" not in text and not any(marker in text for marker in _TEMPLATE_MARKERS)
+
 @lru_cache(maxsize=1024)
 def _find_template_variables(template_text: str) -> List[str]:
-    env = make_env()
-    ast = env.parse(template_text)
+    ast = _SHARED_ENV.parse(template_text)
     return list(meta.find_undeclared_variables(ast))
 
 def _make_hashable(value):
@@ -58,11 +74,10 @@ def _make_hashable(value):
         return frozenset((k, _make_hashable(v)) for k, v in value.items())
     return value
 
-@lru_cache(maxsize=1024)
+@lru_cache(maxsize=4096)
 def _compile_template(text: str):
     """Compile a Jinja template with caching."""
-    env = make_env()
-    return env.from_string(text)
+    return _SHARED_ENV.from_string(text)
 
 @lru_cache(maxsize=1024)
 def _cached_render(text: str, frozen_replacements: frozenset) -> str:
@@ -310,16 +325,21 @@ class Prompt(PersistenceMixin, RepresentationMixin):
         if not all_replacements and not _find_template_variables(text):
             return text, template_vars.get_all()
 
-        env = make_env()
-        # Provide access to the 'vars' object inside the template.
-        env.globals['vars'] = template_vars
+        # Provide access to the 'vars' object inside the template;
+        # a replacement with the same name takes precedence.
+        context = {"vars": template_vars, **all_replacements}
 
         # Start with the original text
         current_text = text
 
         for _ in range(MAX_NESTING):
-            template = env.from_string(current_text)
-            rendered_text = template.render(**all_replacements)
+            if _is_plain_text(current_text):
+                # Each Jinja pass over plain text only strips one trailing
+                # newline, so skip straight to the fixed point.
+                return current_text.rstrip("\n"), template_vars.get_all()
+
+            template = _compile_template(current_text)
+            rendered_text = template.render(context)
 
             if rendered_text == current_text:
                 # No more changes, return final text with captured variables.
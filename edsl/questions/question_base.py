@@ -224,11 +224,37 @@ class QuestionBase(
               response_validator_class
             - The validator is responsible for ensuring responses conform to the expected
               format and constraints for this question type
+            - The validator is built once and reused until a validation-relevant
+              attribute of the question changes
+
+        Examples:
+            >>> from edsl.questions import QuestionMultipleChoice as Q
+            >>> q = Q.example()
+            >>> q.response_validator is q.response_validator
+            True
+            >>> v = q.response_validator
+            >>> q.question_options = ["Good", "Bad"]
+            >>> q.response_validator is v
+            False
         """
-        from .response_validator_factory import ResponseValidatorFactory
+        from .response_validator_factory import (
+            ResponseValidatorFactory,
+            validation_fingerprint,
+        )
+
+        fingerprint = validation_fingerprint(self)
+        cached = self.__dict__.get("_cached_validator")
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            validator = cached[1]
+            # validators keep the state of one validate() call; start each use afresh
+            validator.fixes_tried = 0
+            validator.original_exception = None
+            return validator
 
-        rvf = ResponseValidatorFactory(self)
-        return rvf.response_validator
+        validator = ResponseValidatorFactory(self).response_validator
+        if fingerprint is not None:
+            self.__dict__["_cached_validator"] = (fingerprint, validator)
+        return validator
 
     def duplicate(self) -> "QuestionBase":
         """
@@ -436,6 +462,7 @@ class QuestionBase(
             "question_type",
             # "_include_comment",
             "_fake_data_factory",
+            "_cached_validator",
             # "_use_code",
             "_model_instructions",
         ]
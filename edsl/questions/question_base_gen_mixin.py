@@ -26,6 +26,30 @@ class QuestionBaseGenMixin:
         """
         return copy.deepcopy(self)
 
+    def clone(self) -> QuestionBase:
+        """Return a cheap structural copy of the question.
+
+        The instance attributes are copied one level deep: top-level lists and
+        dicts (such as the question options) are new containers, so they can be
+        reassigned or changed on the clone without affecting the original, while
+        everything nested inside them is shared. Use copy() or duplicate() for a
+        fully independent question.
+
+        >>> from edsl.questions import QuestionMultipleChoice as Q
+        >>> q = Q.example()
+        >>> q2 = q.clone()
+        >>> q2 == q, q2 is q
+        (True, False)
+        >>> q2.question_options.append("Extra")
+        >>> len(q2.question_options) == len(q.question_options) + 1
+        True
+        """
+        new = copy.copy(self)
+        for key, value in self.__dict__.items():
+            if type(value) in (list, dict):
+                new.__dict__[key] = value.copy()
+        return new
+
     def option_permutations(self) -> list[QuestionBase]:
         """Return a list of questions with all possible permutations of the options.
 
@@ -62,11 +86,11 @@ class QuestionBaseGenMixin:
         """
 
         if not hasattr(self, "question_options"):
-            return copy.deepcopy(self)
+            return self.clone()
 
         import random
 
-        question = copy.deepcopy(self)
+        question = self.clone()
         question.question_options = list(
             random.sample(self.question_options, len(self.question_options))
         )
@@ -94,10 +94,9 @@ class QuestionBasePromptsMixin:
 
     @property
     def response_model(self) -> type["BaseModel"]:
-        if self._response_model is not None:
-            return self._response_model
-        else:
-            return self.create_response_model()
+        from .response_validator_factory import cached_response_model
+
+        return cached_response_model(self)
 
     @property
     def use_code(self) -> bool:
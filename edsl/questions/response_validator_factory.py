@@ -1,7 +1,93 @@
-from typing import Type, List
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Type, List
 from .data_structures import BaseModel
 from .response_validator_abc import ResponseValidatorABC
 
+# Attributes that only affect how a question is presented, never how its answers
+# are validated. Questions that differ only in these share a response model.
+_PRESENTATION_ATTRIBUTES = frozenset(
+    {
+        "_question_name",
+        "_question_text",
+        "_answering_instructions",
+        "_question_presentation",
+        "_model_instructions",
+        "_fake_data_factory",
+        "_cached_validator",
+        "answer",
+        "comment",
+    }
+)
+
+_RESPONSE_MODEL_CACHE: "OrderedDict[Hashable, Type[BaseModel]]" = OrderedDict()
+_RESPONSE_MODEL_CACHE_SIZE = 1024
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable stand-in for value that keeps 1, 1.0 and True apart."""
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
+
+
+def validation_fingerprint(question) -> Optional[Hashable]:
+    """Return a key that changes whenever a validation-relevant attribute changes.
+
+    Returns None if some attribute cannot be hashed, in which case nothing is cached.
+
+    >>> from edsl.questions import QuestionMultipleChoice as Q
+    >>> q = Q.example()
+    >>> validation_fingerprint(q) == validation_fingerprint(Q.example())
+    True
+    >>> before = validation_fingerprint(q)
+    >>> q.question_options = ["a", "b"]
+    >>> validation_fingerprint(q) == before
+    False
+    """
+    try:
+        return (
+            type(question),
+            tuple(
+                (key, _freeze(value))
+                for key, value in question.__dict__.items()
+                if key not in _PRESENTATION_ATTRIBUTES
+            ),
+        )
+    except TypeError:
+        return None
+
+
+def cached_response_model(question, fingerprint: Optional[Hashable] = None) -> Type[BaseModel]:
+    """Return the question's response model, building it only once per set of parameters.
+
+    Dynamically created pydantic models are shared by all questions with the same
+    validation-relevant parameters.
+
+    >>> from edsl.questions import QuestionMultipleChoice as Q
+    >>> cached_response_model(Q.example()) is cached_response_model(Q.example())
+    True
+    """
+    if question._response_model is not None:
+        return question._response_model
+    if fingerprint is None:
+        fingerprint = validation_fingerprint(question)
+        if fingerprint is None:
+            return question.create_response_model()
+    model = _RESPONSE_MODEL_CACHE.get(fingerprint)
+    if model is None:
+        model = question.create_response_model()
+        _RESPONSE_MODEL_CACHE[fingerprint] = model
+        if len(_RESPONSE_MODEL_CACHE) > _RESPONSE_MODEL_CACHE_SIZE:
+            _RESPONSE_MODEL_CACHE.popitem(last=False)
+    else:
+        _RESPONSE_MODEL_CACHE.move_to_end(fingerprint)
+    return model
+
 
 class ResponseValidatorFactory:
     """Factory class to create a response validator for a question."""
@@ -11,10 +97,7 @@ class ResponseValidatorFactory:
 
     @property
     def response_model(self) -> Type["BaseModel"]:
-        if self.question._response_model is not None:
-            return self.question._response_model
-        else:
-            return self.question.create_response_model()
+        return cached_response_model(self.question)
 
     @property
     def response_validator(self) -> "ResponseValidatorABC":
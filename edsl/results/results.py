@@ -58,9 +58,11 @@ if TYPE_CHECKING:
     from ..dataset import Dataset
 
 from ..utilities import remove_edsl_version, dict_hash
+from ..utilities.compiled_expression import CompiledExpression
 from ..dataset import ResultsOperationsMixin
 
 from .result import Result
+from .results_columns import ResultsColumns
 from ..db_list.sqlite_list import SQLiteList
 
 from .exceptions import (
@@ -204,6 +206,13 @@ class NotReadyObject:
         return self
 
 
+def _result_sort_key(result: "Result") -> tuple:
+    """Sort key used by Results.insert_sorted: 'order' if present, otherwise 'iteration'."""
+    if hasattr(result, "order"):
+        return (0, result.order)  # Order attribute takes precedence
+    return (1, result.data["iteration"])  # Iteration is secondary
+
+
 class Results(MutableSequence, ResultsOperationsMixin, Base):
     """A collection of Result objects with powerful data analysis capabilities.
 
@@ -275,6 +284,33 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
         "cache_keys",
     ]
 
+    @classmethod
+    def from_sink(cls, path: str, survey: Optional[Survey] = None) -> "Results":
+        """Load the Results streamed to a results sink file by a job.
+
+        Rows are read one at a time, in job order, into SQLite-backed storage,
+        so loading does not need memory for every Result at once.
+
+        Args:
+            path: A ``.jsonl`` or SQLite results sink file.
+            survey: The survey the results answer, if known.
+
+        >>> import os, tempfile
+        >>> from edsl.results.results_sink import open_results_sink
+        >>> path = os.path.join(tempfile.mkdtemp(), "results.jsonl")
+        >>> r = Results.example()
+        >>> with open_results_sink(path) as sink:
+        ...     for result in r:
+        ...         sink.write(result)
+        >>> Results.from_sink(path, survey=r.survey).select("how_feeling")
+        Dataset([{'answer.how_feeling': ['OK', 'Great', 'Terrible', 'OK']}])
+        """
+        from .results_sink import read_results_sink
+
+        results = cls(survey=survey, data=[], data_class=ResultsSQLList)
+        results.extend(read_results_sink(path))
+        return results
+
     @classmethod
     def from_job_info(cls, job_info: dict) -> "Results":
         """Instantiate a Results object from a job info dictionary.
@@ -359,6 +395,13 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
         # Initialize data with the appropriate class
         self.data = self._data_class(data or [])
 
+        # Sort keys parallel to self.data, built lazily by insert_sorted
+        self._sort_keys = None
+        # Set when results were added with insert_sorted(..., defer_sort=True)
+        self._sort_pending = False
+        # Per-column value lists parallel to self.data, built lazily by _fetch_list
+        self._columns = ResultsColumns()
+
         from ..caching import Cache
         from ..tasks import TaskHistory
         import tempfile
@@ -387,7 +430,9 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
     def _fetch_list(self, data_type: str, key: str) -> list:
         """Return a list of values from the data for a given data type and key.
 
-        Uses the filtered data, not the original data.
+        Uses the filtered data, not the original data. Columns are cached
+        between calls and kept up to date as results are inserted, so repeated
+        selections of the same column do not walk every Result again.
 
         Args:
             data_type: The type of data to fetch (e.g., 'answer', 'agent', 'scenario').
@@ -405,11 +450,7 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
             >>> all(isinstance(v, (str, type(None))) for v in values)
             True
         """
-        returned_list = []
-        for row in self.data:
-            returned_list.append(row.sub_dicts[data_type].get(key, None))
-
-        return returned_list
+        return list(self._columns.column(self.data, data_type, key))
 
     def get_answers(self, question_name: str) -> list:
         """Get the answers for a given question name.
@@ -546,6 +587,8 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
         # Clear and refill with sorted items
         self.data.clear()
         self.data.extend(all_items)
+        self._sort_keys = None
+        self._columns.clear()
 
     def compute_job_cost(self, include_cached_responses_in_cost: bool = False) -> float:
         """Compute the cost of a completed job in USD.
@@ -621,10 +664,14 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
     @ensure_ready
     def __setitem__(self, i, item):
         self.data[i] = item
+        self._sort_keys = None
+        self._columns.clear()
 
     @ensure_ready
     def __delitem__(self, i):
         del self.data[i]
+        self._sort_keys = None
+        self._columns.clear()
 
     @ensure_ready
     def __len__(self):
@@ -633,11 +680,15 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
     @ensure_ready
     def insert(self, index, item):
         self.data.insert(index, item)
+        self._sort_keys = None
+        self._columns.insert(index, item)
 
     @ensure_ready
     def extend(self, other):
         """Extend the Results list with items from another iterable."""
         self.data.extend(other)
+        self._sort_keys = None
+        self._columns.clear()
 
     @ensure_ready
     def extend_sorted(self, other):
@@ -661,6 +712,8 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
         # Clear and refill with sorted items
         self.data.clear()
         self.data.extend(all_items)
+        self._sort_keys = None
+        self._columns.clear()
 
     def __add__(self, other: Results) -> Results:
         """Add two Results objects together.
@@ -1603,19 +1656,23 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
             except (ValueError, TypeError):
                 return v
 
-        def sort_key(item):
-            key_components = []
-            for col in columns:
-                data_type, key = self._parse_column(col)
-                value = item.get_value(data_type, key)
-                if isinstance(value, (str, bytes)):
-                    key_components.append(str(value))
-                else:
-                    key_components.append(to_numeric_if_possible(value))
-            return tuple(key_components)
+        def sort_value(value):
+            if isinstance(value, (str, bytes)):
+                return str(value)
+            return to_numeric_if_possible(value)
+
+        # Build the sort keys column by column from the cached columns
+        rows = list(self.data)
+        key_columns = []
+        for col in columns:
+            data_type, key = self._parse_column(col)
+            key_columns.append(
+                [sort_value(v) for v in self._columns.column(self.data, data_type, key)]
+            )
+        keys = list(zip(*key_columns)) if key_columns else [()] * len(rows)
 
-        # Create a new sorted view of the data without materializing it
-        sorted_data = sorted(self.data, key=sort_key, reverse=reverse)
+        order = sorted(range(len(rows)), key=keys.__getitem__, reverse=reverse)
+        sorted_data = [rows[i] for i in order]
 
         # Create new Results object that uses the sorted iterator
         return Results(
@@ -1735,23 +1792,29 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
             )
 
         try:
-            # Create new Results object with same class as original but empty data
+            # Parse the expression once and evaluate it against each result's names
+            predicate = CompiledExpression(
+                normalized_expression, functions={"int": int, "float": float}
+            )
+
+            matching = []
+            checked_problem_keys = set()
+            for result in self.data:
+                problem_keys = tuple(result.problem_keys)
+                if problem_keys not in checked_problem_keys:
+                    result.check_expression(normalized_expression)  # check expression
+                    checked_problem_keys.add(problem_keys)
+                if predicate(result.combined_dict):
+                    matching.append(result)
+
+            # Create new Results object with same class as original
             filtered_results = Results(
                 survey=self.survey,
-                data=[],  # Empty data list
+                data=matching,
                 created_columns=self.created_columns,
                 data_class=self._data_class,  # Preserve the original data class
             )
 
-            # Process one result at a time
-            for result in self.data:
-                evaluator = self._create_evaluator(result)
-                result.check_expression(normalized_expression)  # check expression
-                if evaluator.eval(normalized_expression):
-                    filtered_results.append(
-                        result
-                    )  # Use append method to add matching results
-
             if len(filtered_results) == 0:
                 import warnings
 
@@ -1882,6 +1945,8 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
 
             # Update this instance with remote data
             self.data = remote_results.data
+            self._sort_keys = None
+            self._columns.clear()
             self.survey = remote_results.survey
             self.created_columns = remote_results.created_columns
             self.cache = remote_results.cache
@@ -2071,39 +2136,71 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
         return self._shelf_keys.copy()
 
     @ensure_ready
-    def insert_sorted(self, item: "Result") -> None:
+    def insert_sorted(self, item: "Result", defer_sort: bool = False) -> None:
         """Insert a Result object into the Results list while maintaining sort order.
 
         Uses the 'order' attribute if present, otherwise falls back to 'iteration' attribute.
-        Utilizes bisect for efficient insertion point finding.
+        A list of sort keys parallel to the data is kept between calls, so each insert
+        only costs a bisect instead of recomputing every key.
+
+        With defer_sort=True, the item is simply appended and sorting is postponed
+        until finalize_sort() is called (or the next non-deferred insert). This is the
+        cheapest way to collect many results that arrive out of order.
 
         Args:
             item: A Result object to insert
+            defer_sort: Append now and sort once later
 
         Examples:
             >>> r = Results.example()
             >>> new_result = r[0].copy()
             >>> new_result.order = 1.5  # Insert between items
             >>> r.insert_sorted(new_result)
-        """
-        from bisect import bisect_left
-
-        def get_sort_key(result):
-            if hasattr(result, "order"):
-                return (0, result.order)  # Order attribute takes precedence
-            return (1, result.data["iteration"])  # Iteration is secondary
 
-        # Get the sort key for the new item
-        item_key = get_sort_key(item)
+            >>> r = Results(survey=r.survey, data=[])
+            >>> for order in [2, 0, 1]:
+            ...     item = new_result.copy()
+            ...     item.order = order
+            ...     r.insert_sorted(item, defer_sort=True)
+            >>> [x.order for x in r]
+            [2, 0, 1]
+            >>> r.finalize_sort()
+            >>> [x.order for x in r]
+            [0, 1, 2]
+        """
+        if defer_sort:
+            self.data.append(item)
+            self._columns.append(item)
+            self._sort_pending = True
+            return
 
-        # Get list of sort keys for existing items
-        keys = [get_sort_key(x) for x in self.data]
+        self.finalize_sort()
+        keys = self._sort_keys
+        if keys is None or len(keys) != len(self.data):
+            keys = self._sort_keys = [_result_sort_key(x) for x in self.data]
 
         # Find insertion point
+        item_key = _result_sort_key(item)
         index = bisect_left(keys, item_key)
 
         # Insert at the found position
         self.data.insert(index, item)
+        keys.insert(index, item_key)
+        self._columns.insert(index, item)
+
+    def finalize_sort(self) -> None:
+        """Sort results added with insert_sorted(..., defer_sort=True) in one pass.
+
+        Does nothing if there is nothing pending.
+        """
+        if not self._sort_pending:
+            return
+        sorted_items = sorted(self.data, key=_result_sort_key)
+        self.data.clear()
+        self.data.extend(sorted_items)
+        self._sort_keys = [_result_sort_key(x) for x in self.data]
+        self._columns.clear()
+        self._sort_pending = False
 
     def insert_from_shelf(self) -> None:
         """Move all shelved results into memory using insert_sorted method.
@@ -2129,7 +2226,8 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
                 for key in self._shelf_keys:
                     result_dict = shelf[key]
                     result = Result.from_dict(result_dict)
-                    self.insert_sorted(result)
+                    self.insert_sorted(result, defer_sort=True)
+                self.finalize_sort()
 
                 # Now clear the shelf
                 for key in self._shelf_keys:
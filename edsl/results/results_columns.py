@@ -0,0 +1,81 @@
+"""
+Columnar view of the data held by a Results object.
+
+Selecting a column from Results means visiting every Result and looking the
+value up in its sub-dictionaries. ResultsColumns keeps the values of each
+(data_type, key) column it has been asked for in a list parallel to the
+Results data, so later selections, tallies and sorts on that column read the
+list directly. Columns are built lazily, one at a time, and are kept in step
+with inserts and appends; any other change to the data drops them.
+
+Result objects are treated as immutable once they are in a Results object:
+changing a Result in place is not reflected in columns already built.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .result import Result
+
+
+class ResultsColumns:
+    """
+    Lazily built per-(data_type, key) value lists parallel to a list of Results.
+
+    >>> from edsl.results import Results
+    >>> r = Results.example()
+    >>> columns = ResultsColumns()
+    >>> columns.column(r.data, "answer", "how_feeling")
+    ['OK', 'Great', 'Terrible', 'OK']
+    >>> columns.insert(0, r.data[1])
+    >>> columns.column(r.data, "answer", "how_feeling") is columns.column(r.data, "answer", "how_feeling")
+    True
+    >>> len(columns)
+    1
+    """
+
+    def __init__(self):
+        self._columns: Dict[Tuple[str, str], List[Any]] = {}
+
+    @staticmethod
+    def _value(result: "Result", data_type: str, key: str) -> Any:
+        return result.sub_dicts[data_type].get(key, None)
+
+    def column(self, rows: Sequence["Result"], data_type: str, key: str) -> List[Any]:
+        """Return the values of a column, building it from the rows if needed.
+
+        The returned list is owned by the column store and must not be modified.
+        A column whose length does not match the rows (because the data was
+        changed behind the store's back) is rebuilt.
+        """
+        column = self._columns.get((data_type, key))
+        if column is None or len(column) != len(rows):
+            value = self._value
+            column = [value(row, data_type, key) for row in rows]
+            self._columns[(data_type, key)] = column
+        return column
+
+    def insert(self, index: int, item: "Result") -> None:
+        """Insert the values of a new Result into every column built so far."""
+        for (data_type, key), column in self._columns.items():
+            column.insert(index, self._value(item, data_type, key))
+
+    def append(self, item: "Result") -> None:
+        """Append the values of a new Result to every column built so far."""
+        for (data_type, key), column in self._columns.items():
+            column.append(self._value(item, data_type, key))
+
+    def clear(self) -> None:
+        """Drop all columns; they are rebuilt on demand."""
+        self._columns.clear()
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
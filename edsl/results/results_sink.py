@@ -0,0 +1,331 @@
+"""
+Append-only files that receive Result objects as a job produces them.
+
+A job run with ``results_sink=<path>`` writes each Result to the sink as soon
+as its interview finishes instead of holding every Result in memory until the
+job ends. Every row is on disk the moment it is written, so an interrupted job
+keeps everything it finished, and rows can be read back lazily, one Result at
+a time, in job order.
+
+Two formats are supported, chosen from the file extension:
+
+- ``.jsonl`` / ``.ndjson``: one ``Result.to_dict()`` JSON object per line
+- ``.db`` / ``.sqlite`` / ``.sqlite3``: an SQLite table with one row per Result
+
+Opening a sink on an existing file appends to it. Iterating over a sink yields
+only the rows written through it; ``read_results_sink`` yields every row in
+the file.
+
+Each row records the hash of the interview that produced it, so a sink file
+also serves as a checkpoint: ``Jobs.run(resume_from=<path>)`` skips the
+interviews already in the file and returns their stored rows alongside the
+new ones. A checkpoint that does not exist yet counts as empty, so the same
+path can be given as both ``results_sink`` and ``resume_from`` from the first
+run on.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterator, Optional, Set, Tuple, Type, Union
+
+from .exceptions import ResultsError
+
+if TYPE_CHECKING:
+    from .result import Result
+
+
+def _sort_key(record: dict) -> Tuple[int, float]:
+    """Sort key of a serialized Result, matching Results.insert_sorted."""
+    if "order" in record:
+        return (0, record["order"])
+    return (1, record["iteration"])
+
+
+def _result_from_record(record: dict) -> "Result":
+    from .result import Result
+
+    return Result.from_dict(record)
+
+
+class ResultsSink(ABC):
+    """An append-only file that Result objects are streamed to."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = os.fspath(path)
+
+    @abstractmethod
+    def write(self, result: "Result") -> None:
+        """Append a Result; it is on disk when this returns."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the file. Rows already written stay readable."""
+
+    @classmethod
+    @abstractmethod
+    def read(cls, path: str, after: Optional[int] = None) -> Iterator["Result"]:
+        """Yield the Results stored in the file in job order, one at a time.
+
+        ``after`` is a position returned by a sink's ``start`` attribute; only
+        rows written after it are read.
+        """
+
+    @classmethod
+    @abstractmethod
+    def interview_hashes(cls, path: str) -> Set[int]:
+        """Return the interview hashes of the rows stored in the file."""
+
+    def __iter__(self) -> Iterator["Result"]:
+        """Yield the Results written through this sink, in job order."""
+        return self.read(self.path, after=self.start)
+
+    def __enter__(self) -> "ResultsSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r})"
+
+
+class JSONLResultsSink(ResultsSink):
+    """
+    Results sink writing one JSON object per line.
+
+    >>> import os, tempfile
+    >>> from edsl.results import Results
+    >>> path = os.path.join(tempfile.mkdtemp(), "results.jsonl")
+    >>> r = Results.example()
+    >>> with JSONLResultsSink(path) as sink:
+    ...     for order, result in reversed(list(enumerate(r))):
+    ...         result.order = order
+    ...         sink.write(result)
+    >>> [x.answer["how_feeling"] for x in read_results_sink(path)]
+    ['OK', 'Great', 'Terrible', 'OK']
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        super().__init__(path)
+        self._file = open(self.path, "ab")
+        self.start = self._file.tell()
+        if self.start > 0:
+            with open(self.path, "rb") as f:
+                f.seek(self.start - 1)
+                last = f.read(1)
+            if last != b"\n":
+                # Isolate a line left incomplete by an interrupted run
+                self._file.write(b"\n")
+                self._file.flush()
+                self.start += 1
+
+    def write(self, result: "Result") -> None:
+        line = json.dumps(result.to_dict(include_cache_info=True)).encode("utf-8")
+        self._file.write(line + b"\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    @staticmethod
+    def _parse(line: bytes) -> Optional[dict]:
+        """Return the record on a line, or None for a line cut short by an interruption."""
+        if not line.endswith(b"\n"):
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    @classmethod
+    def read(cls, path: str, after: Optional[int] = None) -> Iterator["Result"]:
+        with open(path, "rb") as f:
+            f.seek(after or 0)
+            # First pass: note where each row is and where it sorts
+            index = []
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                record = cls._parse(line)
+                if record is not None:
+                    index.append((_sort_key(record), len(index), offset))
+            index.sort()
+
+            # Second pass: load the rows one at a time in job order
+            for _, _, offset in index:
+                f.seek(offset)
+                yield _result_from_record(json.loads(f.readline()))
+
+    @classmethod
+    def interview_hashes(cls, path: str) -> Set[int]:
+        hashes = set()
+        with open(path, "rb") as f:
+            for line in f:
+                record = cls._parse(line)
+                if record is not None and "interview_hash" in record:
+                    hashes.add(record["interview_hash"])
+        return hashes
+
+
+class SQLiteResultsSink(ResultsSink):
+    """
+    Results sink writing one row per Result to an SQLite database.
+
+    Each Result is committed as it is written. The table also records the
+    interview hash of each row so completed interviews can be looked up
+    without loading the Results.
+
+    >>> import os, tempfile
+    >>> from edsl.results import Results
+    >>> path = os.path.join(tempfile.mkdtemp(), "results.db")
+    >>> r = Results.example()
+    >>> with SQLiteResultsSink(path) as sink:
+    ...     for order, result in reversed(list(enumerate(r))):
+    ...         result.order = order
+    ...         sink.write(result)
+    >>> [x.answer["how_feeling"] for x in read_results_sink(path)]
+    ['OK', 'Great', 'Terrible', 'OK']
+    """
+
+    _TABLE_NAME = "results"
+
+    @classmethod
+    def _has_table(cls, conn: sqlite3.Connection) -> bool:
+        return (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (cls._TABLE_NAME,),
+            ).fetchone()
+            is not None
+        )
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        super().__init__(path)
+        self.conn = sqlite3.connect(self.path)
+        # Durable against a crashed process without an fsync per row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "sort_group INTEGER, sort_value REAL, interview_hash, value TEXT)"
+            )
+        self.start = self.conn.execute(
+            f"SELECT COALESCE(MAX(seq), 0) FROM {self._TABLE_NAME}"
+        ).fetchone()[0]
+
+    def write(self, result: "Result") -> None:
+        record = result.to_dict(include_cache_info=True)
+        sort_group, sort_value = _sort_key(record)
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO {self._TABLE_NAME} "
+                "(sort_group, sort_value, interview_hash, value) VALUES (?, ?, ?, ?)",
+                (sort_group, sort_value, record.get("interview_hash"), json.dumps(record)),
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @classmethod
+    def read(cls, path: str, after: Optional[int] = None) -> Iterator["Result"]:
+        conn = sqlite3.connect(path)
+        try:
+            if not cls._has_table(conn):
+                return
+            cursor = conn.execute(
+                f"SELECT value FROM {cls._TABLE_NAME} WHERE seq > ? "
+                "ORDER BY sort_group, sort_value, seq",
+                (after or 0,),
+            )
+            for (value,) in cursor:
+                yield _result_from_record(json.loads(value))
+        finally:
+            conn.close()
+
+    @classmethod
+    def interview_hashes(cls, path: str) -> Set[int]:
+        conn = sqlite3.connect(path)
+        try:
+            if not cls._has_table(conn):
+                return set()
+            cursor = conn.execute(
+                f"SELECT interview_hash FROM {cls._TABLE_NAME} "
+                "WHERE interview_hash IS NOT NULL"
+            )
+            return {interview_hash for (interview_hash,) in cursor}
+        finally:
+            conn.close()
+
+
+_SINK_CLASSES = {
+    ".jsonl": JSONLResultsSink,
+    ".ndjson": JSONLResultsSink,
+    ".db": SQLiteResultsSink,
+    ".sqlite": SQLiteResultsSink,
+    ".sqlite3": SQLiteResultsSink,
+}
+
+
+def _sink_class(path: Union[str, os.PathLike]) -> Type[ResultsSink]:
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    try:
+        return _SINK_CLASSES[extension]
+    except KeyError:
+        raise ResultsError(
+            f"Cannot tell the results sink format from '{os.fspath(path)}'. "
+            f"Use one of these extensions: {', '.join(_SINK_CLASSES)}."
+        ) from None
+
+
+def open_results_sink(path: Union[str, os.PathLike]) -> ResultsSink:
+    """Open a sink for appending Results, choosing the format from the extension.
+
+    >>> open_results_sink("results.csv")  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ...
+    edsl.results.exceptions.ResultsError: ...
+    """
+    return _sink_class(path)(path)
+
+
+def read_results_sink(path: Union[str, os.PathLike]) -> Iterator["Result"]:
+    """Yield every Result stored in a sink file, in job order, one at a time.
+
+    A file that does not exist holds no Results.
+
+    >>> list(read_results_sink("no-such-checkpoint.db"))
+    []
+    """
+    sink_class = _sink_class(path)
+    if not os.path.exists(path):
+        return iter(())
+    return sink_class.read(os.fspath(path))
+
+
+def read_interview_hashes(path: Union[str, os.PathLike]) -> Set[int]:
+    """Return the hashes of the interviews whose Results are stored in a sink file.
+
+    A job resumed from the file skips these interviews. A file that does not
+    exist, as on the first run of a job that checkpoints to it, holds none.
+
+    >>> read_interview_hashes("no-such-checkpoint.jsonl")
+    set()
+    """
+    sink_class = _sink_class(path)
+    if not os.path.exists(path):
+        return set()
+    return sink_class.interview_hashes(os.fspath(path))
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
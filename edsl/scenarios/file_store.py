@@ -17,6 +17,12 @@ from .file_methods import FileMethods
 if TYPE_CHECKING:
     from .scenario_list import ScenarioList
 
+# Image dimensions and video metadata by (kind, content hash of the file).
+# Decoding an image or probing a video costs far more than the hash, which
+# FileStore caches, and the same file is typically measured once per interview.
+_MEDIA_METADATA: Dict[tuple, object] = {}
+_MEDIA_METADATA_MAX_ENTRIES = 1024
+
 
 class FileStore(Scenario):
     """
@@ -648,6 +654,23 @@ class FileStore(Scenario):
         if not self.is_video():
             raise ValueError("This file is not a video")
 
+        import copy
+
+        # Callers get their own copy, as the metadata is a nested dict
+        return copy.deepcopy(
+            self._memoized_media_metadata("video", self._probe_video_metadata)
+        )
+
+    def _memoized_media_metadata(self, kind: str, compute):
+        """Return compute(), reusing the result for files with the same content."""
+        key = (kind, hash(self))
+        if key not in _MEDIA_METADATA:
+            if len(_MEDIA_METADATA) >= _MEDIA_METADATA_MAX_ENTRIES:
+                _MEDIA_METADATA.pop(next(iter(_MEDIA_METADATA)))
+            _MEDIA_METADATA[key] = compute()
+        return _MEDIA_METADATA[key]
+
+    def _probe_video_metadata(self) -> dict:
         # We'll try to use ffprobe (part of ffmpeg) to get metadata
         import subprocess
         import json
@@ -738,6 +761,8 @@ class FileStore(Scenario):
         Raises:
             ValueError: If the file is not an image or PIL is not installed.
 
+        The image is decoded once; files with the same content reuse the result.
+
         Examples:
             >>> fs = FileStore.example("png")
             >>> width, height = fs.get_image_dimensions()
@@ -747,6 +772,9 @@ class FileStore(Scenario):
         if not self.is_image():
             raise ValueError("This file is not an image")
 
+        return self._memoized_media_metadata("image", self._read_image_dimensions)
+
+    def _read_image_dimensions(self) -> tuple:
         try:
             from PIL import Image
         except ImportError:
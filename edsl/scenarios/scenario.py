@@ -300,10 +300,20 @@ class Scenario(Base, UserDict):
         >>> s = Scenario({"food": "wood chips"})
         >>> hash(s)
         1153210385458344214
+
+        The hash is computed once and reused until the scenario's content changes.
+
+        >>> s["food"] = "bark"
+        >>> hash(s) == hash(Scenario({"food": "bark"}))
+        True
         """
-        from edsl.utilities.utilities import dict_hash
+        from ..utilities import cached_content_hash, content_token, dict_hash
 
-        return dict_hash(self.to_dict(add_edsl_version=False))
+        return cached_content_hash(
+            self,
+            content_token(self.data),
+            lambda: dict_hash(self.to_dict(add_edsl_version=False)),
+        )
 
     def __repr__(self):
         return "Scenario(" + repr(self.data) + ")"
@@ -66,6 +66,7 @@ from ..utilities import (
     dict_hash,
     memory_profile,
 )
+from ..utilities.compiled_expression import CompiledExpression
 from ..dataset import ScenarioListOperationsMixin
 
 from ..db_list.sqlite_list import SQLiteList
@@ -957,22 +958,16 @@ class ScenarioList(MutableSequence, Base, ScenarioListOperationsMixin):
         # Create new ScenarioList with filtered data
         new_sl = ScenarioList(data=[], codebook=self.codebook)
 
-        def create_evaluator(scenario: Scenario):
-            """Create an evaluator for the given scenario."""
-            return EvalWithCompoundTypes(names=scenario)
-
         try:
-            # Process one scenario at a time to minimize memory usage
-            for scenario in self:
-                # Check if scenario matches the filter expression
-                if create_evaluator(scenario).eval(expression):
-                    # Create a copy and immediately append to the new list
-                    scenario_copy = scenario.copy()
-                    new_sl.append(scenario_copy)
-                    
-                    # Remove reference to allow for garbage collection
-                    del scenario_copy
-                
+            # Parse the expression once, then evaluate it against each scenario
+            predicate = CompiledExpression(expression)
+
+            # Stream copies of the matching scenarios into the new list in a
+            # single batch, holding one scenario at a time to minimize memory usage
+            new_sl.data.extend(
+                scenario.copy() for scenario in self if predicate(scenario)
+            )
+
         except NameNotDefined as e:
             # Get available fields for error message
             try:
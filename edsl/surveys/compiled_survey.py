@@ -0,0 +1,212 @@
+"""
+Per-survey structures that are shared by every interview of a job.
+
+Running a job creates one Interview per agent/scenario/model combination, and
+each of those needs the same survey-level lookups: the question-name index,
+the dependency DAG used to order question tasks, the skip-logic rules that
+apply at each question and the memory plan. CompiledSurvey computes these once
+from a Survey so interviews can reference them instead of rebuilding them.
+
+A CompiledSurvey is a snapshot: it does not track later edits to the survey it
+was built from. Randomizing question options with Survey.draw() does not
+change any of the compiled structures, so one CompiledSurvey can serve every
+drawn copy of a survey.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping, Tuple, Union
+
+from .rules.rule_collection import NextQuestion
+from .exceptions import SurveyRuleCollectionHasNoRulesAtNodeError
+
+if TYPE_CHECKING:
+    from .survey import Survey
+    from .memory import MemoryPlan
+    from .rules import Rule
+    from ..prompts import Prompt
+
+
+class CompiledMemoryPlan:
+    """
+    Read-only view of a MemoryPlan with the prompt fragments laid out per question.
+
+    It exposes the parts of the MemoryPlan interface used while answering
+    questions, so it can be handed to invigilators in place of the plan.
+
+    >>> from edsl.surveys.memory import MemoryPlan
+    >>> mp = CompiledMemoryPlan(MemoryPlan.example())
+    >>> "q1" in mp, "q2" in mp
+    (True, False)
+    >>> mp.get_memory_prompt_fragment("q1", {"q0": "yes"}).text == MemoryPlan.example().get_memory_prompt_fragment("q1", {"q0": "yes"}).text
+    True
+    """
+
+    _BASE_PROMPT_TEXT = """
+        Before the question you are now answering, you already answered the following question(s):
+        """
+
+    def __init__(self, memory_plan: "MemoryPlan"):
+        self.source = memory_plan
+        name_to_text = memory_plan.name_to_text
+        self._question_names = frozenset(name_to_text)
+        self._fragments: Mapping[str, Tuple[Tuple[str, str], ...]] = MappingProxyType(
+            {
+                focal_question: tuple(
+                    (prior_question, f"\tQuestion: {name_to_text[prior_question]}\n\tAnswer: ")
+                    for prior_question in memory
+                )
+                for focal_question, memory in memory_plan.items()
+            }
+        )
+
+    def __contains__(self, focal_question: str) -> bool:
+        return focal_question in self._fragments
+
+    def get_memory_prompt_fragment(self, focal_question: str, answers: dict) -> "Prompt":
+        """Return the same fragment as MemoryPlan.get_memory_prompt_fragment."""
+        from ..prompts import Prompt
+
+        if focal_question not in self._question_names:
+            self.source._check_valid_question_name(focal_question)
+
+        lines = [
+            f"{head}{answers.get(prior_question, None)}\n"
+            for prior_question, head in self._fragments.get(focal_question, ())
+        ]
+        if lines:
+            return Prompt(
+                self._BASE_PROMPT_TEXT + "\n Prior questions and answers:".join(lines)
+            )
+        return Prompt("")
+
+    def to_dict(self, add_edsl_version: bool = True) -> dict:
+        return self.source.to_dict(add_edsl_version=add_edsl_version)
+
+    def __repr__(self) -> str:
+        return repr(self.source)
+
+
+class CompiledSurvey:
+    """
+    Immutable, precomputed structure of a Survey shared across interviews.
+
+    >>> from edsl.surveys import Survey
+    >>> cs = CompiledSurvey(Survey.example())
+    >>> cs.question_names
+    ('q0', 'q1', 'q2')
+    >>> dict(cs.question_name_to_index)
+    {'q0': 0, 'q1': 1, 'q2': 2}
+    >>> sorted((k, sorted(v)) for k, v in cs.dag.items())
+    [('q1', ['q0']), ('q2', ['q0'])]
+    >>> cs.topological_order[0]
+    'q0'
+    >>> cs.next_question(0, {"q0.answer": "yes"}).next_q
+    2
+    >>> cs.skip_question_before_running(1, {})
+    False
+    """
+
+    __slots__ = (
+        "question_names",
+        "question_name_to_index",
+        "dag",
+        "parents",
+        "topological_order",
+        "before_rules",
+        "after_rules",
+        "memory_plan",
+    )
+
+    def __init__(self, survey: "Survey"):
+        question_names = tuple(survey.question_names)
+        dag = survey.dag(textify=True)
+
+        rules_by_question: dict = {}
+        for rule in survey.rule_collection:
+            rules_by_question.setdefault((rule.current_q, rule.before_rule), []).append(rule)
+
+        def rule_table(before_rule: bool) -> Mapping[Any, Tuple["Rule", ...]]:
+            return MappingProxyType(
+                {
+                    current_q: tuple(rules)
+                    for (current_q, is_before), rules in rules_by_question.items()
+                    if is_before == before_rule
+                }
+            )
+
+        set_ = object.__setattr__
+        to_index = {name: i for i, name in enumerate(question_names)}
+        set_(self, "question_names", question_names)
+        set_(self, "question_name_to_index", MappingProxyType(to_index))
+        set_(self, "dag", dag)
+        set_(
+            self,
+            "parents",
+            MappingProxyType(
+                {
+                    name: tuple(sorted(dag.get(name, ()), key=to_index.__getitem__))
+                    for name in question_names
+                }
+            ),
+        )
+        set_(self, "topological_order", tuple(dag.topologically_sorted_nodes()))
+        set_(self, "before_rules", rule_table(True))
+        set_(self, "after_rules", rule_table(False))
+        set_(self, "memory_plan", CompiledMemoryPlan(survey.memory_plan))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __copy__(self) -> "CompiledSurvey":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "CompiledSurvey":
+        return self
+
+    def __len__(self) -> int:
+        return len(self.question_names)
+
+    def skip_question_before_running(self, q_now: int, answers: dict) -> bool:
+        """Same as RuleCollection.skip_question_before_running, using the rule table."""
+        for rule in self.before_rules.get(q_now, ()):
+            if rule.evaluate(answers):
+                return True
+        return False
+
+    def next_question(self, q_now: Union[int, Any], answers: dict) -> NextQuestion:
+        """Same as RuleCollection.next_question, using the rule tables."""
+        expressions_evaluating_to_true = 0
+        next_q = None
+        highest_priority = -2
+        num_rules_found = 0
+
+        for rule in self.after_rules.get(q_now, ()):
+            num_rules_found += 1
+            if rule.evaluate(answers):
+                expressions_evaluating_to_true += 1
+                if rule.priority > highest_priority:
+                    next_q, highest_priority = rule.next_q, rule.priority
+
+        if num_rules_found == 0:
+            raise SurveyRuleCollectionHasNoRulesAtNodeError(
+                f"No rules found for question {q_now}"
+            )
+
+        for rule in self.before_rules.get(next_q, ()):
+            if rule.evaluate(answers):
+                return self.next_question(next_q, answers)
+
+        return NextQuestion(
+            next_q, num_rules_found, expressions_evaluating_to_true, highest_priority
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(question_names={list(self.question_names)!r})"
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -261,16 +261,14 @@ class Survey(Base):
         if len(self.questions_to_randomize) == 0:
             return self
 
-        new_questions = []
-        for question in self.questions:
-            if question.question_name in self.questions_to_randomize:
-                new_questions.append(question.draw())
-            else:
-                new_questions.append(question.duplicate())
-
-        d = self.to_dict()
-        d["questions"] = [q.to_dict() for q in new_questions]
-        return Survey.from_dict(d)
+        drawn = {
+            question.question_name: question.draw()
+            for question in self.questions
+            if question.question_name in self.questions_to_randomize
+        }
+        new_survey = self.clone(questions=drawn)
+        new_survey._seed = None
+        return new_survey
 
     def _process_raw_questions(self, questions: Optional[List["QuestionType"]]) -> list:
         """Process the raw questions passed to the survey."""
@@ -1316,6 +1314,50 @@ class Survey(Base):
         """
         return Survey.from_dict(self.to_dict())
 
+    def clone(
+        self, questions: Optional[dict[str, "QuestionBase"]] = None
+    ) -> "Survey":
+        """Return a structural copy of the survey that shares its questions.
+
+        Unlike duplicate(), nothing is serialized or re-validated. The new survey
+        gets its own question list, rule collection, memory plan and groups, so
+        adding or removing questions and rules on it leaves the original alone,
+        but the question objects themselves are shared by reference. Questions
+        that are going to be changed should be cloned and passed in ``questions``,
+        a mapping of question names to the replacement questions.
+
+        >>> s = Survey.example()
+        >>> s2 = s.clone()
+        >>> s2 == s, s2 is s, s2.questions[0] is s.questions[0]
+        (True, False, True)
+        >>> s3 = s.clone(questions={"q0": s.questions[0].draw()})
+        >>> s3.questions[0] is s.questions[0], s3.questions[1] is s.questions[1]
+        (False, True)
+        """
+        import copy
+
+        replacements = questions or {}
+        new = copy.copy(self)
+        new.__dict__["_questions"] = [
+            replacements.get(q.question_name, q) for q in self.questions
+        ]
+        new.rule_collection = copy.copy(self.rule_collection)
+        new.memory_plan = copy.copy(self.memory_plan)
+        if hasattr(self.memory_plan, "survey_question_names"):
+            new.memory_plan.survey_question_names = list(
+                self.memory_plan.survey_question_names
+            )
+            new.memory_plan.question_texts = list(self.memory_plan.question_texts)
+        new.question_groups = dict(self.question_groups)
+        new.questions_to_randomize = list(self.questions_to_randomize)
+        new._instruction_names_to_instructions = dict(
+            self._instruction_names_to_instructions
+        )
+        new._pseudo_indices = PseudoIndices(dict(self._pseudo_indices))
+        new._cached_instruction_collection = None
+        new._exporter = SurveyExport(new)
+        return new
+
     def next_question(
         self,
         current_question: Optional[Union[str, "QuestionBase"]] = None,
@@ -11,6 +11,7 @@ import asyncio
 from typing import Callable, Optional, TYPE_CHECKING
 from collections import UserList, UserDict
 
+from ..buckets.adaptive_rate import reporting_to
 from ..jobs.exceptions import InterviewErrorPriorTaskCanceled
 from ..tokens import TokenUsage
 from ..data_transfer_models import Answers
@@ -81,6 +82,7 @@ class QuestionTaskCreator(UserList):
         answer_question_func: Callable,
         model_buckets: "ModelBuckets",
         token_estimator: Optional[Callable] = None,
+        cache_probe: Optional[Callable] = None,
         iteration: int = 0,
     ):
         """
@@ -91,6 +93,8 @@ class QuestionTaskCreator(UserList):
             answer_question_func: Function that will execute the LLM call to answer the question
             model_buckets: Container for rate limiting buckets (requests and tokens)
             token_estimator: Function to estimate token usage for the question (for quota management)
+            cache_probe: Function that returns True if the answer to the question is already
+                cached; such answers are served without waiting on the rate limit buckets
             iteration: The iteration number of this question (for repeated questions)
             
         Notes:
@@ -115,6 +119,7 @@ class QuestionTaskCreator(UserList):
             return 1
 
         self.token_estimator = token_estimator or fake_token_estimator
+        self.cache_probe = cache_probe
 
         # Assume that the task is *not* from the cache until we know otherwise; the _run_focal_task might flip this bit later.
         self.from_cache = False
@@ -162,12 +167,35 @@ class QuestionTaskCreator(UserList):
         """Run the focal task i.e., the question that we are interested in answering.
 
         It is only called after all the dependency tasks are completed.
+        Answers that the cache probe finds in the cache skip the rate limit
+        buckets entirely; only cache misses wait for token and request capacity.
+        Cached answers are exempted per call, so they never change the rate
+        other calls to the same model or service are held to.
 
         >>> qt = QuestionTaskCreator.example()
         >>> answers = asyncio.run(qt._run_focal_task())
         >>> answers.answer
         'This is an example answer'
         """
+        if self.cache_probe is not None and self.cache_probe(self.question):
+            self.task_status = TaskStatus.API_CALL_IN_PROGRESS
+            try:
+                # In case the answer left the cache after all and the API is called
+                with reporting_to(self.model_buckets):
+                    results = await self.answer_question_func(
+                        question=self.question, task=None
+                    )
+                self.task_status = TaskStatus.SUCCESS
+            except Exception as e:
+                self.task_status = TaskStatus.FAILED
+                raise e
+            self.from_cache = bool(results.cache_used)
+            if not results.cache_used:
+                # The call went to the API without waiting on the buckets, so
+                # charge them now to keep later calls within the rate limits
+                await self.tokens_bucket.get_tokens(self.estimated_tokens())
+                await self.requests_bucket.get_tokens(1, cheat_bucket_capacity=True)
+            return results
 
         requested_tokens = self.estimated_tokens()
         if (self.tokens_bucket.wait_time(requested_tokens)) > 0:
@@ -185,24 +213,23 @@ class QuestionTaskCreator(UserList):
 
         self.task_status = TaskStatus.API_CALL_IN_PROGRESS
         try:
-            results = await self.answer_question_func(
-                question=self.question, task=None  # self
-            )
+            # Rate limit feedback from the API adapts this model's buckets
+            with reporting_to(self.model_buckets):
+                results = await self.answer_question_func(
+                    question=self.question, task=None  # self
+                )
             self.task_status = TaskStatus.SUCCESS
         except Exception as e:
             self.task_status = TaskStatus.FAILED
             raise e
 
         if results.cache_used:
+            # The answer didn't cost an API call after all, so give back what
+            # this call took; the buckets' rates stay as they are for the
+            # calls that do hit the API
             self.model_buckets.tokens_bucket.add_tokens(requested_tokens)
             self.model_buckets.requests_bucket.add_tokens(1)
             self.from_cache = True
-            # Turbo mode means that we don't wait for tokens or requests.
-            self.model_buckets.tokens_bucket.turbo_mode_on()
-            self.model_buckets.requests_bucket.turbo_mode_on()
-        else:
-            self.model_buckets.tokens_bucket.turbo_mode_off()
-            self.model_buckets.requests_bucket.turbo_mode_off()
 
         return results
 
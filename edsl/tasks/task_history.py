@@ -7,6 +7,7 @@ visualization and reporting to help users understand task execution patterns and
 issues.
 """
 
+from collections import Counter
 from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,9 +18,64 @@ import os
 import tempfile
 
 from .task_status_enum import TaskStatus
+from .task_status_log import TaskStatusLog
 from ..base import RepresentationMixin
 
 
+class InterviewReference:
+    """The parts of a finished interview that a TaskHistory reports on.
+
+    Holding these instead of the Interview breaks the strong reference to it,
+    so its answers, task manager and other state can be garbage collected.
+    """
+
+    def __init__(self, interview: "Interview", survey=None, keep_logs: bool = True):
+        # Store only the data we need for reporting
+        self.exceptions = interview.exceptions
+        self.task_status_logs = interview.task_status_logs if keep_logs else {}
+        self.model = interview.model
+        self.survey = interview.survey if survey is None else survey
+
+        # Store metadata needed for serialization
+        self._interview_id = id(interview)
+
+    def to_dict(self, add_edsl_version=True):
+        """Create a serializable representation of the interview reference"""
+        # Create a simplified dict that has the required fields but doesn't
+        # maintain a strong reference to the original interview
+        data = {
+            "id": self._interview_id,
+            "type": "InterviewReference",
+            "exceptions": self.exceptions.to_dict()
+            if hasattr(self.exceptions, "to_dict")
+            else {},
+            "task_status_logs": {
+                name: log.to_dict() if hasattr(log, "to_dict") else {}
+                for name, log in self.task_status_logs.items()
+            },
+        }
+
+        # Add model and survey info if they have to_dict methods
+        if hasattr(self.model, "to_dict"):
+            data["model"] = self.model.to_dict(add_edsl_version=add_edsl_version)
+
+        if hasattr(self.survey, "to_dict"):
+            data["survey"] = self.survey.to_dict(add_edsl_version=add_edsl_version)
+
+        if add_edsl_version:
+            from edsl import __version__
+
+            data["edsl_version"] = __version__
+
+        return data
+
+    def __getattr__(self, name):
+        # Handle any missing attributes by returning None
+        # This provides compatibility with code that might access
+        # other interview attributes we haven't explicitly stored
+        return None
+
+
 class TaskHistory(RepresentationMixin):
     """
     Records and analyzes the execution history of tasks across multiple interviews.
@@ -51,6 +107,7 @@ class TaskHistory(RepresentationMixin):
         include_traceback: bool = False,
         max_interviews: int = 10,
         interviews_with_exceptions_only: bool = False,
+        max_records: Optional[int] = None,
     ):
         """
         Initialize a TaskHistory to track execution across multiple interviews.
@@ -60,13 +117,24 @@ class TaskHistory(RepresentationMixin):
             include_traceback: Whether to include full exception tracebacks
             max_interviews: Maximum number of interviews to display in reports
             interviews_with_exceptions_only: If True, only track interviews with exceptions
+            max_records: If set, keep task status logs for at most this many
+                interviews. Interviews without exceptions beyond that sample are
+                only counted; interviews with exceptions are always kept, without
+                their status logs once the sample is full.
 
         Example:
             >>> _ = TaskHistory.example()  # Create a sample TaskHistory
         """
         self.interviews_with_exceptions_only = interviews_with_exceptions_only
+        self.max_records = max_records
         self._interviews = {}
         self.total_interviews = []
+        # Aggregates over every interview added, whether or not it was kept
+        self.num_interviews = 0
+        self.task_status_counts = Counter()
+        self._num_records = 0
+        # Interviews of a job share one compiled survey; their references share one survey
+        self._shared_surveys = {}
         if interviews is not None:
             for interview in interviews:
                 self.add_interview(interview)
@@ -82,69 +150,58 @@ class TaskHistory(RepresentationMixin):
         self.max_interviews = max_interviews
 
     def add_interview(self, interview: "Interview"):
-        """Add a single interview to the history"""
-        if self.interviews_with_exceptions_only and interview.exceptions == {}:
-            return
-
-        # Store only essential data from the interview to break strong reference
-        # Instead of a deep copy, we create a lightweight reference holder
-        class InterviewReference:
-            def __init__(self, interview: "Interview"):
-                # Store only the data we need for reporting
-                self.exceptions = interview.exceptions
-                self.task_status_logs = interview.task_status_logs
-                self.model = interview.model
-                self.survey = interview.survey
-
-                # Store metadata needed for serialization
-                self._interview_id = id(interview)
-
-            def to_dict(self, add_edsl_version=True):
-                """Create a serializable representation of the interview reference"""
-                # Create a simplified dict that has the required fields but doesn't
-                # maintain a strong reference to the original interview
-                data = {
-                    "id": self._interview_id,
-                    "type": "InterviewReference",
-                    "exceptions": self.exceptions.to_dict()
-                    if hasattr(self.exceptions, "to_dict")
-                    else {},
-                    "task_status_logs": {
-                        name: log.to_dict() if hasattr(log, "to_dict") else {}
-                        for name, log in self.task_status_logs.items()
-                    },
-                }
-
-                # Add model and survey info if they have to_dict methods
-                if hasattr(self.model, "to_dict"):
-                    data["model"] = self.model.to_dict(
-                        add_edsl_version=add_edsl_version
-                    )
-
-                if hasattr(self.survey, "to_dict"):
-                    data["survey"] = self.survey.to_dict(
-                        add_edsl_version=add_edsl_version
-                    )
-
-                if add_edsl_version:
-                    from edsl import __version__
-
-                    data["edsl_version"] = __version__
-
-                return data
+        """Add a single interview to the history
+
+        With ``max_records`` set, interviews past the sample are only counted
+        unless they raised exceptions.
+
+        >>> import asyncio
+        >>> from edsl.interviews import Interview
+        >>> i = Interview.example()
+        >>> _ = asyncio.run(i.async_conduct_interview())
+        >>> th = TaskHistory(max_records=1)
+        >>> th.add_interview(i); th.add_interview(i)
+        >>> th.num_interviews, len(th.total_interviews)
+        (2, 1)
+        >>> dict(th.task_status_counts)
+        {<TaskStatus.SUCCESS: 8>: 6}
+        """
+        self.num_interviews += 1
+        for log in (interview.task_status_logs or {}).values():
+            if isinstance(log, TaskStatusLog) and len(log) > 0:
+                self.task_status_counts[log[-1]["value"]] += 1
 
-            def __getattr__(self, name):
-                # Handle any missing attributes by returning None
-                # This provides compatibility with code that might access
-                # other interview attributes we haven't explicitly stored
-                return None
+        has_exceptions = interview.exceptions != {}
+        if self.interviews_with_exceptions_only and not has_exceptions:
+            return
+        keep_logs = self.max_records is None or self._num_records < self.max_records
+        if not (keep_logs or has_exceptions):
+            return
+        self._num_records += keep_logs
 
         # Create a reference object instead of keeping the full interview
-        interview_ref = InterviewReference(interview)
+        interview_ref = InterviewReference(
+            interview, survey=self._shared_survey(interview), keep_logs=keep_logs
+        )
 
         self.total_interviews.append(interview_ref)
         self._interviews[len(self._interviews)] = interview_ref
 
+    def _shared_survey(self, interview: "Interview"):
+        """Return one survey for all interviews built from the same compiled survey.
+
+        Interviews whose surveys shuffle question options keep their own survey,
+        as each has its own option order.
+        """
+        compiled_survey = getattr(interview, "compiled_survey", None)
+        if compiled_survey is None or interview.survey.questions_to_randomize:
+            return interview.survey
+        # The compiled survey is held in the entry, so its id cannot be reused
+        entry = self._shared_surveys.setdefault(
+            id(compiled_survey), (compiled_survey, interview.survey)
+        )
+        return entry[1]
+
     @classmethod
     def example(cls):
         """ """
@@ -222,6 +279,7 @@ class TaskHistory(RepresentationMixin):
         d = {
             "interviews": interview_dicts,
             "include_traceback": self.include_traceback,
+            "num_interviews": self.num_interviews,
         }
 
         if add_edsl_version:
@@ -306,6 +364,9 @@ class TaskHistory(RepresentationMixin):
                     instance.total_interviews.append(ref)
                     instance._interviews[len(instance._interviews)] = ref
 
+        instance.num_interviews = data.get(
+            "num_interviews", len(instance.total_interviews)
+        )
         return instance
 
     @property
@@ -613,6 +674,7 @@ class TaskHistory(RepresentationMixin):
         # Render the template with data
         output = template.render(
             interviews=self._interviews,
+            num_interviews=self.num_interviews,
             css=css,
             javascript=self.javascript(),
             num_exceptions=len(self.exceptions),
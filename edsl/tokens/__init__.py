@@ -8,7 +8,8 @@ cost calculation, and reporting of token usage metrics.
 Key components:
 1. TokenUsage - Tracks prompt and completion tokens for a single operation
 2. InterviewTokenUsage - Aggregates token usage across an entire interview
-3. Exception classes for handling token-related errors
+3. Token counters - Estimate the tokens in a prompt, per inference service
+4. Exception classes for handling token-related errors
 
 The token tracking system helps with:
 - Cost estimation and billing
@@ -19,11 +20,21 @@ The token tracking system helps with:
 
 from .token_usage import TokenUsage
 from .interview_token_usage import InterviewTokenUsage
+from .token_counter import (
+    TokenCounter,
+    count_tokens,
+    get_token_counter,
+    register_token_counter,
+)
 from .exceptions import TokenError, TokenUsageError, TokenCostError
 
 __all__ = [
     "TokenUsage", 
     "InterviewTokenUsage",
+    "TokenCounter",
+    "count_tokens",
+    "get_token_counter",
+    "register_token_counter",
     "TokenError",
     "TokenUsageError", 
     "TokenCostError"
@@ -0,0 +1,141 @@
+"""
+Token counters used to estimate how many tokens a prompt will cost.
+
+Token estimates drive both the tokens-per-minute buckets that pace API calls
+and the cost estimates shown before a job runs. Each inference service can
+register its own counter; services without one use the character heuristic
+(about 4 characters per token), which is also the fallback whenever a
+service's tokenizer package is not installed.
+
+Counts are memoized, least recently used first out, as the same prompts are
+counted repeatedly across a job (once per rate limit reservation and cost
+estimate).
+
+>>> get_token_counter("test").count("What is your favorite month?")
+7.0
+>>> get_token_counter("no-such-service").name
+'heuristic'
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+
+class TokenCounter:
+    """Counts the tokens in a text; the base class uses the character heuristic."""
+
+    name = "heuristic"
+    CHARS_PER_TOKEN = 4
+
+    def count(self, text: str, model: Optional[str] = None) -> float:
+        """Return the (approximate) number of tokens in text.
+
+        >>> TokenCounter().count("abcdefghij")
+        2.5
+        """
+        return len(text) / self.CHARS_PER_TOKEN
+
+
+class TiktokenCounter(TokenCounter):
+    """Counts tokens with OpenAI's tiktoken tokenizer.
+
+    tiktoken downloads an encoding the first time it is used; if that fails
+    (e.g. offline), the counter falls back to the character heuristic.
+    """
+
+    name = "tiktoken"
+    DEFAULT_ENCODING = "o200k_base"
+
+    def __init__(self):
+        import tiktoken
+
+        self._tiktoken = tiktoken
+        self._encodings = {}
+
+    def _encoding(self, model: Optional[str]):
+        if model not in self._encodings:
+            try:
+                try:
+                    encoding = self._tiktoken.encoding_for_model(model)
+                except (KeyError, TypeError):
+                    encoding = self._tiktoken.get_encoding(self.DEFAULT_ENCODING)
+            except Exception:
+                # Not retried, so an unreachable download doesn't slow every count
+                encoding = None
+            self._encodings[model] = encoding
+        return self._encodings[model]
+
+    def count(self, text: str, model: Optional[str] = None) -> float:
+        encoding = self._encoding(model)
+        if encoding is None:
+            return super().count(text, model)
+        return len(encoding.encode(text, disallowed_special=()))
+
+
+# Inference service -> factory for its counter; factories raise ImportError
+# when their tokenizer package is not installed
+_COUNTER_FACTORIES: Dict[str, Callable[[], TokenCounter]] = {
+    "openai": TiktokenCounter,
+    "azure": TiktokenCounter,
+}
+_counters: Dict[str, TokenCounter] = {}
+
+_MAX_MEMOIZED_COUNTS = 65536
+_memoized_counts: "OrderedDict[tuple, float]" = OrderedDict()
+
+
+def register_token_counter(
+    inference_service: str, counter: Callable[[], TokenCounter]
+) -> None:
+    """Use counter (a TokenCounter class or factory) for the models of a service.
+
+    >>> class WordCounter(TokenCounter):
+    ...     name = "words"
+    ...     def count(self, text, model=None):
+    ...         return len(text.split())
+    >>> register_token_counter("example_service", WordCounter)
+    >>> count_tokens("three short words", inference_service="example_service")
+    3
+    >>> del _COUNTER_FACTORIES["example_service"], _counters["example_service"]
+    """
+    _COUNTER_FACTORIES[inference_service] = counter
+    _counters.pop(inference_service, None)
+
+
+def get_token_counter(inference_service: Optional[str]) -> TokenCounter:
+    """Return the counter for a service, falling back to the heuristic."""
+    counter = _counters.get(inference_service)
+    if counter is None:
+        factory = _COUNTER_FACTORIES.get(inference_service, TokenCounter)
+        try:
+            counter = factory()
+        except ImportError:
+            counter = TokenCounter()
+        _counters[inference_service] = counter
+    return counter
+
+
+def count_tokens(
+    text: str, inference_service: Optional[str] = None, model: Optional[str] = None
+) -> float:
+    """Return the number of tokens in text for a model of the given service.
+
+    >>> count_tokens("What is your favorite month?", inference_service="test", model="test")
+    7.0
+    """
+    counter = get_token_counter(inference_service)
+    key = (counter, model, text)
+    tokens = _memoized_counts.get(key)
+    if tokens is not None:
+        _memoized_counts.move_to_end(key)
+    else:
+        tokens = _memoized_counts[key] = counter.count(text, model)
+        if len(_memoized_counts) > _MAX_MEMOIZED_COUNTS:
+            _memoized_counts.popitem(last=False)
+    return tokens
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -9,6 +9,8 @@ from .ast_utilities import extract_variable_names
 from .utilities import (
     clean_json,
     dict_hash,
+    content_token,
+    cached_content_hash,
     hash_value,
     repair_json,
     create_valid_var_name,
@@ -35,6 +37,8 @@ __all__ = [
     "extract_variable_names",
     "clean_json",
     "dict_hash",
+    "content_token",
+    "cached_content_hash",
     "hash_value",
     "repair_json",
     "create_valid_var_name",
@@ -0,0 +1,52 @@
+"""Restricted expressions that are parsed once and evaluated against many rows."""
+
+from typing import Any, Callable, Mapping, Optional
+
+
+class CompiledExpression:
+    """A simpleeval expression parsed once and evaluated row by row.
+
+    Filtering a collection used to build a fresh ``EvalWithCompoundTypes`` for
+    every item and have it parse the expression again. A CompiledExpression
+    parses the expression a single time and keeps one evaluator whose names
+    are swapped for each row, so the restricted semantics are exactly those of
+    simpleeval while the per-row cost is only the evaluation itself.
+
+    Instances are not thread-safe: use one per thread.
+
+    >>> is_big = CompiledExpression("a > 1 and b.startswith('x')")
+    >>> [is_big({"a": a, "b": b}) for a, b in [(1, "xy"), (2, "xy"), (2, "yx")]]
+    [False, True, False]
+    >>> CompiledExpression("c == 1")({"a": 1})
+    Traceback (most recent call last):
+    ...
+    simpleeval.NameNotDefined: 'c' is not defined for expression 'c == 1'
+    >>> CompiledExpression("a ==")  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ...
+    SyntaxError: invalid syntax...
+    """
+
+    def __init__(self, expression: str, functions: Optional[Mapping[str, Callable]] = None):
+        from simpleeval import EvalWithCompoundTypes
+
+        self.expression = expression
+        self._evaluator = EvalWithCompoundTypes(
+            names={}, functions=None if functions is None else dict(functions)
+        )
+        self._parsed = self._evaluator.parse(expression)
+
+    def __call__(self, names: Mapping[str, Any]) -> Any:
+        """Evaluate the expression with the given names."""
+        evaluator = self._evaluator
+        evaluator.names = names
+        return evaluator.eval(self.expression, previously_parsed=self._parsed)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.expression!r})"
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -14,6 +14,7 @@ import string
 import tempfile
 import gzip
 import webbrowser
+import weakref
 
 from html import escape
 from typing import Callable, Union
@@ -55,6 +56,62 @@ def dict_hash(data: dict):
     )
 
 
+def content_token(value):
+    """Return a cheap stand-in for a JSON-like value that compares equal only for equal content.
+
+    Building and comparing a token costs far less than serializing and hashing
+    the value: strings are held by reference, so an unchanged multi-megabyte
+    string compares by identity. Types are kept, so 1, 1.0 and True differ.
+    Values that are not plain JSON-like data get a token equal to nothing.
+
+    >>> content_token({"a": [1, "x"]}) == content_token({"a": [1, "x"]})
+    True
+    >>> content_token({"a": 1}) == content_token({"a": True})
+    False
+    >>> content_token(object()) == content_token(object())
+    False
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return (type(value), value)
+    if isinstance(value, dict):
+        return (
+            type(value),
+            tuple((content_token(k), content_token(v)) for k, v in value.items()),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(content_token(v) for v in value))
+    from collections import UserDict
+
+    if isinstance(value, UserDict):
+        return (type(value), content_token(value.data))
+    return object()
+
+
+_CONTENT_HASHES: dict = {}
+
+
+def cached_content_hash(obj, token, compute: Callable[[], int]) -> int:
+    """Return obj's content hash, computing it only when its content token changed.
+
+    The hash is remembered together with the token it was computed for, so any
+    change to the content (including in-place changes to nested values) is
+    picked up the next time the hash is asked for. Entries are kept outside the
+    object, so they never show up in its attributes or serialization, and are
+    dropped when the object is garbage collected.
+    """
+    key = id(obj)
+    cached = _CONTENT_HASHES.get(key)
+    if cached is not None and cached[0]() is obj and cached[1] == token:
+        return cached[2]
+    value = compute()
+    try:
+        ref = weakref.ref(obj, lambda _, key=key: _CONTENT_HASHES.pop(key, None))
+    except TypeError:  # objects that cannot be weakly referenced are not cached
+        return value
+    _CONTENT_HASHES[key] = (ref, token, value)
+    return value
+
+
 def extract_json_from_string(text):
     pattern = re.compile(r"\{.*?\}")
     match = pattern.search(text)
@@ -151,3 +151,13 @@ def test_agent_dynamic_traits_answering():
     m = Model("test")
     results = q.by(m).by(a).run(disable_remote_inference=True, disable_remote_cache=True, stop_on_exception=True)
     assert results.select("answer.age").to_list()
+
+
+def test_agent_hash_follows_trait_changes():
+    from edsl.utilities.utilities import dict_hash
+
+    a = Agent(traits={"age": 30})
+    first = hash(a)
+    a.traits = {"age": 31}
+    assert hash(a) != first
+    assert hash(a) == dict_hash(a.to_dict(add_edsl_version=False))
@@ -0,0 +1,101 @@
+import pytest
+
+from edsl.caching import Cache, CacheEntry
+from edsl.caching.batched_sqlite_dict import BatchedSQLiteDict
+from edsl.caching.exceptions import CacheKeyError, CacheValueError
+from edsl.caching.sql_dict import SQLiteDict
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def test_set_and_get_before_and_after_flush(db_path):
+    d = BatchedSQLiteDict(db_path, batch_size=10)
+    entry = CacheEntry.example()
+    d["k"] = entry
+    assert d["k"] == entry
+    d.flush()
+    assert d["k"] == entry
+    with pytest.raises(CacheKeyError):
+        d["missing"]
+    assert d.get("missing", "default") == "default"
+
+
+def test_rejects_non_cache_entries(db_path):
+    d = BatchedSQLiteDict(db_path)
+    with pytest.raises(CacheValueError):
+        d["k"] = "not an entry"
+
+
+def test_writes_are_batched(db_path):
+    d = BatchedSQLiteDict(db_path, batch_size=3)
+    entries = [CacheEntry.example(randomize=True) for _ in range(4)]
+    for entry in entries:
+        d[entry.key] = entry
+    # The first three entries were flushed together; the fourth is still buffered
+    assert list(d._pending) == [entries[3].key]
+    assert len(d) == 4
+    assert list(d.keys()) == [entry.key for entry in entries]
+
+
+def test_close_persists_and_is_readable_by_sqlitedict(db_path):
+    d = BatchedSQLiteDict(db_path)
+    entry = CacheEntry.example()
+    d[entry.key] = entry
+    d.close()
+    assert SQLiteDict(db_path)[entry.key] == entry
+    # The connection reopens transparently
+    assert d[entry.key] == entry
+
+
+def test_get_many_and_contains_many(db_path):
+    d = BatchedSQLiteDict(db_path)
+    d.MAX_VARIABLES = 2
+    entries = {f"k{i}": CacheEntry.example(randomize=True) for i in range(5)}
+    d.update(entries)
+    d["buffered"] = CacheEntry.example()
+    keys = list(entries) + ["buffered", "missing"]
+    assert d.get_many(keys) == {**entries, "buffered": CacheEntry.example()}
+    assert d.contains_many(keys) == set(entries) | {"buffered"}
+
+
+def test_update_respects_overwrite(db_path):
+    d = BatchedSQLiteDict(db_path)
+    old, new = CacheEntry.example(randomize=True), CacheEntry.example(randomize=True)
+    d["k"] = old
+    d.update({"k": new})
+    assert d["k"] == old
+    d.update({"k": new}, overwrite=True)
+    assert d["k"] == new
+
+
+def test_delete(db_path):
+    d = BatchedSQLiteDict(db_path)
+    d["buffered"] = CacheEntry.example()
+    d["stored"] = CacheEntry.example()
+    d.flush()
+    d["buffered2"] = CacheEntry.example()
+    del d["stored"]
+    del d["buffered2"]
+    assert "stored" not in d and "buffered2" not in d
+    with pytest.raises(CacheKeyError):
+        del d["missing"]
+
+
+def test_cache_uses_batched_backend_transparently(db_path):
+    cache = Cache.from_sqlite_db(db_path, batched=True)
+    assert isinstance(cache.data, BatchedSQLiteDict)
+    call = dict(
+        model="gpt-4o",
+        parameters={"temperature": 0.5},
+        system_prompt="sys",
+        user_prompt="hi",
+        iteration=0,
+    )
+    assert cache.fetch(**call)[0] is None
+    key = cache.store(**call, response={"answer": 1}, service="openai")
+    assert cache.fetch(**call) == ('{"answer": 1}', key)
+    cache.close()
+    assert key in SQLiteDict(db_path)
@@ -0,0 +1,78 @@
+import pytest
+
+from edsl.caching import Cache, CacheEntry
+from edsl.caching.batched_sqlite_dict import BatchedSQLiteDict
+from edsl.caching.exceptions import CacheKeyError, CacheValueError
+from edsl.caching.lru_front_cache import LRUFrontCache
+from edsl.caching.sql_dict import SQLiteDict
+
+
+def test_requires_a_bound():
+    with pytest.raises(CacheValueError):
+        LRUFrontCache(SQLiteDict.example())
+
+
+def test_hits_skip_the_store():
+    store = SQLiteDict.example()
+    entry = CacheEntry.example()
+    store["k"] = entry
+    front = LRUFrontCache(store, max_entries=10)
+    assert front.get("k") == entry
+    del store["k"]  # only the in-memory copy is left
+    assert front["k"] == entry
+    assert (front.hits, front.misses) == (1, 1)
+    with pytest.raises(CacheKeyError):
+        front["missing"]
+
+
+def test_evicts_least_recently_used():
+    front = LRUFrontCache(SQLiteDict.example(), max_entries=2)
+    entries = [CacheEntry.example(randomize=True) for _ in range(3)]
+    front["a"], front["b"] = entries[0], entries[1]
+    front.get("a")  # "b" is now the least recently used
+    front["c"] = entries[2]
+    assert list(front._entries) == ["a", "c"]
+    assert front.evictions == 1
+    # Evicted entries are still in the store
+    assert front["b"] == entries[1]
+    assert len(front) == 3
+
+
+def test_byte_bound():
+    entry = CacheEntry.example(randomize=True)
+    size = LRUFrontCache._entry_size(entry)
+    front = LRUFrontCache(SQLiteDict.example(), max_bytes=size * 2)
+    for key in "abc":
+        front[key] = entry
+    assert front.stats()["entries"] == 2
+    assert front.stats()["bytes"] <= size * 2
+
+
+def test_update_drops_stale_copies():
+    front = LRUFrontCache(SQLiteDict.example(), max_entries=10)
+    old, new = CacheEntry.example(randomize=True), CacheEntry.example(randomize=True)
+    front["k"] = old
+    front.update({"k": new}, overwrite=True)
+    assert front["k"] == new
+
+
+def test_cache_with_lru_tier(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = Cache.from_sqlite_db(db_path, batched=True, lru_max_entries=10)
+    assert isinstance(cache.data, LRUFrontCache)
+    call = dict(
+        model="gpt-4o",
+        parameters={"temperature": 0.5},
+        system_prompt="sys",
+        user_prompt="hi",
+        iteration=0,
+    )
+    key = cache.store(**call, response={"answer": 1}, service="openai")
+    assert cache.fetch(**call) == ('{"answer": 1}', key)
+    assert cache.lru_stats["hits"] == 1
+    cache.close()
+    assert key in BatchedSQLiteDict(db_path)
+
+
+def test_lru_tier_is_ignored_for_in_memory_caches():
+    assert isinstance(Cache(lru_max_entries=10).data, dict)
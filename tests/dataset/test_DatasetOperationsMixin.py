@@ -86,4 +86,36 @@ class TestDatasetOperationsMixin:
         with pytest.raises(DatasetTypeError) as excinfo:
             dataset.unpack_list('data')
         
-        assert "Field 'data' does not contain lists in all entries" in str(excinfo.value)
\ No newline at end of file
+        assert "Field 'data' does not contain lists in all entries" in str(excinfo.value)
+
+class TestDataFrameExports:
+    """to_pandas/to_polars build frames straight from the columns."""
+
+    def test_to_pandas_preserves_types(self):
+        dataset = Dataset([
+            {'answer.n': [1, 2, 3]},
+            {'answer.x': [0.5, None, 1.5]},
+            {'answer.flag': [True, False, True]},
+            {'answer.items': [['a'], ['b', 'c'], []]},
+        ])
+        df = dataset.to_pandas()
+        assert list(df.columns) == ['answer.n', 'answer.x', 'answer.flag', 'answer.items']
+        assert str(df['answer.n'].dtype) == 'int64'
+        assert str(df['answer.x'].dtype) == 'float64'
+        assert str(df['answer.flag'].dtype) == 'bool'
+        assert df['answer.items'].tolist() == [['a'], ['b', 'c'], []]
+
+    def test_to_pandas_lists_as_strings_and_duplicate_names(self):
+        dataset = Dataset([{'answer.q': [['a'], None]}, {'scenario.q': [{'k': 1}, 2]}])
+        df = dataset.to_pandas(remove_prefix=True, lists_as_strings=True)
+        assert list(df.columns) == ['q', 'q.1']
+        assert df['q'].tolist() == ["['a']", None]
+        assert df['q.1'].tolist() == ["{'k': 1}", 2]
+
+    def test_to_polars(self):
+        pl = pytest.importorskip("polars")
+        dataset = Dataset([{'a': [1, 2]}, {'b': ['x', {'y': 1}]}])
+        df = dataset.to_polars()
+        assert df.columns == ['a', 'b']
+        assert df['a'].dtype == pl.Int64
+        assert df['b'].to_list() == ['x', "{'y': 1}"]
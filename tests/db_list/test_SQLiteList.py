@@ -0,0 +1,89 @@
+import json
+import random
+
+import pytest
+
+from edsl.db_list.sqlite_list import SQLiteList
+
+
+class JSONList(SQLiteList):
+    def serialize(self, value):
+        return json.dumps(value)
+
+    def deserialize(self, value):
+        return json.loads(value)
+
+
+def test_behaves_like_a_list_under_random_mutations():
+    random.seed(0)
+    expected = list(range(20))
+    actual = JSONList(expected)
+    for step in range(300):
+        op = random.choice(["insert", "delete", "set", "append", "get"])
+        if op == "insert":
+            i = random.randint(-len(expected) - 2, len(expected) + 2)
+            expected.insert(i, step)
+            actual.insert(i, step)
+        elif op == "delete" and expected:
+            i = random.randrange(-len(expected), len(expected))
+            del expected[i]
+            del actual[i]
+        elif op == "set" and expected:
+            i = random.randrange(len(expected))
+            expected[i] = -step
+            actual[i] = -step
+        elif op == "append":
+            expected.append(step)
+            actual.append(step)
+        elif op == "get" and expected:
+            i = random.randrange(len(expected))
+            assert actual[i] == expected[i]
+        assert len(actual) == len(expected)
+    assert list(actual) == expected
+    assert actual[2:9] == expected[2:9]
+    assert actual[::3] == expected[::3]
+
+
+def test_insert_does_not_renumber_other_rows():
+    items = JSONList(range(5))
+    items.insert(1, "new")
+    positions = [
+        pos for (pos,) in items.conn.execute("SELECT idx FROM list_data ORDER BY idx")
+    ]
+    assert positions == [0, 0.5, 1, 2, 3, 4]
+    assert list(items) == [0, "new", 1, 2, 3, 4]
+    # Random access renumbers once
+    assert items[5] == 4
+    assert items._dense
+
+
+def test_repeated_inserts_at_same_spot():
+    items = JSONList([0, 1])
+    for i in range(100):
+        items.insert(1, i)
+    assert list(items) == [0] + list(reversed(range(100))) + [1]
+
+
+def test_get_many():
+    items = JSONList(range(10))
+    del items[0]
+    assert items.get_many([3, -1, 0, 3]) == [4, 9, 1, 4]
+    with pytest.raises(IndexError):
+        items.get_many([20])
+
+
+def test_extend_and_length_are_cached():
+    items = JSONList()
+    items.extend(iter(range(1000)))
+    assert len(items) == 1000
+    assert items[999] == 999
+
+
+def test_copy_from(tmp_path):
+    source = JSONList(range(5))
+    del source[1]
+    source.insert(0, "first")
+    copy = JSONList()
+    copy.copy_from(source.db_path)
+    assert list(copy) == ["first", 0, 2, 3, 4]
+    assert copy[0] == "first" and len(copy) == 5
@@ -0,0 +1,33 @@
+import asyncio
+
+from edsl.inference_services.http_transport import async_http_client, pool_limits
+from edsl.inference_services.services.open_ai_service import OpenAIService
+
+
+def test_pool_is_bounded_by_rpm_and_concurrency():
+    assert pool_limits(rpm=6_000).max_connections == 1000  # EDSL_MAX_CONCURRENT_TASKS
+    assert pool_limits(rpm=600).max_connections == 300
+    assert pool_limits(rpm=1).max_connections == 10
+
+
+def test_pools_are_per_event_loop():
+    async def get():
+        return async_http_client("openai", None, "key")
+
+    clients = []
+    for _ in range(2):
+        loop = asyncio.new_event_loop()
+        clients.append(loop.run_until_complete(get()))
+        loop.close()
+    assert clients[0] is not clients[1]
+
+
+def test_openai_clients_share_the_pool():
+    async def get():
+        a = OpenAIService.async_client("key")
+        b = OpenAIService.async_client("key")
+        return a, b, async_http_client(OpenAIService._inference_service_, None, "key")
+
+    a, b, http_client = asyncio.run(get())
+    assert a is b
+    assert a._client is http_client
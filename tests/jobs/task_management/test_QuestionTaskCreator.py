@@ -91,3 +91,113 @@ async def test_task_add_dependency():
 
     task_1 = creator_1.generate_task()
     creator_2.add_dependency(task_1)
+
+
+def _empty_buckets():
+    from edsl.buckets import TokenBucket
+
+    requests_bucket = TokenBucket(
+        bucket_name="test", bucket_type="requests", capacity=1, refill_rate=0.001
+    )
+    tokens_bucket = TokenBucket(
+        bucket_name="test", bucket_type="tokens", capacity=1, refill_rate=0.001
+    )
+    requests_bucket.tokens = 0
+    tokens_bucket.tokens = 0
+    return ModelBuckets(requests_bucket, tokens_bucket)
+
+
+@pytest.mark.asyncio
+async def test_cached_answers_skip_the_buckets():
+    async def cached_answer(question, task=None):
+        return AnswerTuple(answer=42, cache_used=True)
+
+    buckets = _empty_buckets()
+    creator = QuestionTaskCreator(
+        question=QuestionFreeText.example(),
+        answer_question_func=cached_answer,
+        model_buckets=buckets,
+        cache_probe=lambda question: True,
+    )
+
+    results = await asyncio.wait_for(creator._run_focal_task(), timeout=1)
+    assert results.answer == 42
+    assert creator.from_cache
+    assert creator.task_status == TaskStatus.SUCCESS
+    assert buckets.requests_bucket.tokens == 0
+    assert not buckets.requests_bucket.turbo_mode
+
+
+@pytest.mark.asyncio
+async def test_probe_hits_answered_by_the_api_are_charged():
+    from edsl.buckets import TokenBucket
+
+    async def uncached_answer(question, task=None):
+        return AnswerTuple(answer=42, cache_used=False)
+
+    buckets = ModelBuckets(
+        TokenBucket(bucket_name="test", bucket_type="requests", capacity=10, refill_rate=0.001),
+        TokenBucket(bucket_name="test", bucket_type="tokens", capacity=10, refill_rate=0.001),
+    )
+    creator = QuestionTaskCreator(
+        question=QuestionFreeText.example(),
+        answer_question_func=uncached_answer,
+        model_buckets=buckets,
+        cache_probe=lambda question: True,
+        token_estimator=lambda question: 4,
+    )
+
+    await creator._run_focal_task()
+    assert not creator.from_cache
+    assert buckets.requests_bucket.tokens == pytest.approx(9)
+    assert buckets.tokens_bucket.tokens == pytest.approx(6)
+
+
+@pytest.mark.asyncio
+async def test_cache_misses_wait_for_the_buckets():
+    creator = QuestionTaskCreator(
+        question=QuestionFreeText.example(),
+        answer_question_func=answer_question_func,
+        model_buckets=_empty_buckets(),
+        cache_probe=lambda question: False,
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(creator._run_focal_task(), timeout=0.5)
+    assert creator.task_status == TaskStatus.WAITING_FOR_TOKEN_CAPACITY
+
+
+@pytest.mark.asyncio
+async def test_cached_answers_do_not_lift_limits_for_other_calls():
+    from edsl.buckets import TokenBucket
+
+    async def cached_answer(question, task=None):
+        return AnswerTuple(answer=42, cache_used=True)
+
+    buckets = ModelBuckets(
+        TokenBucket(bucket_name="test", bucket_type="requests", capacity=2, refill_rate=0.001),
+        TokenBucket(bucket_name="test", bucket_type="tokens", capacity=10, refill_rate=0.001),
+    )
+    cached = QuestionTaskCreator(
+        question=QuestionFreeText.example(),
+        answer_question_func=cached_answer,
+        model_buckets=buckets,
+    )
+    await cached._run_focal_task()
+
+    # The call's tokens were given back and the rates left alone
+    assert cached.from_cache
+    assert buckets.requests_bucket.tokens == pytest.approx(2)
+    assert buckets.requests_bucket.refill_rate == 0.001
+    assert not buckets.requests_bucket.turbo_mode
+
+    # Cache misses still use up the requests and then have to wait
+    uncached = QuestionTaskCreator(
+        question=QuestionFreeText.example(),
+        answer_question_func=answer_question_func,
+        model_buckets=buckets,
+    )
+    await uncached._run_focal_task()
+    await uncached._run_focal_task()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(uncached._run_focal_task(), timeout=0.5)
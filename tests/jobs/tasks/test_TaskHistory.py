@@ -173,3 +173,45 @@ def test_plotting_data_method(sample_task_history):
 
 # Additional tests can be added for methods like plot(), html(), etc.
 # These methods might require more complex setup or mocking of external dependencies.
+
+
+def test_max_records_keeps_exceptions_and_counts():
+    import asyncio
+    from edsl.interviews import Interview
+
+    ok = Interview.example()
+    asyncio.run(ok.async_conduct_interview())
+    failing = Interview.example(throw_exception=True)
+    asyncio.run(failing.async_conduct_interview())
+
+    th = TaskHistory(max_records=1)
+    for interview in [ok, ok, failing, ok]:
+        th.add_interview(interview)
+
+    assert th.num_interviews == 4
+    # the first interview fills the sample; afterwards only exceptions are kept
+    assert len(th.total_interviews) == 2
+    assert th.total_interviews[1].task_status_logs == {}
+    assert th.has_exceptions
+    assert th.to_dict()["num_interviews"] == 4
+    assert TaskHistory.from_dict(th.to_dict()).num_interviews == 4
+
+
+def test_shuffled_surveys_are_not_shared():
+    from edsl import Model, QuestionMultipleChoice, Survey
+
+    q = QuestionMultipleChoice(
+        question_text="What is your favorite color?",
+        question_options=["Red", "Blue", "Green"],
+        question_name="color",
+    )
+    results = Survey([q], questions_to_randomize=["color"]).by(Model("test")).run(
+        n=5, cache=False, disable_remote_inference=True, disable_remote_cache=True
+    )
+    interviews = results.task_history.total_interviews
+
+    # Each reference shows the option order its interview used
+    shown = sorted(i.survey.questions[0].question_options for i in interviews)
+    used = sorted(results.select("question_options.color").to_list())
+    assert shown == used
+    assert len(set(map(tuple, shown))) > 1
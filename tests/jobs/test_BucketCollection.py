@@ -1,3 +1,4 @@
+import pytest
 
 from edsl.language_models import Model
 from edsl.questions import QuestionFreeText
@@ -15,3 +16,45 @@ def test_one_per_service():
     # bc = jobs.bucket_collection
     # assert len(bc) == 3
     # assert len(set(bc.values())) == 1
+
+
+def test_models_get_their_own_buckets_under_their_service():
+    from edsl.buckets import BucketCollection, RateLimitSignal
+
+    gpt4o = Model("gpt-4o", service_name="openai")
+    mini = Model("gpt-4", service_name="openai")
+    bc = BucketCollection.from_models([gpt4o, mini, Model("gpt-4o", temperature=0)])
+    service = bc.services_to_buckets["openai"]
+
+    assert bc[gpt4o] is bc[Model("gpt-4o", temperature=0)]
+    assert bc[gpt4o] is not bc[mini]
+    assert bc[gpt4o].tokens_bucket.parent is service.tokens_bucket
+    assert bc[mini].tokens_bucket.parent is service.tokens_bucket
+
+    # A provider slowing one model down leaves the other alone
+    bc[gpt4o].record_rate_limit(RateLimitSignal(throttled=True, retry_after=5))
+    assert bc[gpt4o].requests_bucket.wait_time(1) > 4
+    assert bc[mini].requests_bucket.wait_time(1) == 0
+
+    # Calls to either model count against the service
+    service.requests_bucket.tokens = 0
+    assert bc[mini].requests_bucket.wait_time(1) > 0
+
+
+def test_cancelled_waits_on_the_service_give_model_tokens_back():
+    import asyncio
+    from edsl.buckets import TokenBucket
+
+    service = TokenBucket(bucket_name="svc", bucket_type="requests", capacity=10, refill_rate=0.001)
+    model = TokenBucket(
+        bucket_name="model", bucket_type="requests", capacity=5, refill_rate=0.001, parent=service
+    )
+    service.tokens = 0
+
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            loop.run_until_complete(asyncio.wait_for(model.get_tokens(2), timeout=0.2))
+    finally:
+        loop.close()
+    assert model.tokens == pytest.approx(5)
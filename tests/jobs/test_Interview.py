@@ -147,5 +147,54 @@ def test_handle_timeout_exception(create_survey, capsys):
     # assert "Task `question_0` failed with `InterviewTimeoutError" in captured.out
 
 
+
+def test_prompts_rendered_once_per_question(create_survey, monkeypatch):
+    from collections import Counter
+    from edsl.invigilators.prompt_constructor import PromptConstructor
+    from edsl.language_models import Model
+
+    renders = Counter()
+    get_prompts = PromptConstructor.get_prompts
+
+    def counting_get_prompts(self):
+        renders[self.question.question_name] += 1
+        return get_prompts(self)
+
+    monkeypatch.setattr(PromptConstructor, "get_prompts", counting_get_prompts)
+    survey = create_survey(num_questions=3, chained=True)
+    results = survey.by(Model("test", canned_response="SPAM!")).run(
+        cache=Cache(), disable_remote_inference=True, disable_remote_cache=True
+    )
+
+    assert results.select("answer.question_2").first() == "SPAM!"
+    assert renders == {f"question_{i}": 1 for i in range(3)}
+
+
+
+def test_unused_prepared_invigilators_are_dropped(create_survey, monkeypatch):
+    from edsl.interviews.answering_function import AnswerQuestionFunctionConstructor
+    from edsl.language_models import Model
+
+    constructors = []
+    is_answer_cached = AnswerQuestionFunctionConstructor.is_answer_cached
+
+    def preparing_every_question(self, question):
+        # As if estimates had been made for questions that then never ran
+        constructors.append(self)
+        for other in self.interview.survey.questions:
+            self.prepared_invigilator(other)
+        return is_answer_cached(self, question)
+
+    monkeypatch.setattr(
+        AnswerQuestionFunctionConstructor, "is_answer_cached", preparing_every_question
+    )
+    survey = create_survey(num_questions=3, chained=False)
+    survey.by(Model("test", canned_response="SPAM!")).run(
+        cache=Cache(), disable_remote_inference=True, disable_remote_cache=True
+    )
+
+    assert constructors
+    assert all(c._prepared_invigilators == {} for c in constructors)
+
 if __name__ == "__main__":
     pytest.main()
@@ -219,6 +219,100 @@ def test_normal_run():
     assert results[0]["answer"]["name"] == "SPAM!"
 
 
+@pytest.mark.parametrize("extension", ["jsonl", "db"])
+def test_jobs_run_results_sink(tmp_path, extension):
+    path = tmp_path / f"results.{extension}"
+    job = Jobs.example().by(Model("test", canned_response="SPAM!"))
+    results = job.run(
+        cache=Cache(), disable_remote_inference=True, n=2, results_sink=str(path)
+    )
+    expected = job.run(cache=Cache(), disable_remote_inference=True, n=2)
+    assert path.exists()
+    assert len(results) == len(expected)
+    assert [r.order for r in results] == list(range(len(expected)))
+    assert results.select("how_feeling").to_list() == expected.select("how_feeling").to_list()
+
+
+def test_jobs_run_resume_from(tmp_path):
+    full = tmp_path / "full.jsonl"
+    job = Jobs.example().by(Model("test", canned_response="SPAM!"))
+    expected = job.run(
+        cache=Cache(), disable_remote_inference=True, n=2, results_sink=str(full)
+    )
+
+    # A checkpoint left by a run that died after five interviews, mid-write
+    lines = full.read_text().splitlines(keepends=True)
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    checkpoint.write_text("".join(lines[:5]) + lines[5][:40])
+
+    resumed = Jobs.example().by(Model("test", canned_response="SPAM!")).run(
+        cache=Cache(),
+        disable_remote_inference=True,
+        n=2,
+        results_sink=str(checkpoint),
+        resume_from=str(checkpoint),
+    )
+    assert len(resumed.task_history.total_interviews) == len(expected) - 5
+    assert [r.order for r in resumed] == list(range(len(expected)))
+    assert [r.interview_hash for r in resumed] == [r.interview_hash for r in expected]
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "db"])
+def test_jobs_first_run_resumes_from_its_own_sink(tmp_path, extension):
+    checkpoint = tmp_path / f"checkpoint.{extension}"
+    link = tmp_path / f"link.{extension}"
+    job = Jobs.example().by(Model("test", canned_response="SPAM!"))
+    expected = job.run(cache=Cache(), disable_remote_inference=True)
+
+    # The checkpoint doesn't exist yet and is named through a symlink
+    link.symlink_to(checkpoint)
+    results = job.run(
+        cache=Cache(),
+        disable_remote_inference=True,
+        results_sink=str(checkpoint),
+        resume_from=str(link),
+    )
+    assert [r.interview_hash for r in results] == [r.interview_hash for r in expected]
+
+
+def test_jobs_with_results_sink_run_locally(tmp_path, monkeypatch):
+    from edsl.jobs.remote_inference import JobsRemoteInferenceHandler
+
+    def start_remote_job(self, *args, **kwargs):
+        raise AssertionError("sent to remote inference")
+
+    monkeypatch.setattr(JobsRemoteInferenceHandler, "use_remote_inference", lambda self, disable: True)
+    monkeypatch.setattr(Jobs, "_start_remote_inference_job", start_remote_job)
+    path = tmp_path / "results.jsonl"
+    results = Jobs.example().by(Model("test", canned_response="SPAM!")).run(
+        cache=Cache(), disable_remote_cache=True, results_sink=str(path)
+    )
+    assert len(results) == len(Jobs.example())
+    assert path.exists()
+
+
+def test_jobs_failing_with_results_sink_raise_their_own_error(tmp_path, monkeypatch):
+    import edsl.results.results_sink as results_sink
+    from edsl.jobs.async_interview_runner import AsyncInterviewRunner
+
+    async def failing_run(self):
+        raise ValueError("interview failed")
+        yield
+
+    def unreadable(*args, **kwargs):
+        raise OSError("sink unreadable")
+
+    monkeypatch.setattr(AsyncInterviewRunner, "run", failing_run)
+    monkeypatch.setattr(results_sink.ResultsSink, "__iter__", unreadable)
+    with pytest.raises(ValueError, match="interview failed"):
+        Jobs.example().by(Model("test")).run(
+            cache=Cache(),
+            disable_remote_inference=True,
+            stop_on_exception=True,
+            results_sink=str(tmp_path / "results.jsonl"),
+        )
+
+
 def test_handle_model_exception():
     import random
     from edsl.enums import InferenceServiceType
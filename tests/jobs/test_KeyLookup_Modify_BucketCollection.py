@@ -34,6 +34,10 @@ def test_custom_rpm_bucket_collection():
     assert abs(actual_rpm - target_rpm) < 1, \
         f"Actual RPM ({actual_rpm}) differs from target RPM ({target_rpm}) by more than 1"
 
+    # The model's bucket still draws from its service's new bucket
+    requests_bucket = bc[Model(model_name='test', temperature=0.5)].requests_bucket
+    assert requests_bucket.parent is bc.services_to_buckets['test'].requests_bucket
+
 
 if __name__ == "__main__":
     import doctest
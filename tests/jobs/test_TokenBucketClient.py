@@ -0,0 +1,168 @@
+import asyncio
+import socket
+import threading
+from collections import Counter
+
+import pytest
+from aiohttp import web
+
+from edsl.buckets.token_bucket_client import TokenBucketClient
+
+
+class FakeBucketServer:
+    """A minimal in-process stand-in for the token bucket server."""
+
+    def __init__(self):
+        self.tokens = {}
+        self.calls = Counter()
+        self.connections = set()
+
+        app = web.Application()
+        app.router.add_post("/bucket", self.create_bucket)
+        app.router.add_post("/bucket/{bucket_id}/get_tokens", self.get_tokens)
+        app.router.add_post("/bucket/{bucket_id}/add_tokens", self.add_tokens)
+        app.router.add_get("/bucket/{bucket_id}/status", self.status)
+        self.app = app
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.url = f"http://127.0.0.1:{self.port}"
+
+    def _record(self, request, name):
+        self.calls[name] += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+
+    async def create_bucket(self, request):
+        self._record(request, "bucket")
+        payload = await request.json()
+        bucket_id = f"{payload['bucket_name']}_{payload['bucket_type']}"
+        self.tokens.setdefault(bucket_id, float(payload["capacity"]))
+        return web.json_response({"status": "created"})
+
+    async def get_tokens(self, request):
+        self._record(request, "get_tokens")
+        self.tokens[request.match_info["bucket_id"]] -= float(request.query["amount"])
+        return web.json_response({"status": "success"})
+
+    async def add_tokens(self, request):
+        self._record(request, "add_tokens")
+        self.tokens[request.match_info["bucket_id"]] += float(request.query["amount"])
+        return web.json_response({"status": "success"})
+
+    async def status(self, request):
+        self._record(request, "status")
+        return web.json_response({"tokens": self.tokens[request.match_info["bucket_id"]]})
+
+    def __enter__(self):
+        self.loop = asyncio.new_event_loop()
+        self.runner = web.AppRunner(self.app)
+        self.loop.run_until_complete(self.runner.setup())
+        site = web.TCPSite(self.runner, "127.0.0.1", self.port)
+        self.loop.run_until_complete(site.start())
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+@pytest.fixture
+def server():
+    with FakeBucketServer() as server:
+        yield server
+
+
+def make_client(server, **kwargs):
+    return TokenBucketClient(
+        bucket_name="test",
+        bucket_type="requests",
+        capacity=100,
+        refill_rate=10,
+        api_base_url=server.url,
+        **kwargs,
+    )
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_small_requests_are_served_from_a_lease(server):
+    client = make_client(server)
+    assert client.lease_size == 10
+
+    async def take():
+        for _ in range(25):
+            await client.get_tokens(1)
+        await client.close()
+
+    server.connections.clear()
+    run(take())
+    assert server.calls["get_tokens"] == 3
+    # Unused tokens went back when the client was closed
+    assert server.calls["add_tokens"] == 1
+    assert server.tokens["test_requests"] == 75
+    # Every request of the run went over the same connection
+    assert len(server.connections) == 1
+
+
+def test_leased_tokens_count_towards_tokens(server):
+    client = make_client(server)
+
+    async def take():
+        await client.get_tokens(4)
+
+    run(take())
+    assert server.tokens["test_requests"] == 90
+    assert client.tokens == 96
+
+
+def test_large_requests_bypass_the_lease(server):
+    client = make_client(server, lease_size=0)
+
+    async def take():
+        await client.get_tokens(1)
+        await client.get_tokens(1)
+        await client.release_leased_tokens()
+
+    run(take())
+    assert server.calls["get_tokens"] == 2
+    assert server.calls["add_tokens"] == 0
+    assert server.tokens["test_requests"] == 98
+
+
+def test_jobs_return_leases_and_close_sessions(server, monkeypatch):
+    from edsl import Cache, Model, QuestionFreeText
+    from edsl.buckets import BucketCollection
+
+    monkeypatch.setenv("EDSL_REMOTE_TOKEN_BUCKET_URL", server.url)
+    model = Model("test")
+    bucket_collection = BucketCollection.from_models([model])
+    clients = [bucket_collection[model].requests_bucket, bucket_collection[model].tokens_bucket]
+    assert all(isinstance(client, TokenBucketClient) for client in clients)
+    capacity = dict(server.tokens)
+
+    QuestionFreeText.example().by(model).run(
+        bucket_collection=bucket_collection,
+        cache=Cache(),
+        disable_remote_inference=True,
+        disable_remote_cache=True,
+        print_exceptions=False,
+    )
+
+    assert server.calls["get_tokens"] > 0
+    # Every leased token went back to the server
+    assert all(client._leased == 0 for client in clients)
+    requests_used = capacity["test_requests"] - server.tokens["test_requests"]
+    assert requests_used == 1
+    # And no session was left open
+    assert all(client._loop_states == {} for client in clients)
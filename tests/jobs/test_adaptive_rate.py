@@ -0,0 +1,107 @@
+import asyncio
+from collections import namedtuple
+
+import pytest
+
+from edsl.buckets import ModelBuckets, TokenBucket, RateLimitSignal
+from edsl.buckets.adaptive_rate import report_rate_limit
+from edsl.questions import QuestionFreeText
+from edsl.tasks import QuestionTaskCreator
+
+AnswerTuple = namedtuple("AnswerTuple", ["answer", "cache_used"])
+
+
+def make_buckets(rps=10, tps=1000):
+    return ModelBuckets(
+        TokenBucket(bucket_name="svc", bucket_type="requests", capacity=rps, refill_rate=rps),
+        TokenBucket(bucket_name="svc", bucket_type="tokens", capacity=tps, refill_rate=tps),
+    )
+
+
+def test_throttle_halves_rate_and_pauses():
+    buckets = make_buckets()
+    buckets.record_rate_limit(RateLimitSignal(throttled=True, retry_after=5))
+
+    assert buckets.requests_bucket.refill_rate == 5
+    assert buckets.tokens_bucket.refill_rate == 500
+    assert buckets.requests_bucket.tokens == 0
+    assert buckets.requests_bucket.wait_time(1) > 4.9
+
+
+def test_paused_bucket_holds_back_returned_tokens():
+    bucket = TokenBucket(bucket_name="svc", bucket_type="requests", capacity=10, refill_rate=10)
+    bucket.pause(5)
+    bucket.add_tokens(1)
+    assert bucket.tokens == 0
+
+    bucket.tokens = 1  # even a balance left over does not end the pause early
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            loop.run_until_complete(asyncio.wait_for(bucket.get_tokens(1), 0.2))
+    finally:
+        loop.close()
+    assert bucket.wait_time(1) > 4.5
+
+
+def test_throttles_during_a_pause_cut_the_rate_once():
+    buckets = make_buckets()
+    for _ in range(5):
+        buckets.record_rate_limit(RateLimitSignal(throttled=True, retry_after=5))
+    assert buckets.requests_bucket.refill_rate == 5
+
+
+def test_healthy_responses_recover_up_to_the_configured_rate():
+    buckets = make_buckets()
+    buckets.record_rate_limit(RateLimitSignal(throttled=True, retry_after=0))
+    for _ in range(100):
+        buckets.record_rate_limit(RateLimitSignal(throttled=False))
+    assert buckets.requests_bucket.refill_rate == 10
+    assert buckets.tokens_bucket.refill_rate == 1000
+
+
+def test_reported_limits_lower_the_ceiling():
+    buckets = make_buckets()
+    signal = RateLimitSignal.from_response(
+        {"x-ratelimit-limit-requests": "300", "x-ratelimit-remaining-requests": "200"},
+        200,
+    )
+    buckets.record_rate_limit(signal)
+    assert buckets.requests_bucket.refill_rate == 5  # 300 per minute
+    assert buckets.tokens_bucket.refill_rate == 1000
+
+
+def test_nearly_exhausted_budget_holds_the_rate():
+    buckets = make_buckets()
+    buckets.record_rate_limit(RateLimitSignal(throttled=True, retry_after=0))
+    buckets.record_rate_limit(
+        RateLimitSignal(throttled=False, remaining_requests=1, limit_requests=600)
+    )
+    assert buckets.requests_bucket.refill_rate == 5
+
+
+def test_infinity_buckets_are_left_alone():
+    buckets = ModelBuckets.infinity_bucket()
+    buckets.record_rate_limit(RateLimitSignal(throttled=True, retry_after=5))
+    assert buckets.requests_bucket.refill_rate == float("inf")
+    assert buckets.requests_bucket.wait_time(1) == 0
+
+
+@pytest.mark.asyncio
+async def test_reports_during_a_task_reach_its_buckets():
+    async def throttled_answer(question, task=None):
+        report_rate_limit({"retry-after": "0"}, 429)
+        return AnswerTuple(answer=None, cache_used=False)
+
+    buckets = make_buckets()
+    creator = QuestionTaskCreator(
+        question=QuestionFreeText.example(),
+        answer_question_func=throttled_answer,
+        model_buckets=buckets,
+    )
+    await creator._run_focal_task()
+    assert buckets.requests_bucket.refill_rate == 5
+
+    # Outside a task, reports go nowhere
+    report_rate_limit({"retry-after": "0"}, 429)
+    assert buckets.requests_bucket.refill_rate == 5
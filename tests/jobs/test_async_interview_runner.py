@@ -0,0 +1,94 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from edsl.jobs.async_interview_runner import AsyncInterviewRunner
+
+
+class FakeInterview:
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+        self.cache = None
+
+    async def async_conduct_interview(self, run_config):
+        await asyncio.sleep(self.delay)
+
+    def to_interview(self):
+        # stands in for its own InterviewDescriptor
+        return self
+
+
+def make_runner(interviews, max_concurrent):
+    jobs = MagicMock()
+    jobs.generate_interview_descriptors.return_value = interviews
+    run_config = MagicMock()
+    run_config.parameters.n = 1
+    run_config.parameters.stop_on_exception = False
+    runner = AsyncInterviewRunner(jobs, run_config)
+    runner.MAX_CONCURRENT = max_concurrent
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_slow_interview_does_not_block_free_slots(monkeypatch):
+    monkeypatch.setattr(
+        "edsl.jobs.async_interview_runner.Result.from_interview",
+        lambda interview: interview.name,
+    )
+    interviews = [FakeInterview("slow", 0.5)] + [
+        FakeInterview(f"fast{i}", 0.01) for i in range(5)
+    ]
+    runner = make_runner(interviews, max_concurrent=2)
+
+    completed = [(result, idx) async for result, _, idx in runner.run()]
+
+    # All fast interviews flow through the second slot while the slow one runs
+    assert [r for r, _ in completed] == [f"fast{i}" for i in range(5)] + ["slow"]
+    assert completed[-1][1] == 0
+    assert sorted(idx for _, idx in completed) == list(range(6))
+
+
+@pytest.mark.asyncio
+async def test_failed_interviews_are_skipped(monkeypatch):
+    monkeypatch.setattr(
+        "edsl.jobs.async_interview_runner.Result.from_interview",
+        lambda interview: interview.name,
+    )
+
+    class FailingInterview(FakeInterview):
+        async def async_conduct_interview(self, run_config):
+            raise ValueError("boom")
+
+    interviews = [FailingInterview("bad", 0), FakeInterview("good", 0)]
+    runner = make_runner(interviews, max_concurrent=1)
+
+    completed = [result async for result, _, _ in runner.run()]
+    assert completed == ["good"]
+
+
+@pytest.mark.asyncio
+async def test_interviews_are_built_when_started(monkeypatch):
+    monkeypatch.setattr(
+        "edsl.jobs.async_interview_runner.Result.from_interview",
+        lambda interview: interview.name,
+    )
+    built = []
+
+    class FakeDescriptor:
+        def __init__(self, name):
+            self.name = name
+
+        def to_interview(self):
+            built.append(self.name)
+            return FakeInterview(self.name, 0)
+
+    runner = make_runner([FakeDescriptor(f"i{i}") for i in range(4)], max_concurrent=1)
+
+    seen = []
+    async for result, _, _ in runner.run():
+        # Only the interview that just finished has been built so far
+        seen.append((result, list(built)))
+    assert seen[0] == ("i0", ["i0"])
+    assert built == ["i0", "i1", "i2", "i3"]
@@ -247,3 +247,101 @@ def test_prompt_cost_estimation_with_fallback_to_default_price():
     assert estimated_cost_dct["output_tokens"] == 2
     # Cost should be (2 * 0.000001) + (2 * 0.000001) = 0.000004
     assert estimated_cost_dct["cost_usd"] == pytest.approx(0.000004)
+
+
+def test_prompt_cost_estimation_uses_service_token_counter(monkeypatch):
+    from edsl.tokens import TokenCounter, register_token_counter
+    from edsl.tokens import token_counter
+
+    # Registrations made here are undone after the test
+    monkeypatch.setattr(token_counter, "_COUNTER_FACTORIES", dict(token_counter._COUNTER_FACTORIES))
+    monkeypatch.setattr(token_counter, "_counters", dict(token_counter._counters))
+
+    class WordCounter(TokenCounter):
+        name = "words"
+
+        def count(self, text, model=None):
+            return len(text.split())
+
+    register_token_counter("word_service", WordCounter)
+    estimated_cost_dct = JobsPrompts.estimate_prompt_cost(
+        system_prompt="Be brief.",
+        user_prompt="What is your favorite month?",
+        price_lookup={},
+        inference_service="word_service",
+        model="any",
+    )
+    assert estimated_cost_dct["input_tokens"] == 7
+    assert estimated_cost_dct["output_tokens"] == 6
+
+    # Literal double braces are not piping
+    estimated_cost_dct = JobsPrompts.estimate_prompt_cost(
+        system_prompt="",
+        user_prompt='Parse {"a": {"b": 1}}',
+        price_lookup={},
+        inference_service="word_service",
+        model="any",
+    )
+    assert estimated_cost_dct["input_tokens"] == 4
+
+
+class _WordEncoding:
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+
+def _stub_tiktoken(monkeypatch, get_encoding):
+    import sys
+    import types
+
+    def encoding_for_model(model):
+        if model == "gpt-4o":
+            return _WordEncoding()
+        raise KeyError(model)
+
+    tiktoken = types.ModuleType("tiktoken")
+    tiktoken.encoding_for_model = encoding_for_model
+    tiktoken.get_encoding = get_encoding
+    monkeypatch.setitem(sys.modules, "tiktoken", tiktoken)
+
+
+def test_tiktoken_counter(monkeypatch):
+    from edsl.tokens.token_counter import TiktokenCounter
+
+    def get_encoding(name):
+        raise ConnectionError("encoding download failed")
+
+    _stub_tiktoken(monkeypatch, get_encoding)
+    counter = TiktokenCounter()
+    assert counter.count("What is your favorite month?", model="gpt-4o") == 5
+    # Models tiktoken doesn't know use the default encoding, which couldn't be
+    # downloaded here, so the counter estimates instead
+    assert counter.count("What is your favorite month?", model="new-model") == 7.0
+
+
+def test_tiktoken_counter_default_encoding(monkeypatch):
+    from edsl.tokens.token_counter import TiktokenCounter
+
+    requested = []
+
+    def get_encoding(name):
+        requested.append(name)
+        return _WordEncoding()
+
+    _stub_tiktoken(monkeypatch, get_encoding)
+    counter = TiktokenCounter()
+    assert counter.count("three short words", model="new-model") == 3
+    assert requested == [TiktokenCounter.DEFAULT_ENCODING]
+
+
+def test_token_counts_are_memoized_least_recently_used_first_out(monkeypatch):
+    from collections import OrderedDict
+    from edsl.tokens import count_tokens, token_counter
+
+    monkeypatch.setattr(token_counter, "_MAX_MEMOIZED_COUNTS", 2)
+    monkeypatch.setattr(token_counter, "_memoized_counts", OrderedDict())
+    for text in ["first prompt", "second prompt", "first prompt", "third prompt"]:
+        count_tokens(text, inference_service="test")
+
+    memoized = [text for _, _, text in token_counter._memoized_counts]
+    assert memoized == ["first prompt", "third prompt"]
@@ -58,6 +58,96 @@ class TestLanguageModel(unittest.TestCase):
 
         self.assertEqual(len(example_cache), 1)
 
+    def test_concurrent_identical_calls_are_coalesced(self):
+        import asyncio
+        from edsl.caching import Cache
+
+        cache = Cache()
+        m = LanguageModel.example(test_model=True, canned_response="Hello, world!")
+        calls = []
+        original_call = m.async_execute_model_call
+
+        async def counting_call(*args, **kwargs):
+            calls.append(kwargs["user_prompt"])
+            await asyncio.sleep(0.05)
+            return await original_call(*args, **kwargs)
+
+        m.async_execute_model_call = counting_call
+
+        async def fan_out():
+            return await asyncio.gather(
+                *[
+                    m._async_get_intended_model_call_outcome(
+                        user_prompt="Hello world",
+                        system_prompt="You are a helpful agent",
+                        cache=cache,
+                    )
+                    for _ in range(5)
+                ]
+            )
+
+        outcomes = asyncio.run(fan_out())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([o.cache_used for o in outcomes].count(False), 1)
+        self.assertTrue(
+            all(o.response == outcomes[0].response for o in outcomes)
+        )
+        self.assertEqual(len(cache), 1)
+        self.assertFalse(
+            any(key[0] == id(cache) for key in LanguageModel._in_flight_calls)
+        )
+
+    def test_calls_abandoned_by_a_stopped_loop_are_not_awaited(self):
+        import asyncio
+        from edsl.caching import Cache
+
+        cache = Cache()
+        m = LanguageModel.example(test_model=True, canned_response="Hello, world!")
+        params = dict(user_prompt="Hello world", system_prompt="You are a helpful agent")
+        cache_key = m._get_intended_model_call_outcome(**params, cache=Cache()).cache_key
+        dead_loop = asyncio.new_event_loop()
+        LanguageModel._in_flight_calls[(id(cache), cache_key)] = dead_loop.create_future()
+        dead_loop.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            outcome = loop.run_until_complete(
+                m._async_get_intended_model_call_outcome(**params, cache=cache)
+            )
+        finally:
+            loop.close()
+        self.assertFalse(outcome.cache_used)
+        self.assertNotIn((id(cache), cache_key), LanguageModel._in_flight_calls)
+
+    def test_late_calls_leave_a_newer_in_flight_call_registered(self):
+        import asyncio
+        from edsl.caching import Cache
+
+        cache = Cache()
+        m = LanguageModel.example(test_model=True, canned_response="Hello, world!")
+        params = dict(user_prompt="Hello world", system_prompt="You are a helpful agent")
+        cache_key = m._get_intended_model_call_outcome(**params, cache=Cache()).cache_key
+        in_flight_key = (id(cache), cache_key)
+
+        loop = asyncio.new_event_loop()
+        newer = loop.create_future()
+        execute = m.async_execute_model_call
+
+        async def execute_and_get_overtaken(**kwargs):
+            # Another call registers itself while this one is still running
+            LanguageModel._in_flight_calls[in_flight_key] = newer
+            return await execute(**kwargs)
+
+        m.async_execute_model_call = execute_and_get_overtaken
+        try:
+            loop.run_until_complete(
+                m._async_get_intended_model_call_outcome(**params, cache=cache)
+            )
+            self.assertIs(LanguageModel._in_flight_calls[in_flight_key], newer)
+        finally:
+            LanguageModel._in_flight_calls.pop(in_flight_key, None)
+            loop.close()
+
     # def test_get_response(self):
     #     from edsl.caching.cache import Cache
 
@@ -85,3 +85,38 @@ def test_prompt_from_dict():
     p = Prompt("Hello, {{person}}")
     p2 = Prompt.from_dict(p.to_dict())
     assert repr(p2) == 'Prompt(text="""Hello, {{person}}""")'
+
+
+def test_prompt_render_matches_uncached_jinja():
+    from jinja2 import Environment
+    from edsl.prompts.prompt import PreserveUndefined
+
+    def reference_render(text, replacements):
+        env = Environment(undefined=PreserveUndefined)
+        env.globals["vars"] = None
+        for _ in range(100):
+            rendered = env.from_string(text).render(**replacements)
+            if rendered == text:
+                return rendered
+            text = rendered
+
+    cases = [
+        ("Plain text\n\n", {"x": 1}),
+        ("Line one\r\nLine {{ x }}\n", {"x": 2}),
+        ("Nested {{ a }}\n", {"a": "{{ b }}!", "b": "done"}),
+        ("Unknown {{ y }} stays", {"x": 1}),
+        ("{# comment #}Kept {x}", {"x": 1}),
+    ]
+    for text, replacements in cases:
+        assert Prompt(text).render(replacements).text == reference_render(
+            text, replacements
+        )
+
+
+def test_prompt_render_keeps_captured_variables_per_render():
+    p = Prompt("{% set x = n * 2 %}{{ vars.set('x', x) }}{{ x }}")
+    first = p.render({"n": 1})
+    second = p.render({"n": 5})
+    assert first.captured_variables == {"x": 2}
+    assert second.captured_variables == {"x": 10}
+    assert second.text == "10"
@@ -88,3 +88,50 @@ def test_validator_exception_to_throw():
 
 
 # Add more tests as needed to cover other aspects of the ResponseValidatorABC class
+
+
+def test_response_validator_is_memoized_until_parameters_change():
+    from edsl.questions import QuestionMultipleChoice, QuestionNumerical
+
+    q = QuestionMultipleChoice(
+        question_name="color", question_text="Color?", question_options=["red", "blue"]
+    )
+    validator = q.response_validator
+    assert q.response_validator is validator
+    assert q.response_validator.validate({"answer": "blue"})["answer"] == "blue"
+
+    q.question_options = ["red", "blue", "green"]
+    assert q.response_validator is not validator
+    assert q.response_validator.validate({"answer": "green"})["answer"] == "green"
+
+    n = QuestionNumerical.example()
+    strict = n.response_validator
+    n.permissive = True
+    assert n.response_validator is not strict
+    assert n.response_validator.validate({"answer": "120"})["answer"] == 120
+    assert "cached_validator" not in n.to_dict()
+
+
+def test_response_models_are_shared_by_equivalent_questions():
+    from edsl.questions import QuestionMultipleChoice
+
+    q1 = QuestionMultipleChoice(
+        question_name="a", question_text="A?", question_options=["x", "y"]
+    )
+    q2 = QuestionMultipleChoice(
+        question_name="b", question_text="B?", question_options=["x", "y"]
+    )
+    q3 = QuestionMultipleChoice(
+        question_name="c", question_text="C?", question_options=["x", "z"]
+    )
+    assert q1.response_model is q2.response_model
+    assert q1.response_model is not q3.response_model
+
+
+def test_cached_validator_retries_fix_on_every_use():
+    from edsl.questions import QuestionNumerical
+
+    q = QuestionNumerical.example()
+    for _ in range(2):
+        # each validation gets its own fix attempt
+        assert q.response_validator.validate({"answer": "42 apples"})["answer"] == 42
@@ -108,6 +108,16 @@ class TestResults(unittest.TestCase):
         """)
         self.assertEqual(len(f3), ok_count + great_count)
 
+    def test_filter_matches_per_row_evaluation(self):
+        r = self.example_results
+        expression = "agent.status == 'Joyful' and how_feeling in ['OK', 'Great']"
+        expected = [
+            result
+            for result in r.data
+            if Results._create_evaluator(result).eval(expression)
+        ]
+        self.assertEqual(list(r.filter(expression).data), expected)
+
     def test_relevant_columns(self):
         self.assertIn("answer.how_feeling", self.example_results.relevant_columns())
 
@@ -147,6 +157,45 @@ class TestResults(unittest.TestCase):
             [result.answer.get("how_feeling") for result in self.example_results.data],
         )
 
+    def test_fetch_list_columns_follow_inserts(self):
+        r = Results(survey=self.example_results.survey, data=[])
+        self.assertEqual(r._fetch_list("answer", "how_feeling"), [])
+        items = []
+        for order, result in zip([2, 0, 3, 1], self.example_results.data):
+            item = result.copy()
+            item.order = order
+            items.append(item)
+        r.insert_sorted(items[0])
+        r.insert_sorted(items[1])
+        r.insert_sorted(items[2], defer_sort=True)
+        self.assertEqual(
+            r._fetch_list("answer", "how_feeling"),
+            [x.answer["how_feeling"] for x in r.data],
+        )
+        r.insert_sorted(items[3])
+        r.append(items[0].copy())
+        expected = [x.answer["how_feeling"] for x in r.data]
+        self.assertEqual(r._fetch_list("answer", "how_feeling"), expected)
+        self.assertEqual(r.select("how_feeling").to_dicts(remove_prefix=True), [{"how_feeling": v} for v in expected])
+
+        # Returned lists are copies, so callers cannot corrupt the cached column
+        r._fetch_list("answer", "how_feeling").clear()
+        self.assertEqual(r._fetch_list("answer", "how_feeling"), expected)
+
+        del r[0]
+        self.assertEqual(r._fetch_list("answer", "how_feeling"), expected[1:])
+
+    def test_order_by(self):
+        r = self.example_results
+        ordered = r.order_by("how_feeling", "period")
+        keys = [(x.answer["how_feeling"], x.scenario["period"]) for x in ordered]
+        self.assertEqual(keys, sorted(keys))
+        reversed_ = r.order_by("how_feeling", reverse=True)
+        self.assertEqual(
+            reversed_.select("how_feeling").to_list(),
+            sorted(r.select("how_feeling").to_list(), reverse=True),
+        )
+
     def test_shuffle(self):
         # Just check that no exceptions are thrown
         shuffled = self.example_results.shuffle()
@@ -209,6 +258,37 @@ class TestResults(unittest.TestCase):
                 rows = list(reader)
                 assert len(rows) == len(self.example_results) + 1
 
+    def test_insert_sorted_keeps_order(self):
+        template = self.example_results[0]
+        r = Results(survey=self.example_results.survey, data=[])
+        for order in [3, 0, 4, 1, 2]:
+            item = template.copy()
+            item.order = order
+            r.insert_sorted(item)
+        self.assertEqual([x.order for x in r], [0, 1, 2, 3, 4])
+
+        # Replacing an item invalidates the cached sort keys
+        replacement = template.copy()
+        replacement.order = 10
+        r[0] = replacement
+        item = template.copy()
+        item.order = 5
+        r.insert_sorted(item)
+        self.assertEqual([x.order for x in r], [10, 1, 2, 3, 4, 5])
+
+    def test_insert_sorted_deferred(self):
+        template = self.example_results[0]
+        r = Results(survey=self.example_results.survey, data=[])
+        for order in [2, 0, 1]:
+            item = template.copy()
+            item.order = order
+            r.insert_sorted(item, defer_sort=True)
+        # A regular insert sorts the pending items first
+        item = template.copy()
+        item.order = 1.5
+        r.insert_sorted(item)
+        self.assertEqual([x.order for x in r], [0, 1, 1.5, 2])
+
     def test_to_disk_and_from_disk(self):
         """Test saving and loading Results to/from disk."""
         import tempfile
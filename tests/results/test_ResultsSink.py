@@ -0,0 +1,86 @@
+import pytest
+
+from edsl.results import Results
+from edsl.results.exceptions import ResultsError
+from edsl.results.results_sink import (
+    JSONLResultsSink,
+    SQLiteResultsSink,
+    open_results_sink,
+    read_interview_hashes,
+    read_results_sink,
+)
+
+
+def write_example(path, orders):
+    r = Results.example()
+    with open_results_sink(path) as sink:
+        for order, result in zip(orders, r):
+            result.order = order
+            sink.write(result)
+    return sink
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "ndjson", "db", "sqlite"])
+def test_rows_come_back_in_job_order(tmp_path, extension):
+    path = tmp_path / f"results.{extension}"
+    write_example(path, [3, 1, 2, 0])
+    assert [r.order for r in read_results_sink(path)] == [0, 1, 2, 3]
+    loaded = Results.from_sink(str(path), survey=Results.example().survey)
+    assert len(loaded) == 4
+    assert loaded.select("how_feeling").to_list() == ["OK", "Great", "Terrible", "OK"]
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "db"])
+def test_appending_sink_iterates_its_own_rows(tmp_path, extension):
+    path = tmp_path / f"results.{extension}"
+    write_example(path, [0, 1])
+    sink = write_example(path, [2, 3])
+    assert [r.order for r in sink] == [2, 3]
+    assert [r.order for r in read_results_sink(path)] == [0, 1, 2, 3]
+
+
+def test_jsonl_skips_line_cut_short(tmp_path):
+    path = tmp_path / "results.jsonl"
+    write_example(path, [0, 1])
+    with open(path, "ab") as f:
+        f.write(b'{"answer": {"how_feel')
+    assert [r.order for r in read_results_sink(path)] == [0, 1]
+
+    # A sink reopened after the interruption starts on a fresh line
+    sink = write_example(path, [2])
+    assert isinstance(sink, JSONLResultsSink)
+    assert [r.order for r in read_results_sink(path)] == [0, 1, 2]
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "db"])
+def test_interview_hashes(tmp_path, extension):
+    path = tmp_path / f"results.{extension}"
+    r = Results.example()
+    with open_results_sink(path) as sink:
+        for i, result in enumerate(r):
+            result.interview_hash = 1000 + i
+            sink.write(result)
+    assert read_interview_hashes(path) == {1000, 1001, 1002, 1003}
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "db"])
+def test_missing_checkpoint_is_empty(tmp_path, extension):
+    path = tmp_path / f"results.{extension}"
+    assert read_interview_hashes(path) == set()
+    assert list(read_results_sink(path)) == []
+    assert not path.exists()
+
+
+def test_database_without_results_table_is_empty(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "results.db"
+    sqlite3.connect(path).close()
+    assert read_interview_hashes(path) == set()
+    assert list(read_results_sink(path)) == []
+
+
+def test_extension_picks_format(tmp_path):
+    assert isinstance(open_results_sink(tmp_path / "r.db"), SQLiteResultsSink)
+    with pytest.raises(ResultsError):
+        open_results_sink(tmp_path / "r.csv")
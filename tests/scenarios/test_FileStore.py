@@ -180,5 +180,24 @@ class TestScenario(unittest.TestCase):
 #         assert pulled_fs.suffix == fs.suffix
 
 
+
+def test_image_dimensions_are_decoded_once(monkeypatch):
+    PIL = pytest.importorskip("PIL.Image")
+    opened = []
+    open_image = PIL.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args)
+        return open_image(*args, **kwargs)
+
+    monkeypatch.setattr(PIL, "open", counting_open)
+    fs = FileStore.example("png")
+    same_image = FileStore.from_dict(fs.to_dict())
+
+    assert fs.get_image_dimensions() == same_image.get_image_dimensions()
+    assert fs.get_image_dimensions() == fs.get_image_dimensions()
+    assert len(opened) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -32,6 +32,16 @@ class TestScenario(unittest.TestCase):
         result = s.rename({"food": "food_preference"})
         self.assertEqual(result, Scenario({"food_preference": "wood chips"}))
 
+    def test_hash_follows_content_changes(self):
+        from edsl.utilities.utilities import dict_hash
+
+        s = Scenario({"food": "wood chips", "tags": ["a"]})
+        self.assertEqual(hash(s), dict_hash(s.to_dict(add_edsl_version=False)))
+        s["food"] = "bark"
+        self.assertEqual(hash(s), hash(Scenario({"food": "bark", "tags": ["a"]})))
+        s["tags"].append("b")
+        self.assertEqual(hash(s), dict_hash(s.to_dict(add_edsl_version=False)))
+
     @patch('requests.get')
     def test_from_url(self, mock_get):
         # Arrange
@@ -26,6 +26,16 @@ def test_filter():
     assert filtered == expected
 
 
+def test_filter_copies_matching_scenarios():
+    s = ScenarioList([Scenario({"a": i, "b": i % 3}) for i in range(10)])
+    filtered = s.filter("b == 1 and a > 1")
+    assert [x["a"] for x in filtered] == [4, 7]
+    filtered[0]["a"] = 100
+    assert s[4]["a"] == 4
+    with pytest.raises(Exception, match="does not exist"):
+        s.filter("c == 1")
+
+
 def test_from_csv():
     with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".csv") as f:
         _ = f.write("name,age,location\nAlice,30,New York\nBob,25,Los Angeles\n")
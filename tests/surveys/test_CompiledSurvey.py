@@ -0,0 +1,88 @@
+import copy
+import unittest
+
+from edsl.questions import QuestionFreeText, QuestionMultipleChoice
+from edsl.surveys import Survey
+from edsl.surveys.base import EndOfSurvey
+from edsl.surveys.compiled_survey import CompiledSurvey
+
+
+def make_survey():
+    q0 = QuestionMultipleChoice(
+        question_name="q0", question_text="Do you like school?", question_options=["yes", "no"]
+    )
+    q1 = QuestionFreeText(question_name="q1", question_text="Why not?")
+    q2 = QuestionFreeText(question_name="q2", question_text="Why? You said {{ q0.answer }}")
+    q3 = QuestionFreeText(question_name="q3", question_text="Anything else?")
+    return (
+        Survey([q0, q1, q2, q3])
+        .add_rule(q0, "{{ q0.answer }} == 'yes'", q2)
+        .add_rule(q2, "{{ q2.answer }} == 'done'", EndOfSurvey)
+        .add_skip_rule(q3, "{{ q0.answer }} == 'no'")
+        .add_targeted_memory(q3, q1)
+    )
+
+
+class TestCompiledSurvey(unittest.TestCase):
+    def test_matches_survey(self):
+        s = make_survey()
+        cs = CompiledSurvey(s)
+        self.assertEqual(dict(cs.question_name_to_index), s.question_name_to_index)
+        self.assertEqual(dict(cs.dag), dict(s.dag(textify=True)))
+        self.assertEqual(cs.parents["q0"], ())
+        order = cs.topological_order
+        for child, parents in cs.dag.items():
+            for parent in parents:
+                self.assertLess(order.index(parent), order.index(child))
+
+    def test_rules_match_rule_collection(self):
+        s = make_survey()
+        cs = CompiledSurvey(s)
+        for answers in [
+            {"q0.answer": "yes", "q2.answer": "done"},
+            {"q0.answer": "no", "q2.answer": "more"},
+            {"q0.answer": "yes", "q2.answer": "more"},
+        ]:
+            for q_now in range(len(s)):
+                self.assertEqual(
+                    cs.next_question(q_now, answers),
+                    s.rule_collection.next_question(q_now, answers),
+                )
+                self.assertEqual(
+                    cs.skip_question_before_running(q_now, {"q0": "no"}),
+                    s.rule_collection.skip_question_before_running(q_now, {"q0": "no"}),
+                )
+
+    def test_memory_fragments_match_memory_plan(self):
+        s = make_survey()
+        cs = CompiledSurvey(s)
+        answers = {"q1": "Homework"}
+        for name in s.question_names:
+            self.assertEqual(
+                cs.memory_plan.get_memory_prompt_fragment(name, answers).text,
+                s.memory_plan.get_memory_prompt_fragment(name, answers).text,
+            )
+        self.assertEqual(cs.memory_plan.to_dict(), s.memory_plan.to_dict())
+        with self.assertRaises(ValueError):
+            cs.memory_plan.get_memory_prompt_fragment("missing", answers)
+
+    def test_immutable_and_shared_by_copies(self):
+        cs = CompiledSurvey(make_survey())
+        with self.assertRaises(AttributeError):
+            cs.dag = {}
+        with self.assertRaises(TypeError):
+            cs.question_name_to_index["q9"] = 9
+        self.assertIs(copy.deepcopy(cs), cs)
+
+    def test_interviews_share_compiled_survey(self):
+        from edsl.jobs import Jobs
+
+        interviews = list(Jobs.example().generate_interviews())
+        self.assertGreater(len(interviews), 1)
+        compiled = {id(i.compiled_survey) for i in interviews}
+        self.assertEqual(len(compiled), 1)
+        self.assertIs(interviews[0].to_index, interviews[0].compiled_survey.question_name_to_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
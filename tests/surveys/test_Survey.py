@@ -285,6 +285,41 @@ class TestSurvey(unittest.TestCase):
         )
 
 
+    def test_clone_shares_untouched_questions(self):
+        s = self.gen_survey().add_skip_rule("manual", "{{ like_school.answer }} == 'no'")
+        drawn = s.questions[1].draw()
+        s2 = s.clone(questions={"favorite_subject": drawn})
+
+        self.assertIs(s2.questions[0], s.questions[0])
+        self.assertIs(s2.questions[1], drawn)
+        self.assertEqual(s2.rule_collection, s.rule_collection)
+
+        s2.add_question(
+            QuestionMultipleChoice(
+                question_text="Extra?", question_options=["a", "b"], question_name="extra"
+            )
+        )
+        s2.add_targeted_memory("extra", "like_school")
+        self.assertEqual(len(s.questions), 3)
+        self.assertEqual(len(s.rule_collection), 4)
+        self.assertNotIn("extra", s.memory_plan)
+        self.assertNotIn("extra", s.memory_plan.survey_question_names)
+        self.assertEqual(Survey.from_dict(s2.to_dict()), s2)
+
+    def test_draw_only_copies_randomized_questions(self):
+        s = Survey(
+            questions=self.gen_survey().questions,
+            questions_to_randomize=["favorite_subject"],
+        )
+        drawn = s.draw()
+        self.assertIs(drawn.questions[0], s.questions[0])
+        self.assertIsNot(drawn.questions[1], s.questions[1])
+        self.assertEqual(
+            sorted(drawn.questions[1].question_options),
+            sorted(s.questions[1].question_options),
+        )
+        self.assertEqual(s.questions[1].question_options, ["math", "science", "english", "history"])
+
 
 if __name__ == "__main__":
     unittest.main()